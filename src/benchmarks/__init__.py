@@ -0,0 +1,8 @@
+"""
+Benchmarks for GuildQuest. Run from the src directory:
+
+    python -m benchmarks                  core/utils and serialization suite, results written as JSON
+    python -m benchmarks.gametime_bench   tick-based vs. legacy GameTime at 1M instances
+    python -m benchmarks.item_memory_bench  fresh items vs. shared catalog items at 100k entries
+    python -m benchmarks.model_memory_bench  synthetic guild with 1M quests, legacy vs. slotted models
+"""
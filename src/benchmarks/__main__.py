@@ -0,0 +1,124 @@
+"""
+Runs the core and storage benchmark suites and writes the results as JSON.
+
+Run from src:
+    python -m benchmarks [-o results.json] [--repeat N] [--compare old.json] [names...]
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import sys
+import timeit
+
+from benchmarks.core_bench import BENCHMARKS as CORE_BENCHMARKS
+from benchmarks.storage_bench import BENCHMARKS as STORAGE_BENCHMARKS
+
+BENCHMARKS = {**CORE_BENCHMARKS, **STORAGE_BENCHMARKS}
+
+# Slowdown (new / old) reported as a regression by --compare
+REGRESSION_THRESHOLD = 1.10
+
+
+def _autorange_number(timer: timeit.Timer, target: float = 0.05) -> int:
+    """
+    Picks a loop count so one repeat takes at least `target` seconds
+    """
+    number = 1
+    while True:
+        if timer.timeit(number) >= target:
+            return number
+        number *= 2
+
+
+def run_suite(names: list[str], repeat: int) -> dict:
+    """
+    Runs the selected benchmarks
+
+    Args:
+        names (list[str]): Benchmarks to run
+        repeat (int): Repeats per benchmark; the best one is reported
+
+    Returns:
+        dict: Results keyed by benchmark name
+    """
+    results = {}
+    for name in names:
+        setup, ops = BENCHMARKS[name]
+        timer = timeit.Timer(setup())
+        number = _autorange_number(timer)
+        times = timer.repeat(repeat=repeat, number=number)
+        best = min(times) / number
+        results[name] = {
+            'best_s': best,
+            'mean_s': sum(times) / len(times) / number,
+            'per_op_ns': best / ops * 1e9,
+            'ops_per_call': ops,
+            'number': number,
+            'repeat': repeat,
+        }
+        print(f"{name:<28}{best * 1e3:>12.3f} ms{best / ops * 1e9:>14.1f} ns/op")
+    return results
+
+
+def compare(results: dict, baseline_path: str) -> int:
+    """
+    Prints each benchmark's change against a previous results file
+
+    Args:
+        results (dict): Current results
+        baseline_path (str): Path to a previous JSON run
+
+    Returns:
+        int: Number of regressions beyond REGRESSION_THRESHOLD
+    """
+    with open(baseline_path) as f:
+        baseline = json.load(f)['results']
+
+    regressions = 0
+    print(f"\nCompared to {baseline_path}:")
+    for name, r in results.items():
+        if name not in baseline:
+            continue
+        ratio = r['best_s'] / baseline[name]['best_s']
+        flag = ""
+        if ratio > REGRESSION_THRESHOLD:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{name:<28}{ratio:>8.2f}x{flag}")
+    return regressions
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="GuildQuest core benchmarks")
+    parser.add_argument('names', nargs='*', help="benchmarks to run (default: all)")
+    parser.add_argument('-o', '--output', default='bench_results.json', help="JSON file to write")
+    parser.add_argument('--repeat', type=int, default=5, help="repeats per benchmark")
+    parser.add_argument('--compare', help="previous JSON results to compare against")
+    args = parser.parse_args(argv)
+
+    unknown = [n for n in args.names if n not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    results = run_suite(args.names or list(BENCHMARKS), args.repeat)
+
+    report = {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {args.output}")
+
+    if args.compare:
+        return 1 if compare(results, args.compare) else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
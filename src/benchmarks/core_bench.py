@@ -0,0 +1,128 @@
+"""
+Benchmarks for the hot paths in core and utils: GameTime construction and
+formatting, to_total_minutes, WorldClock.advance, realm-time conversion,
+and quest sorting/filtering the way QuestScreen does it.
+
+Each benchmark is a setup function that builds its data and returns the
+callable to time, so setup cost never shows up in the results.
+"""
+
+import random
+from typing import Callable
+
+from core import GameTime, WorldClock
+from models import Campaign, Realm
+from utils import convert_to_realm_time, convert_ticks_to_realm, to_tick_buffer
+
+# Quest count for the sorting/filtering benchmarks
+QUEST_COUNT = 10_000
+
+
+def _random_parts(n: int, seed: int = 1) -> list[tuple[int, int, int, int]]:
+    rng = random.Random(seed)
+    return [(rng.randrange(3650), rng.randrange(24), rng.randrange(60), rng.randrange(60)) for _ in range(n)]
+
+
+def _realm(time_rule: int = 120) -> Realm:
+    return Realm(name="Bench Realm", map_id=99, time_rule=time_rule, selected_user=None)
+
+
+def _campaign(n: int = QUEST_COUNT) -> Campaign:
+    realm = _realm()
+    campaign = Campaign("Bench", True, GameTime(), realm, "day")
+    for i, (d, h, m, s) in enumerate(_random_parts(n, seed=2)):
+        campaign.create_quest(f"Quest {i}", GameTime(d % 365, h, m, s), realm)
+    return campaign
+
+
+def bench_gametime_construct() -> Callable[[], object]:
+    parts = _random_parts(1000)
+    return lambda: [GameTime(d, h, m, s) for d, h, m, s in parts]
+
+
+def bench_gametime_from_ticks() -> Callable[[], object]:
+    ticks = [GameTime(*p).ticks for p in _random_parts(1000)]
+    from_ticks = GameTime.from_ticks
+    return lambda: [from_ticks(t) for t in ticks]
+
+
+def bench_gametime_format() -> Callable[[], object]:
+    parts = _random_parts(1000)
+    # Fresh instances every run so the lazy cache is always cold
+    return lambda: [GameTime(d, h, m, s).get_fulltime() for d, h, m, s in parts]
+
+
+def bench_gametime_format_cached() -> Callable[[], object]:
+    times = [GameTime(*p) for p in _random_parts(1000)]
+    for t in times:
+        t.get_fulltime()
+    return lambda: [t.get_fulltime() for t in times]
+
+
+def bench_to_total_minutes() -> Callable[[], object]:
+    times = [GameTime(*p) for p in _random_parts(1000)]
+    return lambda: [t.to_total_minutes() for t in times]
+
+
+def bench_worldclock_advance_large() -> Callable[[], object]:
+    clock = WorldClock()
+
+    def run():
+        for _ in range(1000):
+            clock.advance(days=36500, hours=23, minutes=59)
+    return run
+
+
+def bench_convert_to_realm_time() -> Callable[[], object]:
+    times = [GameTime(*p) for p in _random_parts(1000)]
+    realm = _realm()
+
+    def run():
+        # Change the rule each run so the realm cache is exercised cold
+        realm.change_time_rule(-realm.time_rule)
+        return [convert_to_realm_time(t, realm) for t in times]
+    return run
+
+
+def bench_convert_ticks_batch() -> Callable[[], object]:
+    ticks = to_tick_buffer(GameTime(*p) for p in _random_parts(1000))
+    realm = _realm(-180)
+    return lambda: convert_ticks_to_realm(ticks, realm)
+
+
+def bench_quest_sort_legacy() -> Callable[[], object]:
+    quests = _campaign().quests
+    return lambda: sorted(quests, key=lambda q: q.time.to_total_minutes())
+
+
+def bench_quest_timeline() -> Callable[[], object]:
+    campaign = _campaign()
+    return lambda: campaign.get_timeline()
+
+
+def bench_quest_filter_week() -> Callable[[], object]:
+    campaign = _campaign()
+    return lambda: campaign.quests_in_days(100, 106)
+
+
+def bench_quest_filter_week_scan() -> Callable[[], object]:
+    quests = _campaign().quests
+    return lambda: [q for q in sorted(quests, key=lambda q: q.time.to_total_minutes())
+                    if 100 <= q.time.get_day() <= 106]
+
+
+# name -> (setup, operations per call)
+BENCHMARKS: dict[str, tuple[Callable[[], Callable[[], object]], int]] = {
+    'gametime_construct': (bench_gametime_construct, 1000),
+    'gametime_from_ticks': (bench_gametime_from_ticks, 1000),
+    'gametime_format': (bench_gametime_format, 1000),
+    'gametime_format_cached': (bench_gametime_format_cached, 1000),
+    'to_total_minutes': (bench_to_total_minutes, 1000),
+    'worldclock_advance_large': (bench_worldclock_advance_large, 1000),
+    'convert_to_realm_time': (bench_convert_to_realm_time, 1000),
+    'convert_ticks_batch': (bench_convert_ticks_batch, 1000),
+    'quest_sort_legacy': (bench_quest_sort_legacy, 1),
+    'quest_timeline': (bench_quest_timeline, 1),
+    'quest_filter_week': (bench_quest_filter_week, 1),
+    'quest_filter_week_scan': (bench_quest_filter_week_scan, 1),
+}
@@ -0,0 +1,108 @@
+"""
+Compares the tick-based GameTime against the previous four-field GameTime
+at 1M instances: memory, construction time and sort/compare time.
+
+Run from src:  python -m benchmarks.gametime_bench [count]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from core import GameTime
+
+
+class LegacyGameTime:
+    """
+    The pre-tick GameTime layout: four int attributes plus an eagerly built
+    display string, no __slots__, compared through to_total_minutes().
+    """
+    def __init__(self, current_day=0, current_hour=0, current_minute=0, current_seconds=0):
+        self.current_day = current_day
+        self.current_hour = current_hour
+        self.current_minute = current_minute
+        self.current_seconds = current_seconds
+        self.full_time = f"Day {current_day}, {current_hour:02d}:{current_minute:02d}:{current_seconds:02d}"
+
+    def to_total_minutes(self):
+        return (self.current_day * 24 * 60) + (self.current_hour * 60) + self.current_minute
+
+
+def _build(cls, parts):
+    return [cls(d, h, m, s) for d, h, m, s in parts]
+
+
+def _measure_memory(cls, parts) -> int:
+    """
+    Returns peak bytes allocated while building the list of instances
+    """
+    tracemalloc.start()
+    objs = _build(cls, parts)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objs
+    return peak
+
+
+def _time(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run(count: int = 1_000_000) -> dict:
+    """
+    Runs the comparison and returns the raw numbers
+
+    Args:
+        count (int): Number of instances to build. Defaults to 1M.
+
+    Returns:
+        dict: Results keyed by metric, each with 'legacy' and 'ticks' values
+    """
+    rng = random.Random(42)
+    parts = [(rng.randrange(3650), rng.randrange(24), rng.randrange(60), rng.randrange(60))
+             for _ in range(count)]
+
+    results = {
+        'memory_bytes': {
+            'legacy': _measure_memory(LegacyGameTime, parts),
+            'ticks': _measure_memory(GameTime, parts),
+        },
+        'construct_s': {
+            'legacy': _time(lambda: _build(LegacyGameTime, parts)),
+            'ticks': _time(lambda: _build(GameTime, parts)),
+        },
+    }
+
+    legacy = _build(LegacyGameTime, parts)
+    ticks = _build(GameTime, parts)
+    results['sort_s'] = {
+        'legacy': _time(lambda: sorted(legacy, key=lambda t: t.to_total_minutes())),
+        'ticks': _time(lambda: sorted(ticks, key=GameTime.sort_key)),
+    }
+    results['compare_s'] = {
+        'legacy': _time(lambda: [a.to_total_minutes() < b.to_total_minutes()
+                                 for a, b in zip(legacy, legacy[1:])]),
+        'ticks': _time(lambda: [a < b for a, b in zip(ticks, ticks[1:])]),
+    }
+    return results
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    results = run(count)
+
+    print(f"GameTime benchmark ({count:,} instances)")
+    print(f"{'metric':<16}{'legacy':>14}{'ticks':>14}{'ratio':>8}")
+    for metric, r in results.items():
+        ratio = r['legacy'] / r['ticks'] if r['ticks'] else float('inf')
+        if metric == 'memory_bytes':
+            print(f"{metric:<16}{r['legacy'] / 2**20:>12.1f}MB{r['ticks'] / 2**20:>12.1f}MB{ratio:>7.2f}x")
+        else:
+            print(f"{metric:<16}{r['legacy']:>13.3f}s{r['ticks']:>13.3f}s{ratio:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Compares memory for inventory entries held as fresh mutable items (one
+object and its own strings per entry, as the add-item dialog used to make
+them) against shared catalog definitions held by an Inventory.
+
+Run from src:  python -m benchmarks.item_memory_bench [entries] [distinct]
+"""
+
+import random
+import sys
+import tracemalloc
+from dataclasses import dataclass
+
+from models import Inventory, ItemCatalog
+
+RARITIES = ["Common", "Uncommon", "Rare", "Epic", "Legendary"]
+
+
+@dataclass
+class LegacyItem:
+    """
+    The pre-catalog Item: a mutable dataclass with a __dict__
+    """
+    name: str
+    rarity: str
+    damage: int
+    description: str
+
+
+def _specs(entries: int, distinct: int) -> list[tuple[int, int]]:
+    rng = random.Random(7)
+    return [(rng.randrange(distinct), rng.randrange(len(RARITIES))) for _ in range(entries)]
+
+
+def _legacy(specs) -> list:
+    # Built per entry, so every item gets its own string objects like text typed into the dialog
+    return [LegacyItem(f"Item {n}", "".join(RARITIES[r]), n % 300, f"Description of item {n}")
+            for n, r in specs]
+
+
+def _catalog_list(specs) -> list:
+    # Shared definitions, but still one list slot per entry
+    catalog = ItemCatalog()
+    return [catalog.get(f"Item {n}", "".join(RARITIES[r]), n % 300, f"Description of item {n}")
+            for n, r in specs]
+
+
+def _catalog(specs) -> Inventory:
+    catalog = ItemCatalog()
+    inventory = Inventory()
+    for n, r in specs:
+        inventory.add_inventory(catalog.get(f"Item {n}", "".join(RARITIES[r]), n % 300, f"Description of item {n}"))
+    return inventory
+
+
+def _measure(build, specs) -> int:
+    """
+    Returns bytes still allocated once the structure is built
+    """
+    tracemalloc.start()
+    held = build(specs)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return current
+
+
+def run(entries: int = 100_000, distinct: int = 500) -> dict:
+    """
+    Runs the comparison and returns the raw numbers
+
+    Args:
+        entries (int): Inventory entries to hold. Defaults to 100k.
+        distinct (int): Distinct item names among them. Defaults to 500.
+
+    Returns:
+        dict: Bytes held by 'legacy', 'catalog_list' and 'catalog' (stacked in an Inventory)
+    """
+    specs = _specs(entries, distinct)
+    return {
+        'legacy': _measure(_legacy, specs),
+        'catalog_list': _measure(_catalog_list, specs),
+        'catalog': _measure(_catalog, specs),
+    }
+
+
+def main() -> None:
+    entries = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    r = run(entries, distinct)
+
+    print(f"Item memory benchmark ({entries:,} entries, {distinct:,} distinct names)")
+    for name, held in r.items():
+        print(f"{name:<14}{held / 2**20:>10.1f}MB{r['legacy'] / held:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
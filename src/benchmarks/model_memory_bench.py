@@ -0,0 +1,136 @@
+"""
+Loads a synthetic guild (users, characters, realms, campaigns and 1M
+quests) and reports the memory it holds, against the same guild built
+from the previous quest layout: a dataclass with a __dict__ and three
+empty lists allocated on every quest.
+
+Run from src:  python -m benchmarks.model_memory_bench [quests] [campaigns]
+"""
+
+import random
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from core import GameTime
+from models import Campaign, Character, Quest_Event, Realm, User, User_Settings, default_catalog
+
+CLASSES = ["Warrior", "Mage", "Rogue", "Cleric", "Ranger"]
+RARITIES = ["Common", "Uncommon", "Rare", "Epic", "Legendary"]
+
+# Share of quests that carry participants or items
+DETAILED_SHARE = 0.05
+
+
+@dataclass
+class LegacyQuest:
+    """
+    The pre-slots Quest_Event layout
+    """
+    name: str
+    c_realm: Realm
+    time: GameTime
+    end: Optional[GameTime] = None
+    partaking_users: List[Character] = field(default_factory=list)
+    reward_items: List = field(default_factory=list)
+    required_items: List = field(default_factory=list)
+    quest_id: Optional[int] = None
+    db_id: Optional[int] = None
+
+
+def _legacy_detail(quest, character, item) -> None:
+    quest.partaking_users.append(character)
+    quest.reward_items.append(item)
+
+
+def _lean_detail(quest, character, item) -> None:
+    quest.add_participant(character)
+    quest.add_reward_item(item)
+
+
+def build_guild(quest_cls, add_detail, quests: int, campaigns: int) -> list[User]:
+    """
+    Builds a guild of users owning campaigns that hold `quests` quests in total
+
+    Args:
+        quest_cls (type): Quest class to instantiate
+        add_detail (Callable): Adds a participant and a reward to a quest
+        quests (int): Total number of quests
+        campaigns (int): Number of campaigns to spread them over
+
+    Returns:
+        list[User]: The guild's users
+    """
+    rng = random.Random(11)
+    users = [User(f"user{n}", 0, User_Settings()) for n in range(max(1, campaigns // 10))]
+    realms = [Realm(f"Realm {n}", n, n * 60, users[0]) for n in range(3)]
+    for user in users:
+        for n in range(3):
+            # Class names arrive as fresh strings, as they do from a form or a file
+            character = Character(f"{user.username} hero {n}", "".join(rng.choice(CLASSES)), rng.randrange(100))
+            for _ in range(5):
+                r = rng.randrange(len(RARITIES))
+                character.curr_inventory.add_inventory(
+                    default_catalog.get(f"Item {rng.randrange(200)}", RARITIES[r], r * 10))
+            user.characters.append(character)
+
+    per_campaign = quests // campaigns
+    for c in range(campaigns):
+        owner = users[c % len(users)]
+        batch = []
+        for q in range(per_campaign):
+            start = rng.randrange(3650 * 86400)
+            quest = quest_cls(f"Quest {q}", realms[q % 3], GameTime.from_ticks(start),
+                              GameTime.from_ticks(start + 3600) if q % 2 else None)
+            if rng.random() < DETAILED_SHARE:
+                character = owner.characters[q % len(owner.characters)]
+                add_detail(quest, character, character.curr_inventory.stacks()[0][0])
+            batch.append(quest)
+        owner.campaigns.append(Campaign(f"Campaign {c}", True, GameTime(), realms[c % 3], "All", batch))
+    return users
+
+
+def _measure(quest_cls, add_detail, quests: int, campaigns: int) -> int:
+    """
+    Returns bytes still allocated once the guild is built
+    """
+    tracemalloc.start()
+    guild = build_guild(quest_cls, add_detail, quests, campaigns)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del guild
+    return current
+
+
+def run(quests: int = 1_000_000, campaigns: int = 100) -> dict:
+    """
+    Runs the comparison and returns the raw numbers
+
+    Args:
+        quests (int): Quests in the guild. Defaults to 1M.
+        campaigns (int): Campaigns they are spread over. Defaults to 100.
+
+    Returns:
+        dict: Bytes held by the 'legacy' and 'slotted' guilds
+    """
+    return {
+        'legacy': _measure(LegacyQuest, _legacy_detail, quests, campaigns),
+        'slotted': _measure(Quest_Event, _lean_detail, quests, campaigns),
+    }
+
+
+def main() -> None:
+    quests = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    campaigns = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    r = run(quests, campaigns)
+
+    print(f"Model memory benchmark ({quests:,} quests in {campaigns:,} campaigns)")
+    print(f"{'layout':<10}{'held':>12}{'per quest':>12}")
+    for name, held in r.items():
+        print(f"{name:<10}{held / 2**20:>10.1f}MB{held / quests:>11.0f}B")
+    print(f"{'ratio':<10}{r['legacy'] / r['slotted']:>11.2f}x")
+
+
+if __name__ == '__main__':
+    main()
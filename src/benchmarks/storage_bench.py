@@ -0,0 +1,49 @@
+"""
+Serialization throughput for the binary format in storage.binary_format,
+with pickle as a baseline, on one user owning a campaign of QUEST_COUNT
+quests.
+"""
+
+import pickle
+from typing import Callable
+
+from benchmarks.core_bench import QUEST_COUNT, _campaign
+from models import User, User_Settings
+from storage.binary_format import dumps, loads
+
+
+def _user() -> User:
+    user = User("bench", 0, User_Settings())
+    campaign = _campaign()
+    campaign.add_edit_user(user)
+    user.campaigns.append(campaign)
+    return user
+
+
+def bench_binary_dumps() -> Callable[[], object]:
+    users = [_user()]
+    return lambda: dumps(users)
+
+
+def bench_binary_loads() -> Callable[[], object]:
+    data = dumps([_user()])
+    return lambda: loads(data)
+
+
+def bench_pickle_dumps() -> Callable[[], object]:
+    users = [_user()]
+    return lambda: pickle.dumps(users, pickle.HIGHEST_PROTOCOL)
+
+
+def bench_pickle_loads() -> Callable[[], object]:
+    data = pickle.dumps([_user()], pickle.HIGHEST_PROTOCOL)
+    return lambda: pickle.loads(data)
+
+
+# name -> (setup, operations per call); one operation is one quest
+BENCHMARKS: dict[str, tuple[Callable[[], Callable[[], object]], int]] = {
+    'binary_dumps': (bench_binary_dumps, QUEST_COUNT),
+    'binary_loads': (bench_binary_loads, QUEST_COUNT),
+    'pickle_dumps': (bench_pickle_dumps, QUEST_COUNT),
+    'pickle_loads': (bench_pickle_loads, QUEST_COUNT),
+}
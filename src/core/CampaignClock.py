@@ -0,0 +1,67 @@
+import time
+from typing import Callable
+
+from .GameTime import GameTime
+from .RealTimeClock import RealTimeClock
+
+
+class CampaignClock(RealTimeClock):
+    """
+    A campaign's own clock, with its own rate, pause state and offset.
+
+    Campaign clocks share one monotonic source (normally the world clock's)
+    and never need a timer of their own: reading "now" is O(1) arithmetic
+    against the source, however many campaigns are running.
+    """
+    def __init__(self, start: GameTime = None, rate: float = 1.0, source: Callable[[], int] = time.monotonic_ns):
+        """
+        Args:
+            start (GameTime, optional): Campaign time the clock starts at. Defaults to Day 0, 00:00:00.
+            rate (float, optional): Game minutes per real second while running. Defaults to 1.0.
+            source (Callable[[], int], optional): Shared monotonic nanosecond source. Defaults to time.monotonic_ns.
+        """
+        super().__init__(start.ticks if start is not None else 0, rate, source)
+        self._time_cache = start if start is not None else GameTime(0, 0, 0, 0)
+
+    def get_ticks(self) -> int:
+        """
+        Returns the campaign's current tick count
+
+        Returns:
+            int: Current ticks
+        """
+        return self.now_ticks()
+
+    def get_current_time(self) -> GameTime:
+        """
+        Returns the campaign's current time
+
+        Returns:
+            GameTime: Current campaign time
+        """
+        ticks = self.now_ticks()
+        if self._time_cache.ticks != ticks:
+            self._time_cache = GameTime.from_ticks(ticks)
+        return self._time_cache
+
+    def set_time(self, game_time: GameTime) -> None:
+        """
+        Sets the campaign's current time, keeping its rate and pause state
+
+        Args:
+            game_time (GameTime): New campaign time
+        """
+        self._time_cache = game_time
+        self.set_ticks(game_time.ticks)
+
+    def get_offset(self, world_ticks: int) -> int:
+        """
+        Returns how far this campaign's clock is ahead of a world tick count
+
+        Args:
+            world_ticks (int): World clock ticks to compare against
+
+        Returns:
+            int: Campaign ticks minus world ticks
+        """
+        return self.now_ticks() - world_ticks
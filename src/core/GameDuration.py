@@ -0,0 +1,197 @@
+from .GameTime import GameTime, SECONDS_PER_DAY, SECONDS_PER_HOUR, SECONDS_PER_MINUTE
+
+
+class GameDuration:
+    """
+    Immutable span of game time, stored as a signed integer tick count
+    (game seconds). Adds to and subtracts from GameTime without going
+    through day/hour/minute fields. Attributes cannot be set after
+    construction, since hashing relies on the tick count never changing.
+    """
+    __slots__ = ('_ticks',)
+
+    def __init__(self, days: int = 0, hours: int = 0, minutes: int = 0, seconds: int = 0):
+        _set_ticks(self, days * SECONDS_PER_DAY + hours * SECONDS_PER_HOUR
+                   + minutes * SECONDS_PER_MINUTE + seconds)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"GameDuration is immutable; cannot set {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"GameDuration is immutable; cannot delete {name!r}")
+
+    def __reduce__(self):
+        # Copies and pickles rebuild from the tick count instead of setting slots
+        return (GameDuration.from_ticks, (self._ticks,))
+
+    @staticmethod
+    def parts_to_ticks(days: int = 0, hours: int = 0, minutes: int = 0, seconds: int = 0) -> int:
+        """
+        Normalizes a day/hour/minute/second offset to ticks without building
+        a GameDuration. Out-of-range parts (e.g. 90 minutes) are fine.
+
+        Returns:
+            int: Offset in ticks
+        """
+        return days * SECONDS_PER_DAY + hours * SECONDS_PER_HOUR + minutes * SECONDS_PER_MINUTE + seconds
+
+    @classmethod
+    def from_ticks(cls, ticks: int) -> 'GameDuration':
+        """
+        Builds a GameDuration directly from a tick count
+
+        Args:
+            ticks (int): Length in game seconds
+
+        Returns:
+            GameDuration: Duration of the given length
+        """
+        d = object.__new__(cls)
+        _set_ticks(d, ticks)
+        return d
+
+    @property
+    def ticks(self) -> int:
+        return self._ticks
+
+    def get_days(self) -> int:
+        """
+        Returns the whole days in the duration
+
+        Returns:
+            int: Days
+        """
+        return abs(self._ticks) // SECONDS_PER_DAY
+
+    def get_hours(self) -> int:
+        """
+        Returns the hours left over after whole days
+
+        Returns:
+            int: Hours (0-23)
+        """
+        return abs(self._ticks) % SECONDS_PER_DAY // SECONDS_PER_HOUR
+
+    def get_minutes(self) -> int:
+        """
+        Returns the minutes left over after whole hours
+
+        Returns:
+            int: Minutes (0-59)
+        """
+        return abs(self._ticks) % SECONDS_PER_HOUR // SECONDS_PER_MINUTE
+
+    def get_seconds(self) -> int:
+        """
+        Returns the seconds left over after whole minutes
+
+        Returns:
+            int: Seconds (0-59)
+        """
+        return abs(self._ticks) % SECONDS_PER_MINUTE
+
+    def total_minutes(self) -> int:
+        """
+        Returns the whole duration in minutes, truncated toward zero
+
+        Returns:
+            int: Total minutes
+        """
+        # Integer division on the magnitude: float division loses precision on large counts
+        minutes = abs(self._ticks) // SECONDS_PER_MINUTE
+        return -minutes if self._ticks < 0 else minutes
+
+    def is_positive(self) -> bool:
+        """
+        Returns whether the duration is longer than zero
+
+        Returns:
+            bool: True if the duration is positive
+        """
+        return self._ticks > 0
+
+    def get_fulltime(self) -> str:
+        """
+        Returns the duration formatted like "2d 03:04:05" (with a leading "-" if negative)
+
+        Returns:
+            str: Formatted duration
+        """
+        sign = "-" if self._ticks < 0 else ""
+        return f"{sign}{self.get_days()}d {self.get_hours():02d}:{self.get_minutes():02d}:{self.get_seconds():02d}"
+
+    # Arithmetic stays on integer ticks; GameTime + GameDuration lands in
+    # __radd__ since GameTime does not define __add__
+
+    def __add__(self, other):
+        if isinstance(other, GameDuration):
+            return GameDuration.from_ticks(self._ticks + other._ticks)
+        if isinstance(other, GameTime):
+            return GameTime.from_ticks(other.ticks + self._ticks)
+        return NotImplemented
+
+    def __radd__(self, other):
+        if isinstance(other, GameTime):
+            return GameTime.from_ticks(other.ticks + self._ticks)
+        return NotImplemented
+
+    def __sub__(self, other):
+        if isinstance(other, GameDuration):
+            return GameDuration.from_ticks(self._ticks - other._ticks)
+        return NotImplemented
+
+    def __rsub__(self, other):
+        if isinstance(other, GameTime):
+            return GameTime.from_ticks(other.ticks - self._ticks)
+        return NotImplemented
+
+    def __mul__(self, factor: int):
+        if isinstance(factor, int):
+            return GameDuration.from_ticks(self._ticks * factor)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> 'GameDuration':
+        return GameDuration.from_ticks(-self._ticks)
+
+    def __abs__(self) -> 'GameDuration':
+        return GameDuration.from_ticks(abs(self._ticks))
+
+    def __bool__(self) -> bool:
+        return self._ticks != 0
+
+    def __hash__(self) -> int:
+        return hash(('GameDuration', self._ticks))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, GameDuration):
+            return self._ticks == other._ticks
+        return NotImplemented
+
+    def __lt__(self, other: 'GameDuration') -> bool:
+        if isinstance(other, GameDuration):
+            return self._ticks < other._ticks
+        return NotImplemented
+
+    def __le__(self, other: 'GameDuration') -> bool:
+        if isinstance(other, GameDuration):
+            return self._ticks <= other._ticks
+        return NotImplemented
+
+    def __gt__(self, other: 'GameDuration') -> bool:
+        if isinstance(other, GameDuration):
+            return self._ticks > other._ticks
+        return NotImplemented
+
+    def __ge__(self, other: 'GameDuration') -> bool:
+        if isinstance(other, GameDuration):
+            return self._ticks >= other._ticks
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"GameDuration({self.get_fulltime()!r})"
+
+
+# Slot setter that bypasses the blocking __setattr__, for construction only
+_set_ticks = GameDuration.__dict__['_ticks'].__set__
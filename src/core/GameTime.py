@@ -1,16 +1,84 @@
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .WorldClock import WorldClock # Fixes circular dependency
 
 
+# One tick is one game second
+SECONDS_PER_MINUTE = 60
+SECONDS_PER_HOUR = 60 * SECONDS_PER_MINUTE
+SECONDS_PER_DAY = 24 * SECONDS_PER_HOUR
+
+
 class GameTime:
+    """
+    Immutable point in game time, stored as a single integer tick count
+    (seconds since Day 0, 00:00:00). Attributes cannot be set after
+    construction, since sort_key, hashing and the cached formatted date
+    all rely on the tick count never changing.
+    """
+    __slots__ = ('_ticks', '_full_time')
+
+    # C-level sort key, much faster than sorting on __lt__ or a lambda
+    sort_key = attrgetter('_ticks')
+
     def __init__(self, current_day: int = 0, current_hour: int = 0, current_minute: int = 0, current_seconds: int = 0):
-        self.current_day = current_day
-        self.current_hour = current_hour
-        self.current_minute = current_minute
-        self.current_seconds = current_seconds
-        self.full_time = self._format_time()
+        _set_ticks(self, current_day * SECONDS_PER_DAY + current_hour * SECONDS_PER_HOUR
+                   + current_minute * SECONDS_PER_MINUTE + current_seconds)
+        _set_full_time(self, None)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"GameTime is immutable; cannot set {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"GameTime is immutable; cannot delete {name!r}")
+
+    def __reduce__(self):
+        # Copies and pickles rebuild from the tick count instead of setting slots
+        return (GameTime.from_ticks, (self._ticks,))
+
+    @classmethod
+    def from_ticks(cls, ticks: int) -> 'GameTime':
+        """
+        Builds a GameTime directly from a tick count, skipping the
+        day/hour/minute arithmetic in __init__.
+
+        Args:
+            ticks (int): Seconds since Day 0, 00:00:00
+
+        Returns:
+            GameTime: GameTime at the given tick
+        """
+        t = object.__new__(cls)
+        _set_ticks(t, ticks)
+        _set_full_time(t, None)
+        return t
+
+    @classmethod
+    def from_fulltime(cls, text: str) -> 'GameTime':
+        """
+        Parses a formatted date string such as "Day 3, 04:05:00", the inverse
+        of get_fulltime().
+
+        Args:
+            text (str): Full formatted date
+
+        Raises:
+            ValueError: If the string is not in the "Day D, HH:MM:SS" format
+
+        Returns:
+            GameTime: Parsed GameTime
+        """
+        try:
+            day_part, clock_part = text.split(",")
+            label, day = day_part.split()
+            hour, minute, seconds = clock_part.split(":")
+            if label != "Day":
+                raise ValueError
+            return cls(int(day), int(hour), int(minute), int(seconds))
+        except ValueError:
+            raise ValueError(f"Invalid game time string: {text!r}") from None
 
     def _format_time(self) -> str:
         """
@@ -19,7 +87,39 @@ class GameTime:
         Returns:
             str: Full formatted date as a string.
         """
-        return f"Day {self.current_day}, {self.current_hour:02d}:{self.current_minute:02d}:{self.current_seconds:02d}"
+        day, rem = divmod(self._ticks, SECONDS_PER_DAY)
+        hour, rem = divmod(rem, SECONDS_PER_HOUR)
+        minute, seconds = divmod(rem, SECONDS_PER_MINUTE)
+        return f"Day {day}, {hour:02d}:{minute:02d}:{seconds:02d}"
+
+    # Read-only views of the tick count, kept for existing callers
+
+    @property
+    def ticks(self) -> int:
+        return self._ticks
+
+    @property
+    def current_day(self) -> int:
+        return self._ticks // SECONDS_PER_DAY
+
+    @property
+    def current_hour(self) -> int:
+        return self._ticks % SECONDS_PER_DAY // SECONDS_PER_HOUR
+
+    @property
+    def current_minute(self) -> int:
+        return self._ticks % SECONDS_PER_HOUR // SECONDS_PER_MINUTE
+
+    @property
+    def current_seconds(self) -> int:
+        return self._ticks % SECONDS_PER_MINUTE
+
+    @property
+    def full_time(self) -> str:
+        # Formatted on first use and cached; the tick count never changes
+        if self._full_time is None:
+            _set_full_time(self, self._format_time())
+        return self._full_time
 
     def start_time(self, c: 'WorldClock') -> None:
         """
@@ -46,7 +146,7 @@ class GameTime:
         Returns:
             int: current day
         """
-        return self.current_day
+        return self._ticks // SECONDS_PER_DAY
 
     def get_hour(self) -> int:
         """
@@ -55,7 +155,7 @@ class GameTime:
         Returns:
             int: current hour
         """
-        return self.current_hour
+        return self._ticks % SECONDS_PER_DAY // SECONDS_PER_HOUR
 
     def get_minute(self) -> int:
         """
@@ -64,7 +164,7 @@ class GameTime:
         Returns:
             int: current minute
         """
-        return self.current_minute
+        return self._ticks % SECONDS_PER_HOUR // SECONDS_PER_MINUTE
 
     def get_seconds(self) -> int:
         """
@@ -73,7 +173,7 @@ class GameTime:
         Returns:
             int: current seconds
         """
-        return self.current_seconds
+        return self._ticks % SECONDS_PER_MINUTE
 
     def get_fulltime(self) -> str:
         """
@@ -92,4 +192,69 @@ class GameTime:
         Returns:
             int: Total minutes
         """
-        return (self.current_day * 24 * 60) + (self.current_hour * 60) + self.current_minute
+        return self._ticks // SECONDS_PER_MINUTE
+
+    def to_ticks(self) -> int:
+        """
+        Returns the total seconds since Day 0, 00:00:00.
+
+        Returns:
+            int: Total ticks
+        """
+        return self._ticks
+
+    # Hashing and total ordering compare tick counts directly so sorting
+    # GameTimes needs no key function
+
+    def __hash__(self) -> int:
+        return hash(self._ticks)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, GameTime):
+            return self._ticks == other._ticks
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        if isinstance(other, GameTime):
+            return self._ticks != other._ticks
+        return NotImplemented
+
+    def __lt__(self, other: 'GameTime') -> bool:
+        if isinstance(other, GameTime):
+            return self._ticks < other._ticks
+        return NotImplemented
+
+    def __le__(self, other: 'GameTime') -> bool:
+        if isinstance(other, GameTime):
+            return self._ticks <= other._ticks
+        return NotImplemented
+
+    def __gt__(self, other: 'GameTime') -> bool:
+        if isinstance(other, GameTime):
+            return self._ticks > other._ticks
+        return NotImplemented
+
+    def __ge__(self, other: 'GameTime') -> bool:
+        if isinstance(other, GameTime):
+            return self._ticks >= other._ticks
+        return NotImplemented
+
+    def __sub__(self, other):
+        # GameTime - GameTime is a GameDuration; GameTime - GameDuration is
+        # handled by GameDuration.__rsub__
+        if isinstance(other, GameTime):
+            return GameDuration.from_ticks(self._ticks - other._ticks)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"GameTime({self.full_time!r})"
+
+
+# Slot setters that bypass the blocking __setattr__, for construction and the
+# formatted-date cache only
+_set_ticks = GameTime.__dict__['_ticks'].__set__
+_set_full_time = GameTime.__dict__['_full_time'].__set__
+
+
+# Imported last: GameDuration needs GameTime defined first
+from .GameDuration import GameDuration
@@ -0,0 +1,259 @@
+import heapq
+from itertools import count
+from typing import Any, Callable, Optional
+
+from .GameTime import GameTime
+
+
+class QuestScheduler:
+    """
+    Priority queue of upcoming quest start/end instants across all campaigns.
+    The WorldClock drives it: every time the clock moves forward, each
+    instant that was crossed is popped in time order and handed to the
+    registered callbacks. Each fired event costs O(log n). Moving the
+    clock backwards re-arms every instant from the new time on, so quests
+    fire again when the clock crosses them a second time.
+
+    A campaign whose quests are not loaded yet is scheduled as one load
+    instant at its first quest instant still ahead. When the clock gets
+    there, or the quests load for any other reason, the campaign reports
+    back through on_quests_loaded() and its quests are scheduled one by one.
+    """
+    QUEST_START = 'start'
+    QUEST_END = 'end'
+    # Internal instant that loads a campaign's quests; never passed to listeners
+    _LOAD = 'load'
+
+    def __init__(self, now: int = 0):
+        self._heap: list[list] = []
+        self._counter = count()  # tie-breaker so equal ticks fire in schedule order
+        self._entries: dict[int, list[list]] = {}  # id(quest) -> its live heap entries
+        self._quests: dict[int, tuple] = {}  # id(quest) -> (quest, campaign) for every scheduled quest
+        self._waiting: dict[int, Any] = {}  # id(campaign) -> scheduled campaign whose quests are not loaded
+        self._cancelled = 0
+        self._listeners: list[Callable[[str, Any, Any, GameTime], None]] = []
+        self.now = now
+
+    def add_listener(self, callback: Callable[[str, Any, Any, GameTime], None]) -> None:
+        """
+        Registers a callback fired as callback(kind, quest, campaign, when)
+
+        Args:
+            callback (Callable): Function to call for each crossed instant
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[str, Any, Any, GameTime], None]) -> None:
+        """
+        Unregisters a previously added callback
+
+        Args:
+            callback (Callable): Function to remove
+        """
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def __len__(self) -> int:
+        # Pending instants, with one per campaign waiting for its quests to load
+        return len(self._heap) - self._cancelled
+
+    def _push(self, ticks: int, kind: str, quest, campaign) -> None:
+        """
+        Pushes one instant onto the heap, ignoring instants that already
+        passed. An instant at the current tick stays pending and fires on
+        the next run_until, so a quest created to start "now" still starts.
+        A load instant passes the campaign as quest.
+        """
+        if ticks < self.now:
+            return
+        entry = [ticks, next(self._counter), kind, quest, campaign]
+        self._entries.setdefault(id(quest), []).append(entry)
+        heapq.heappush(self._heap, entry)
+
+    def _cancel(self, key: int) -> None:
+        """
+        Marks the live entries pushed under id(quest) dead. They are dropped
+        lazily when they reach the top of the heap.
+        """
+        for entry in self._entries.pop(key, ()):
+            entry[3] = None
+            self._cancelled += 1
+
+        # Compact once dead entries outnumber live ones
+        if self._cancelled > 64 and self._cancelled * 2 > len(self._heap):
+            self._heap = [e for e in self._heap if e[3] is not None]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def schedule_quest(self, quest, campaign=None) -> None:
+        """
+        Schedules a quest's start (and end, if it has one). Re-scheduling a
+        quest replaces its previous instants.
+
+        Args:
+            quest (Quest_Event): Quest to schedule
+            campaign (Campaign, optional): Campaign the quest belongs to. Defaults to None.
+        """
+        self.unschedule_quest(quest)
+        self._quests[id(quest)] = (quest, campaign)
+        self._arm(quest, campaign)
+
+    def _arm(self, quest, campaign) -> None:
+        """
+        Pushes a quest's start and end instants that are still ahead
+        """
+        self._push(quest.time.ticks, self.QUEST_START, quest, campaign)
+
+        if quest.end is not None:
+            self._push(quest.end.ticks, self.QUEST_END, quest, campaign)
+
+    def unschedule_quest(self, quest) -> None:
+        """
+        Cancels any pending instants for a quest. Entries are marked dead and
+        dropped lazily when they reach the top of the heap.
+
+        Args:
+            quest (Quest_Event): Quest to unschedule
+        """
+        self._quests.pop(id(quest), None)
+        self._cancel(id(quest))
+
+    def schedule_campaign(self, campaign) -> None:
+        """
+        Schedules every quest in a campaign. The quests of a campaign that
+        has not loaded them yet stay unloaded until the clock reaches the
+        first of their instants.
+
+        Args:
+            campaign (Campaign): Campaign whose quests to schedule
+        """
+        if campaign.is_loaded():
+            for quest in campaign.quests:
+                self.schedule_quest(quest, campaign)
+            return
+
+        self._waiting[id(campaign)] = campaign
+        campaign._scheduler = self
+        self._arm_load(campaign)
+
+    def _arm_load(self, campaign) -> None:
+        """
+        Pushes the load instant of a waiting campaign, or loads it straight
+        away if one of its instants may be ahead but not which
+        """
+        if not campaign.get_quest_count():
+            return
+        span = campaign.quest_span()
+        if span is not None:
+            first, last = span
+            if last < self.now:
+                return
+            if first >= self.now:
+                self._push(first, self._LOAD, campaign, campaign)
+                return
+        # Loading reports back through on_quests_loaded
+        campaign.quests
+
+    def on_quests_loaded(self, campaign) -> None:
+        """
+        Schedules the quests of a waiting campaign once they are loaded.
+        Called by Campaign.
+
+        Args:
+            campaign (Campaign): Campaign whose quests just loaded
+        """
+        if self._waiting.pop(id(campaign), None) is None:
+            return
+        campaign._scheduler = None
+        self._cancel(id(campaign))
+        for quest in campaign.quests:
+            self.schedule_quest(quest, campaign)
+
+    def unschedule_campaign(self, campaign) -> None:
+        """
+        Cancels every pending instant for a campaign's quests
+
+        Args:
+            campaign (Campaign): Campaign whose quests to unschedule
+        """
+        if self._waiting.pop(id(campaign), None) is not None:
+            campaign._scheduler = None
+            self._cancel(id(campaign))
+        elif campaign.is_loaded():
+            for quest in campaign.quests:
+                self.unschedule_quest(quest)
+
+    def run_until(self, ticks: int) -> int:
+        """
+        Fires, in time order, every pending instant at or before the given tick.
+        Moving backwards fires nothing and re-arms the instants from the new tick on.
+
+        Args:
+            ticks (int): New current tick
+
+        Returns:
+            int: Number of events fired
+        """
+        if ticks < self.now:
+            self._rewind(ticks)
+            return 0
+
+        heap = self._heap
+        fired = 0
+
+        while heap and heap[0][0] <= ticks:
+            entry = heapq.heappop(heap)
+            when, _, kind, quest, campaign = entry
+            if quest is None:
+                self._cancelled -= 1
+                continue
+
+            live = self._entries[id(quest)]
+            live.remove(entry)
+            if not live:
+                del self._entries[id(quest)]
+
+            # Listeners see the instant as the current time while they run
+            self.now = when
+            if kind is self._LOAD:
+                # Pushes the campaign's quest instants from now on, which this loop then fires
+                campaign.quests
+                continue
+            fired_at = GameTime.from_ticks(when)
+            for callback in list(self._listeners):
+                callback(kind, quest, campaign, fired_at)
+            fired += 1
+
+        self.now = ticks
+        return fired
+
+    def _rewind(self, ticks: int) -> None:
+        """
+        Rebuilds the heap from every scheduled quest after a backwards jump,
+        so instants that already fired, or were skipped because they lay
+        behind the clock when scheduled, are pending again
+
+        Args:
+            ticks (int): New current tick
+        """
+        self._heap = []
+        self._entries = {}
+        self._cancelled = 0
+        self.now = ticks
+        for quest, campaign in self._quests.values():
+            self._arm(quest, campaign)
+        for campaign in list(self._waiting.values()):
+            self._arm_load(campaign)
+
+    def next_event_time(self) -> Optional[GameTime]:
+        """
+        Returns the time of the next pending instant
+
+        Returns:
+            Optional[GameTime]: Earliest pending instant, or None if nothing is scheduled
+        """
+        heap = self._heap
+        while heap and heap[0][3] is None:
+            heapq.heappop(heap)
+            self._cancelled -= 1
+        return GameTime.from_ticks(heap[0][0]) if heap else None
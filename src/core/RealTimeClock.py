@@ -0,0 +1,135 @@
+import time
+from fractions import Fraction
+from typing import Callable
+
+from .GameTime import SECONDS_PER_MINUTE
+
+NS_PER_SECOND = 1_000_000_000
+
+
+class RealTimeClock:
+    """
+    Integer tick counter that can run against a monotonic nanosecond source.
+
+    While running, ticks are derived from the source relative to an anchor
+    point rather than accumulated, so they never drift no matter how often
+    or how irregularly they are read. The sub-tick remainder is carried
+    across pause/resume and rate changes. Reading the time is O(1) integer
+    arithmetic, so any number of clocks can share one source without a
+    timer each.
+    """
+    def __init__(self, ticks: int = 0, rate: float = 1.0, source: Callable[[], int] = time.monotonic_ns):
+        """
+        Args:
+            ticks (int, optional): Starting tick count. Defaults to 0.
+            rate (float, optional): Game minutes per real second while running. Defaults to 1.0.
+            source (Callable[[], int], optional): Monotonic nanosecond source. Defaults to time.monotonic_ns.
+        """
+        self.source = source
+        self.is_running = False
+        self._ticks = ticks
+
+        # Anchor: ticks = anchor_ticks + ((now - anchor_ns) * rate_num + carry) // rate_den
+        self._anchor_ns = 0
+        self._anchor_ticks = ticks
+        self._carry = 0
+        self._rate_num = 0
+        self._rate_den = 1
+        self.rate = 0.0
+        self.set_rate(rate)
+
+    def _elapsed_units(self) -> int:
+        """
+        Real time since the anchor in rate units (tick * rate_den), including
+        the sub-tick remainder carried over from the last pause or rate change
+        """
+        return (self.source() - self._anchor_ns) * self._rate_num + self._carry
+
+    def now_ticks(self) -> int:
+        """
+        Computes the current tick count from the source
+
+        Returns:
+            int: Current ticks
+        """
+        if not self.is_running:
+            return self._ticks
+        return self._anchor_ticks + self._elapsed_units() // self._rate_den
+
+    def _move_to(self, ticks: int) -> None:
+        """
+        Internal helper to record a new tick count; subclasses hook in here
+        """
+        self._ticks = ticks
+
+    def start(self) -> None:
+        """
+        Starts the clock by setting is_running to True and anchoring it to the source
+        """
+        if self.is_running:
+            return
+        self._anchor_ns = self.source()
+        self._anchor_ticks = self._ticks
+        self.is_running = True
+
+    def stop(self) -> None:
+        """
+        Stops the clock by setting is_running to False. The sub-tick
+        remainder is kept so pause/resume cycles do not lose time.
+        """
+        if not self.is_running:
+            return
+        whole, self._carry = divmod(self._elapsed_units(), self._rate_den)
+        self.is_running = False
+        self._move_to(self._anchor_ticks + whole)
+
+    def set_rate(self, rate: float) -> None:
+        """
+        Sets how fast the clock runs. Changing the rate while running takes
+        effect from now without a jump.
+
+        Args:
+            rate (float): Game minutes per real second
+
+        Raises:
+            ValueError: If rate is negative
+        """
+        if rate < 0:
+            raise ValueError("Clock rate cannot be negative")
+
+        running = self.is_running
+        if running:
+            self.stop()
+
+        # Exact integer ratio of ticks per real nanosecond
+        ratio = Fraction(rate * SECONDS_PER_MINUTE).limit_denominator(1_000_000) / NS_PER_SECOND
+        new_den = ratio.denominator
+        self._carry = self._carry * new_den // self._rate_den
+        self._rate_num = ratio.numerator
+        self._rate_den = new_den
+        self.rate = rate
+
+        if running:
+            self.start()
+
+    def set_ticks(self, ticks: int) -> None:
+        """
+        Jumps the clock to a tick count, keeping its rate and pause state
+
+        Args:
+            ticks (int): New tick count
+        """
+        # Shift the anchor so a running clock carries on from the new time
+        self._anchor_ticks += ticks - self.now_ticks()
+        self._move_to(ticks)
+
+    def shift(self, offset: int) -> None:
+        """
+        Moves the clock by a number of ticks without disturbing a running anchor
+
+        Args:
+            offset (int): Ticks to add (may be negative)
+        """
+        ticks = self.now_ticks() + offset
+        self._anchor_ticks += offset
+        self._move_to(ticks)
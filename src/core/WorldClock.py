@@ -1,29 +1,66 @@
+import time
+from typing import Callable
+
 from .GameTime import GameTime
+from .GameDuration import GameDuration
+from .QuestScheduler import QuestScheduler
+from .RealTimeClock import RealTimeClock
 
 """
 Created under my assumptions for how world_clock works in interaction with Game_Time
 """
 
-class WorldClock:
+
+class WorldClock(RealTimeClock):
     """
     World clock for an entire campaign.
+
+    In real-time mode the clock only moves when tick() is called (from the
+    Tk after() loop), so quest events fire on the GUI thread. It keeps an
+    integer tick count; a GameTime is built only when someone asks for it.
     """
-    def __init__(self):
-        self.is_running = False
+    def __init__(self, rate: float = 1.0, source: Callable[[], int] = time.monotonic_ns):
+        """
+        Args:
+            rate (float, optional): Game minutes per real second while running. Defaults to 1.0.
+            source (Callable[[], int], optional): Monotonic nanosecond source, shared with campaign clocks. Defaults to time.monotonic_ns.
+        """
+        # quest start/end instants fired as the clock moves forward
+        self.scheduler = QuestScheduler(0)
         # init the world clock to start at the literal beginning of time of a campaign
-        self.current_time = GameTime(0, 0, 0, 0)
+        self._time_cache = GameTime(0, 0, 0, 0)
+        super().__init__(0, rate, source)
+
+    @property
+    def current_time(self) -> GameTime:
+        return self.get_current_time()
 
-    def start(self) -> None:
+    def tick(self) -> bool:
         """
-        Starts the world clock by setting is_running to True
+        Brings the clock up to date with real time. Meant to be called from a
+        Tk after() loop; costs a few integer operations and allocates nothing
+        unless the tick count changed.
+
+        Returns:
+            bool: True if the tick count changed
         """
-        self.is_running = True
+        if not self.is_running:
+            return False
+        ticks = self.now_ticks()
+        if ticks == self._ticks:
+            return False
+        self._move_to(ticks)
+        return True
 
-    def stop(self) -> None:
+    def _move_to(self, ticks: int) -> None:
         """
-        Stops the world clock by setting is_running to False
+        Internal helper to move the tick count and fire any crossed quest events
+
+        Args:
+            ticks (int): New tick count
         """
-        self.is_running = False
+        self._ticks = ticks
+        self.scheduler.run_until(ticks)
 
     def set_time(self, game_time: GameTime) -> None:
         """
@@ -32,7 +69,8 @@ class WorldClock:
         Args:
             game_time (Game_Time): Game_Time obj to set current_time to
         """
-        self.current_time = game_time
+        self._time_cache = game_time
+        self.set_ticks(game_time.ticks)
 
     def get_current_time(self) -> GameTime:
         """
@@ -41,9 +79,21 @@ class WorldClock:
         Returns:
             GameTime: GameTime object of the current time
         """
-        return self.current_time
+        # Only materialize a new GameTime when the tick count has moved
+        if self._time_cache.ticks != self._ticks:
+            self._time_cache = GameTime.from_ticks(self._ticks)
+        return self._time_cache
 
-    def advance(self, days: int = 0, hours: int = 0, minutes: int = 0) -> None:
+    def get_ticks(self) -> int:
+        """
+        Getter method for the current tick count, without building a GameTime
+
+        Returns:
+            int: Current ticks
+        """
+        return self._ticks
+
+    def advance(self, days: int = 0, hours: int = 0, minutes: int = 0, seconds: int = 0) -> None:
         """
         Advances the world clock based on the given arguments
 
@@ -51,15 +101,16 @@ class WorldClock:
             days (int, optional): Days to add to World_Clock. Defaults to 0.
             hours (int, optional): Hours to add to World_Clock. Defaults to 0.
             minutes (int, optional): Minutes to add to World_Clock. Defaults to 0.
+            seconds (int, optional): Seconds to add to World_Clock. Defaults to 0.
         """
-        new_day = self.current_time.current_day + days
-        new_hour = self.current_time.current_hour + hours
-        new_minute = self.current_time.current_minute + minutes
+        # Ticks are already normalized, so advancing is a single integer add
+        self.shift(GameDuration.parts_to_ticks(days, hours, minutes, seconds))
 
-        # Normalize
-        new_hour += new_minute // 60
-        new_minute %= 60
-        new_day += new_hour // 24
-        new_hour %= 24
+    def advance_by(self, duration: GameDuration) -> None:
+        """
+        Advances the world clock by a GameDuration
 
-        self.current_time = GameTime(new_day, new_hour, new_minute, 0)
+        Args:
+            duration (GameDuration): Amount of game time to add
+        """
+        self.shift(duration.ticks)
@@ -1,4 +1,8 @@
 from .GameTime import GameTime
+from .GameDuration import GameDuration
 from .WorldClock import WorldClock
+from .QuestScheduler import QuestScheduler
+from .RealTimeClock import RealTimeClock
+from .CampaignClock import CampaignClock
 
-__all__ = ['GameTime', 'WorldClock']
+__all__ = ['GameTime', 'GameDuration', 'WorldClock', 'QuestScheduler', 'RealTimeClock', 'CampaignClock']
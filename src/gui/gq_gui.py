@@ -1,7 +1,12 @@
 import tkinter as tk
+from collections import deque
 from tkinter import ttk
+from typing import Optional
 from core import WorldClock
-from models import Campaign, User, Realm
+from models import Campaign, ChangeTracker, User, Realm, RealmRegistry, PermissionIndex
+from storage import open_store
+from gui.redraw import RedrawScheduler
+from gui.screen_cache import ScreenCache
 
 # class gq_GUI:
 #     def __init__(self, given_campaign: Campaign, selected_user: User):
@@ -14,17 +19,45 @@ from models import Campaign, User, Realm
 #     def show_classic_display(self) -> None:
 #         pass
 
+# Real-time clock refresh interval (~60 Hz)
+CLOCK_INTERVAL_MS = 16
+
 
 class gq_GUI(tk.Tk):
-    def __init__(self):
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Args:
+            db_path (Optional[str], optional): SQLite file or journal directory to keep data in, e.g. storage.default_data_path(); None keeps everything in memory. Defaults to None.
+        """
         super().__init__()
 
         # GuildQuest data
+        self.store = open_store(db_path) if db_path is not None else None
         self.world_clock: WorldClock = WorldClock()
         self.users: dict = {}
-        self.realms: dict = self._create_default_realms()
+        # Which loaded campaigns each user can view or edit
+        self.permissions: PermissionIndex = PermissionIndex()
+        self.realms: RealmRegistry = RealmRegistry(self._load_realms())
         self.current_user: User = None
 
+        # Change events and dirty flags for every loaded user's models
+        self.changes: ChangeTracker = ChangeTracker()
+        self.changes.add_listener(self._on_model_change)
+
+        # Most recent quest start/end events fired by the world clock since last
+        # cleared, and how many fired in all, which can be more than the deque keeps
+        self.triggered_events: deque = deque(maxlen=1000)
+        self.triggered_count = 0
+        self.world_clock.scheduler.add_listener(self._on_quest_trigger)
+
+        # Redraws requested during an event-loop turn run once, when it goes idle
+        self.redraw: RedrawScheduler = RedrawScheduler(self)
+
+        # Shared "World Clock: ..." text for every screen header
+        self.clock_text = tk.StringVar(self)
+        self._clock_job = None
+        self.update_clock_display()
+
         # Window Setup
         self.title("GuildQuest")
         self.geometry('800x600')
@@ -32,13 +65,189 @@ class gq_GUI(tk.Tk):
         self.container = tk.Frame(self)
         self.container.pack(fill='both', expand=True)
 
-        # Dictionary to hold screen frames
-        self.screens = {}
+        # Built screens, kept between visits until evicted or invalidated
+        self.screens: ScreenCache = ScreenCache()
         self.current_screen = None  # Track current screen
 
         # Start with login screen
         self.show_screen("login")
 
+    def _load_realms(self):
+        """
+        Load realms from the store, saving the defaults on first run
+        """
+        if self.store is None:
+            return self._create_default_realms()
+
+        realms = self.store.load_realms()
+        if not realms:
+            realms = self._create_default_realms()
+            self.store.save_realms(realms)
+        return realms
+
+    def get_user(self, username):
+        """
+        Look up a user, loading them from the store on first use
+
+        Args:
+            username (str): Username to look up
+
+        Returns:
+            User: The user, or None if they do not exist
+        """
+        user = self.users.get(username)
+        if user is None and self.store is not None:
+            user = self.store.load_user(username)
+            if user is not None:
+                self.users[username] = user
+                self.changes.watch_user(user)
+                for campaign in user.campaigns:
+                    self.track_campaign(campaign)
+        return user
+
+    def load_shared_campaigns(self, user):
+        """
+        Load the owners of campaigns shared with a user, which indexes those
+        campaigns alongside the user's own
+
+        Args:
+            user (User): Member whose shared campaigns to load
+        """
+        if self.store is not None:
+            for owner in self.store.shared_campaign_owners(user.username):
+                self.get_user(owner)
+
+    def track_campaign(self, campaign):
+        """
+        Add a campaign to the permission and realm indexes and put its
+        quests on the world clock's scheduler, whichever store it came from
+
+        Args:
+            campaign (Campaign): Loaded or newly created campaign
+        """
+        self.permissions.add_campaign(campaign)
+        self.realms.add_campaign(campaign)
+        self.world_clock.scheduler.schedule_campaign(campaign)
+
+    def untrack_campaign(self, campaign):
+        """
+        Drop a deleted campaign from the permission and realm indexes and
+        cancel its quests' pending events
+
+        Args:
+            campaign (Campaign): Campaign being deleted
+        """
+        self.world_clock.scheduler.unschedule_campaign(campaign)
+        self.permissions.remove_campaign(campaign)
+        self.realms.remove_campaign(campaign)
+
+    def add_user(self, user):
+        """
+        Register a new user and save them
+
+        Args:
+            user (User): New user
+        """
+        self.users[user.username] = user
+        self.changes.watch_user(user)
+        self.save_user(user)
+
+    def save_user(self, user=None):
+        """
+        Save a user's settings, campaigns and characters
+
+        Args:
+            user (User, optional): User to save. Defaults to the current user.
+        """
+        user = user if user is not None else self.current_user
+        if self.store is not None and user is not None:
+            # Quests of campaigns saved for the first time are written along with them
+            new_quests = [q for c in user.campaigns if c.db_id is None and c.is_loaded() for q in c.quests]
+            self.store.save_user(user)
+
+            # Only what was written is clean: edited quests and other users' changes are still unsaved
+            changes = self.changes
+            changes.mark_clean(user)
+            changes.mark_clean(user.user_settings)
+            for character in user.characters:
+                changes.mark_clean(character)
+                changes.mark_clean(character.curr_inventory)
+            for campaign in user.campaigns:
+                changes.mark_clean(campaign)
+            for quest in new_quests:
+                changes.mark_clean(quest)
+
+    def save_campaign(self, campaign):
+        """
+        Save a campaign header through the user who owns it, which may not
+        be the current user for a shared campaign
+
+        Args:
+            campaign (Campaign): Edited campaign
+        """
+        owner = self.changes.owner_of(campaign)
+        self.save_user(owner if owner is not None else self.current_user)
+
+    def save_quest(self, campaign, quest):
+        """
+        Save one created or edited quest
+
+        Args:
+            campaign (Campaign): Campaign the quest belongs to
+            quest (Quest_Event): Quest to save
+        """
+        if self.store is not None:
+            self.store.save_quest(campaign, quest)
+            self.changes.mark_clean(quest)
+
+    def delete_saved_quest(self, campaign, quest):
+        """
+        Remove a deleted quest from the store
+
+        Args:
+            campaign (Campaign): Campaign the quest belonged to
+            quest (Quest_Event): Deleted quest
+        """
+        if self.store is not None:
+            self.store.delete_quest(campaign, quest)
+
+    def switch_user(self, user):
+        """
+        Log a user in or out, dropping the cached screens built for the
+        previous user
+
+        Args:
+            user (User): User to log in, or None to log out
+        """
+        if user is not self.current_user:
+            self.screens.clear(keep=("login",))
+        self.current_user = user
+        if user is not None:
+            self.load_shared_campaigns(user)
+
+    def _on_model_change(self, change):
+        """
+        Change tracker callback: drops the cached screens that show the
+        changed data, so only those are rebuilt on their next visit. The
+        screen in view made the change and has already updated itself.
+
+        Args:
+            change (Change): Reported model change
+        """
+        self.screens.invalidate_where(
+            lambda screen: screen.is_affected_by(change),
+            keep=self.current_screen
+        )
+
+    def destroy(self):
+        """
+        Close the store along with the window
+        """
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+        super().destroy()
+
     def _create_default_realms(self):
         """
         Create default realms
@@ -68,41 +277,121 @@ class gq_GUI(tk.Tk):
             )
         }
 
-    def show_screen(self, screen_name):
+    def start_clock(self):
+        """
+        Starts the world clock in real-time mode and begins the after() update loop
+        """
+        self.world_clock.start()
+        if self._clock_job is None:
+            self._clock_job = self.after(CLOCK_INTERVAL_MS, self._clock_loop)
+
+    def stop_clock(self):
+        """
+        Pauses the real-time world clock and its update loop
+        """
+        self.world_clock.stop()
+        if self._clock_job is not None:
+            self.after_cancel(self._clock_job)
+            self._clock_job = None
+        self.update_clock_display()
+
+    def _clock_loop(self):
+        """
+        One step of the real-time clock loop. Never blocks; the label is only
+        touched when the displayed tick actually changed.
+        """
+        self._clock_job = None
+        if not self.world_clock.is_running:
+            return
+
+        if self.world_clock.tick():
+            self.update_clock_display()
+
+        self._clock_job = self.after(CLOCK_INTERVAL_MS, self._clock_loop)
+
+    def update_clock_display(self):
+        """
+        Schedules the world clock text shown in screen headers to be updated,
+        once however often the clock moved during this event-loop turn
+        """
+        self.redraw.mark_dirty(self, "clock", self._render_clock)
+
+    def _render_clock(self):
+        self.clock_text.set(f"World Clock: {self.world_clock.get_current_time().get_fulltime()}")
+
+    def _on_quest_trigger(self, kind, quest, campaign, when):
+        """
+        Scheduler callback: records a quest start/end crossed by the world clock
+
+        Args:
+            kind (str): QuestScheduler.QUEST_START or QuestScheduler.QUEST_END
+            quest (Quest_Event): Quest that started or ended
+            campaign (Campaign): Campaign the quest belongs to
+            when (GameTime): Time of the event
+        """
+        self.triggered_events.append((kind, quest, campaign, when))
+        self.triggered_count += 1
+
+    def clear_triggered_events(self):
+        """
+        Forget the recorded quest events and reset their count
+        """
+        self.triggered_events.clear()
+        self.triggered_count = 0
+
+    def show_screen(self, screen_name, build=None):
         """
-        Display the correct screen on the GUI
+        Display the correct screen on the GUI, reusing it if it is cached
 
         Args:
             screen_name (str): Name of screen to be displayed
+            build (Callable[[], BaseScreen], optional): Builds the screen if it is not cached. Defaults to the builder for screen_name.
         """
         # If this screen already exists and is current, do nothing
         if self.current_screen == screen_name and screen_name in self.screens:
             return
 
+        screen = self.screens.get(screen_name)
+        if screen is None:
+            screen = build() if build is not None else self._build_screen(screen_name)
+            self.screens.put(screen_name, screen)
+        else:
+            screen.on_show()
+
         # Hide current screen if exists
         if self.current_screen and self.current_screen in self.screens:
             self.screens[self.current_screen].pack_forget()
 
+        screen.pack(fill='both', expand=True)
+        self.current_screen = screen_name
+
+    def _build_screen(self, screen_name):
+        """
+        Build one of the app's named screens
+
+        Args:
+            screen_name (str): Name of screen to be built
+
+        Returns:
+            BaseScreen: The new screen
+        """
         if screen_name == "login":
             from gui.screens.login_screen import LoginScreen
-            if screen_name not in self.screens:
-                self.screens[screen_name] = LoginScreen(self.container, self)
+            return LoginScreen(self.container, self)
 
         elif screen_name == "main_menu":
             from gui.screens.main_menu import MainMenu
-            if screen_name not in self.screens:
-                self.screens[screen_name] = MainMenu(self.container, self)
+            return MainMenu(self.container, self)
 
         elif screen_name == "campaign":
             from gui.screens.campaign_screen import CampaignScreen
-            self.screens[screen_name] = CampaignScreen(self.container, self)
+            return CampaignScreen(self.container, self)
 
         elif screen_name == "character":
             from gui.screens.character_screen import CharacterScreen
-            self.screens[screen_name] = CharacterScreen(self.container, self)
+            return CharacterScreen(self.container, self)
 
-        self.screens[screen_name].pack(fill='both', expand=True)
-        self.current_screen = screen_name
+        raise ValueError(f"Unknown screen '{screen_name}'")
 
     def refresh_screen(self, screen_name):
         """        
@@ -113,9 +402,7 @@ class gq_GUI(tk.Tk):
             screen_name (str): Name of screen to be refreshed
         """
         # Destroy the old screen if it exists
-        if screen_name in self.screens:
-            self.screens[screen_name].destroy()
-            del self.screens[screen_name]
+        self.screens.invalidate(screen_name)
 
         # Show the screen (will create it fresh)
         self.show_screen(screen_name)
@@ -0,0 +1,82 @@
+"""
+Coalesced redraws: one idle-time pass per event-loop turn
+"""
+
+import tkinter as tk
+from typing import Callable, Hashable
+
+
+class RedrawScheduler:
+    """
+    Screens mark regions dirty instead of redrawing them straight away. The
+    first mark schedules a single after_idle pass, which renders every
+    dirty region once however many times it was marked, so a burst of edits
+    or clock advances handled in one event-loop turn redraws each region
+    once.
+    """
+    def __init__(self, root: tk.Misc):
+        """
+        Args:
+            root (tk.Misc): Widget whose event loop runs the redraw passes
+        """
+        self.root = root
+        # (widget, region) -> render callback, in first-marked order
+        self._dirty: dict[tuple[tk.Misc, Hashable], Callable[[], None]] = {}
+        self._job = None
+        self.requested = 0
+        self.rendered = 0
+        self.passes = 0
+
+    def mark_dirty(self, widget: tk.Misc, region: Hashable, render: Callable[[], None]) -> None:
+        """
+        Schedules a region to be redrawn in the next idle pass. Marking a
+        region that is already dirty only replaces its render callback.
+
+        Args:
+            widget (tk.Misc): Widget that owns the region; skipped if destroyed before the pass
+            region (Hashable): Name of the region within the widget, e.g. 'list'
+            render (Callable[[], None]): Redraws the region
+        """
+        self.requested += 1
+        self._dirty[(widget, region)] = render
+        if self._job is None:
+            self._job = self.root.after_idle(self._run)
+
+    def is_dirty(self, widget: tk.Misc, region: Hashable) -> bool:
+        return (widget, region) in self._dirty
+
+    def flush(self) -> None:
+        """
+        Renders the dirty regions now instead of waiting for the idle pass
+        """
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+        self._run()
+
+    def _run(self) -> None:
+        self._job = None
+        # Regions marked while rendering go to the next pass
+        dirty, self._dirty = self._dirty, {}
+        if not dirty:
+            return
+        self.passes += 1
+        for (widget, _), render in dirty.items():
+            # The widget may have been destroyed since, e.g. an invalidated screen
+            if widget.winfo_exists():
+                render()
+                self.rendered += 1
+
+    def get_stats(self) -> dict:
+        """
+        Returns the scheduler counters
+
+        Returns:
+            dict: Regions marked dirty, regions rendered, idle passes run,
+            and regions still waiting
+        """
+        return {
+            'requested': self.requested,
+            'rendered': self.rendered,
+            'passes': self.passes,
+            'pending': len(self._dirty)
+        }
@@ -0,0 +1,137 @@
+"""
+Bounded LRU cache of built screens
+"""
+
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional
+from gui.screens.base_screen import BaseScreen
+
+# Built screens kept between visits before the least recently shown is destroyed
+MAX_CACHED_SCREENS = 8
+
+
+class ScreenCache:
+    """
+    Keeps the most recently shown screens built, so going back to one packs
+    the existing frame instead of rebuilding its widget tree. Past
+    max_screens the least recently shown screen is destroyed. Screens whose
+    data changed are dropped with invalidate() or invalidate_where() and
+    rebuilt on their next visit.
+    """
+    def __init__(self, max_screens: int = MAX_CACHED_SCREENS):
+        """
+        Args:
+            max_screens (int, optional): Screens kept built. Defaults to MAX_CACHED_SCREENS.
+        """
+        self.max_screens = max_screens
+        # Screen name -> screen, least recently shown first
+        self._screens: OrderedDict[str, BaseScreen] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, name: str) -> Optional[BaseScreen]:
+        """
+        Returns a cached screen and marks it most recently shown
+
+        Args:
+            name (str): Screen name
+
+        Returns:
+            Optional[BaseScreen]: The screen, or None if it has to be built
+        """
+        screen = self._screens.get(name)
+        if screen is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._screens.move_to_end(name)
+        return screen
+
+    def put(self, name: str, screen: BaseScreen) -> None:
+        """
+        Caches a newly built screen, destroying the least recently shown
+        screens beyond max_screens
+
+        Args:
+            name (str): Screen name
+            screen (BaseScreen): Built screen
+        """
+        old = self._screens.pop(name, None)
+        if old is not None and old is not screen:
+            old.destroy()
+        self._screens[name] = screen
+        while len(self._screens) > self.max_screens:
+            _, evicted = self._screens.popitem(last=False)
+            evicted.destroy()
+            self.evictions += 1
+
+    def invalidate(self, name: str) -> bool:
+        """
+        Destroys a cached screen so its next visit rebuilds it
+
+        Args:
+            name (str): Screen name
+
+        Returns:
+            bool: True if the screen was cached
+        """
+        screen = self._screens.pop(name, None)
+        if screen is None:
+            return False
+        screen.destroy()
+        self.invalidations += 1
+        return True
+
+    def invalidate_where(self, predicate: Callable[[BaseScreen], bool], keep: Optional[str] = None) -> list[str]:
+        """
+        Destroys every cached screen a predicate selects
+
+        Args:
+            predicate (Callable[[BaseScreen], bool]): Returns True for screens to drop
+            keep (Optional[str], optional): Screen never dropped, e.g. the one in view. Defaults to None.
+
+        Returns:
+            list[str]: Names of the dropped screens
+        """
+        stale = [name for name, screen in self._screens.items()
+                 if name != keep and predicate(screen)]
+        for name in stale:
+            self.invalidate(name)
+        return stale
+
+    def clear(self, keep: Iterable[str] = ()) -> None:
+        """
+        Destroys every cached screen except the ones named in keep
+
+        Args:
+            keep (Iterable[str], optional): Screen names to keep. Defaults to ().
+        """
+        keep = set(keep)
+        for name in [n for n in self._screens if n not in keep]:
+            self.invalidate(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._screens
+
+    def __getitem__(self, name: str) -> BaseScreen:
+        # Plain lookup: does not count as a visit
+        return self._screens[name]
+
+    def get_stats(self) -> dict:
+        """
+        Returns the cache counters
+
+        Returns:
+            dict: hits, misses, evictions and invalidations, the number of
+            cached screens and their names, least recently shown first
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'size': len(self._screens),
+            'screens': list(self._screens)
+        }
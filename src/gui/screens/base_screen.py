@@ -18,6 +18,35 @@ class BaseScreen(tk.Frame):
         """Override this in child classes"""
         pass
     
+    def on_show(self):
+        """Override this in child classes to update a cached screen when it is shown again"""
+        pass
+    
+    def is_affected_by(self, change):
+        """
+        Override this in child classes to say whether a model change leaves
+        the screen out of date. Stale screens are dropped from the screen
+        cache and rebuilt on their next visit.
+
+        Args:
+            change (Change): Reported model change
+
+        Returns:
+            bool: True if the screen shows data the change touched
+        """
+        return False
+    
+    def mark_dirty(self, region, render):
+        """
+        Schedule a region of the screen to be redrawn once the current
+        event-loop turn goes idle, however many times it is marked before then
+
+        Args:
+            region (Hashable): Name of the region, e.g. 'list'
+            render (Callable[[], None]): Redraws the region
+        """
+        self.app.redraw.mark_dirty(self, region, render)
+    
     def navigate_to(self, screen_name):
         """Helper to navigate to another screen"""
         self.app.show_screen(screen_name)
\ No newline at end of file
@@ -5,6 +5,162 @@ Campaign management screen for GuildQuest: Allows creating, viewing, editing, an
 import tkinter as tk
 from tkinter import messagebox, ttk
 from gui.screens.base_screen import BaseScreen
+from gui.widgets import Card, CardList
+from core import CampaignClock
+from models import Campaign
+from models.changes import UPDATED
+
+
+class CampaignCard(Card):
+    """
+    Campaign card, rebound to a different campaign on each refresh
+    """
+    def __init__(self, parent, screen):
+        """
+        Args:
+            parent: Parent widget (the list's inner frame)
+            screen (CampaignScreen): Screen handling the card's buttons
+        """
+        self.screen = screen
+        super().__init__(parent)
+
+    def build(self):
+        # Card frame
+        card = tk.Frame(self, bg='#3a3a3a', relief='raised', bd=2)
+        card.pack(fill='x', pady=10, padx=5)
+
+        # Main content frame
+        content = tk.Frame(card, bg='#3a3a3a')
+        content.pack(fill='both', expand=True, padx=15, pady=10)
+
+        # Top row: Title and status
+        top_row = tk.Frame(content, bg='#3a3a3a')
+        top_row.pack(fill='x', pady=(0, 5))
+
+        # Campaign title
+        self.title_label = tk.Label(
+            top_row,
+            bg='#3a3a3a',
+            fg='white',
+            font=('Courier', 16, 'bold'),
+            wraplength=600,
+            justify='left',
+            anchor='w'
+        )
+        self.title_label.pack(side='left', fill='x', expand=True)
+
+        # Status badge
+        self.status_badge = tk.Label(
+            top_row,
+            fg='white',
+            font=('Arial', 10, 'bold'),
+            padx=10,
+            pady=2
+        )
+        self.status_badge.pack(side='left', padx=10)
+
+        # Info row
+        info_row = tk.Frame(content, bg='#3a3a3a')
+        info_row.pack(fill='x', pady=5)
+
+        self.info_label = tk.Label(
+            info_row,
+            bg='#3a3a3a',
+            fg='#cccccc',
+            font=('Arial', 10)
+        )
+        self.info_label.pack(side='left')
+
+        # Buttons row
+        button_row = tk.Frame(content, bg='#3a3a3a')
+        button_row.pack(fill='x', pady=(10))
+
+        button_config = {
+            'font': ('Arial', 10),
+            'width': 12,
+            'height': 1,
+            'relief': 'flat',
+            'bd': 0,
+            'highlightthickness': 0
+        }
+
+        # View/Manage Quests button
+        tk.Button(
+            button_row,
+            text="Manage Quests",
+            command=lambda: self.screen.show_quest_management(self.item),
+            bg='#4a7a8a',
+            **button_config
+        ).pack(side='left', padx=5)
+
+        # Rename button
+        self.rename_button = tk.Button(
+            button_row,
+            text="Rename",
+            command=lambda: self.screen.show_rename_dialog(self.item),
+            bg='#4a4a4a',
+            **button_config
+        )
+        self.rename_button.pack(side='left', padx=5)
+
+        # Toggle Active/Archive button
+        self.toggle_button = tk.Button(
+            button_row,
+            command=lambda: self.screen.toggle_campaign_status(self.item),
+            bg='#4a4a4a',
+            **button_config
+        )
+        self.toggle_button.pack(side='left', padx=5)
+
+        # Campaign clock start/pause button; only packed for campaigns with a clock
+        self.clock_button = tk.Button(
+            button_row,
+            command=lambda: self.screen.toggle_campaign_clock(self.item),
+            bg='#4a4a4a',
+            **button_config
+        )
+
+        # Delete button
+        self.delete_button = tk.Button(
+            button_row,
+            text="Delete",
+            command=lambda: self.screen.delete_campaign(self.item),
+            bg='#8a4a4a',
+            **button_config
+        )
+        self.delete_button.pack(side='left', padx=5)
+
+    def populate(self, campaign):
+        user = self.screen.app.current_user
+        owner = self.screen.app.changes.owner_of(campaign)
+        if owner is None or owner is user:
+            self.title_label.config(text=campaign.title)
+        else:
+            self.title_label.config(text=f"{campaign.title} (shared by {owner.username})")
+
+        # Status badge
+        if campaign.activity:
+            self.status_badge.config(text='Active', bg='#4a8a4a')
+        else:
+            self.status_badge.config(text='Archived', bg='#8a4a4a')
+
+        info_text = f"🏰 Realm: {campaign.c_realm.name}  |  📅 Started: {campaign.time.get_fulltime()}  |  📋 Quests: {campaign.get_quest_count()}"
+        if campaign.clock is not None:
+            info_text += f"  |  ⏳ Now: {campaign.get_clock_time().get_fulltime()}"
+        self.info_label.config(text=info_text)
+
+        # Members without edit access can only view; only the owner can delete
+        edit_state = 'normal' if campaign.can_edit(user) else 'disabled'
+        self.rename_button.config(state=edit_state)
+        self.toggle_button.config(text="Archive" if campaign.activity else "Activate", state=edit_state)
+        self.clock_button.config(state=edit_state)
+        self.delete_button.config(state='normal' if owner is None or owner is user else 'disabled')
+
+        if campaign.clock is not None:
+            self.clock_button.config(text="Pause Clock" if campaign.clock.is_running else "Start Clock")
+            self.clock_button.pack(side='left', padx=5, before=self.delete_button)
+        else:
+            self.clock_button.pack_forget()
 
 
 class CampaignScreen(BaseScreen):
@@ -38,10 +194,9 @@ class CampaignScreen(BaseScreen):
         ).pack(side='left', padx=15, pady=15)
 
         # World clock
-        world_time = self.app.world_clock.get_current_time().get_fulltime()
         tk.Label(
             header_frame,
-            text=f"World Clock: {world_time}",
+            textvariable=self.app.clock_text,
             bg='#1a1a1a',
             fg='#00ff00',
             font=('Courier', 10)
@@ -77,6 +232,21 @@ class CampaignScreen(BaseScreen):
         self.campaigns_container = tk.Frame(content_frame, bg='#2b2b2b')
         self.campaigns_container.pack(fill='both', expand=True)
 
+        # No campaigns message, shown instead of the list
+        self.empty_label = tk.Label(
+            self.campaigns_container,
+            text="No campaigns yet! Create your first campaign to get started.",
+            bg='#2b2b2b',
+            fg='#888888',
+            font=('Arial', 14)
+        )
+
+        # Cards are kept and rebound across refreshes
+        self.campaign_list = CardList(
+            self.campaigns_container,
+            lambda parent: CampaignCard(parent, self)
+        )
+
         # Display campaigns
         self.refresh_campaigns_list()
 
@@ -84,151 +254,40 @@ class CampaignScreen(BaseScreen):
         """
         Refresh the list of campaigns
         """
-        
-        # Clear existing widgets
-        for widget in self.campaigns_container.winfo_children():
-            widget.destroy()
-
-        campaigns = self.app.current_user.campaigns
-
-        if not campaigns:
-            # No campaigns message
-            tk.Label(
-                self.campaigns_container,
-                text="No campaigns yet! Create your first campaign to get started.",
-                bg='#2b2b2b',
-                fg='#888888',
-                font=('Arial', 14)
-            ).pack(pady=50)
-        else:
-            # Create scrollable frame for campaigns
-            canvas = tk.Canvas(self.campaigns_container,
-                               bg='#2b2b2b', highlightthickness=0)
-            scrollbar = tk.Scrollbar(
-                self.campaigns_container, orient="vertical", command=canvas.yview)
-            scrollable_frame = tk.Frame(canvas, bg='#2b2b2b')
-
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-            )
 
-            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
+        # The user's own campaigns and the ones shared with them
+        self.campaign_list.set_items(self.app.permissions.visible_campaigns(self.app.current_user))
+        self.update_list_state()
 
-            canvas.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
-
-            # Display each campaign
-            for idx, campaign in enumerate(campaigns):
-                self.create_campaign_card(scrollable_frame, campaign, idx)
-
-    def create_campaign_card(self, parent, campaign, idx):
+    def on_show(self):
         """
-        Create a card widget for a campaign
+        Relabel the cards, whose campaign clocks may have run since the last visit
         """
-        
-        # Card frame
-        card = tk.Frame(parent, bg='#3a3a3a', relief='raised', bd=2)
-        card.pack(fill='x', pady=10, padx=5)
-
-        # Main content frame
-        content = tk.Frame(card, bg='#3a3a3a')
-        content.pack(fill='both', expand=True, padx=15, pady=10)
-
-        # Top row: Title and status
-        top_row = tk.Frame(content, bg='#3a3a3a')
-        top_row.pack(fill='x', pady=(0, 5))
-
-        # Campaign title
-        title_label = tk.Label(
-            top_row,
-            text=campaign.title,
-            bg='#3a3a3a',
-            fg='white',
-            font=('Courier', 16, 'bold'),
-            wraplength=600,
-            justify='left',
-            anchor='w'
-        )
-        title_label.pack(side='left', fill='x', expand=True)
-
-        # Status badge
-        status_color = '#4a8a4a' if campaign.activity else '#8a4a4a'
-        status_text = 'Active' if campaign.activity else 'Archived'
-        status_badge = tk.Label(
-            top_row,
-            text=status_text,
-            bg=status_color,
-            fg='white',
-            font=('Arial', 10, 'bold'),
-            padx=10,
-            pady=2
-        )
-        status_badge.pack(side='left', padx=10)
-
-        # Info row
-        info_row = tk.Frame(content, bg='#3a3a3a')
-        info_row.pack(fill='x', pady=5)
-
-        info_text = f"🏰 Realm: {campaign.c_realm.name}  |  📅 Started: {campaign.time.get_fulltime()}  |  📋 Quests: {len(campaign.quests)}"
-        tk.Label(
-            info_row,
-            text=info_text,
-            bg='#3a3a3a',
-            fg='#cccccc',
-            font=('Arial', 10)
-        ).pack(side='left')
-
-        # Buttons row
-        button_row = tk.Frame(content, bg='#3a3a3a')
-        button_row.pack(fill='x', pady=(10))
-
-        button_config = {
-            'font': ('Arial', 10),
-            'width': 12,
-            'height': 1,
-            'relief': 'flat',
-            'bd': 0,
-            'highlightthickness': 0
-        }
+        self.mark_dirty("cards", self.campaign_list.refresh)
 
-        # View/Manage Quests button
-        tk.Button(
-            button_row,
-            text="Manage Quests",
-            command=lambda c=campaign, i=idx: self.show_quest_management(c, i),
-            bg='#4a7a8a',
-            **button_config
-        ).pack(side='left', padx=5)
-
-        # Rename button
-        tk.Button(
-            button_row,
-            text="Rename",
-            command=lambda c=campaign: self.show_rename_dialog(c),
-            bg='#4a4a4a',
-            **button_config
-        ).pack(side='left', padx=5)
+    def is_affected_by(self, change):
+        """
+        The cards show each campaign's fields and quest count
+        """
+        return (isinstance(change.entity, Campaign)
+                or (change.kind != UPDATED and isinstance(change.owner, Campaign)))
 
-        # Toggle Active/Archive button
-        toggle_text = "Archive" if campaign.activity else "Activate"
-        tk.Button(
-            button_row,
-            text=toggle_text,
-            command=lambda c=campaign: self.toggle_campaign_status(c),
-            bg='#4a4a4a',
-            **button_config
-        ).pack(side='left', padx=5)
+    def update_list_state(self):
+        """
+        Schedule the swap between the campaign list and the empty message
+        """
+        self.mark_dirty("list_state", self.render_list_state)
 
-        # Delete button
-        tk.Button(
-            button_row,
-            text="Delete",
-            command=lambda i=idx: self.delete_campaign(i),
-            bg='#8a4a4a',
-            **button_config
-        ).pack(side='left', padx=5)
+    def render_list_state(self):
+        """
+        Swap between the campaign list and the empty message
+        """
+        if not self.campaign_list.count():
+            self.campaign_list.pack_forget()
+            self.empty_label.pack(pady=50)
+        else:
+            self.empty_label.pack_forget()
+            self.campaign_list.pack(fill='both', expand=True)
 
     def show_create_campaign_dialog(self):
         """
@@ -342,7 +401,7 @@ class CampaignScreen(BaseScreen):
             current_time = self.app.world_clock.get_current_time()
 
             # Create campaign using User's method
-            self.app.current_user.create_camp(
+            campaign = self.app.current_user.create_camp(
                 c_name=name,
                 activity=True,
                 time=current_time,
@@ -353,16 +412,21 @@ class CampaignScreen(BaseScreen):
                 edit_users=[self.app.current_user]
             )
 
+            # Give the campaign its own (paused) clock on the world clock's time source
+            campaign.attach_clock(CampaignClock(
+                start=current_time,
+                rate=self.app.world_clock.rate,
+                source=self.app.world_clock.source
+            ))
+            self.app.track_campaign(campaign)
+            self.app.save_user()
+
             messagebox.showinfo("Success", f"Campaign '{name}' created!")
             dialog.destroy()
 
-            # Refresh the campaigns list
-            self.refresh_campaigns_list()
-
-            # Refresh main menu to update campaign count
-            if "main_menu" in self.app.screens:
-                self.app.screens["main_menu"].destroy()
-                del self.app.screens["main_menu"]
+            # Add just the new campaign's card
+            self.campaign_list.insert(self.campaign_list.count(), campaign)
+            self.update_list_state()
 
         # Bind Enter key
         name_entry.bind('<Return>', lambda e: do_create())
@@ -431,12 +495,13 @@ class CampaignScreen(BaseScreen):
                 return
 
             campaign.rename(new_name)
+            self.app.save_campaign(campaign)
             messagebox.showinfo(
                 "Success", f"Campaign renamed to '{new_name}'!")
             dialog.destroy()
 
-            # Refresh the campaigns list
-            self.refresh_campaigns_list()
+            # Relabel just the renamed campaign's card
+            self.campaign_list.update_item(campaign)
 
         name_entry.bind('<Return>', lambda e: do_rename())
 
@@ -467,35 +532,48 @@ class CampaignScreen(BaseScreen):
         """
         
         campaign.change_act()
+        self.app.save_campaign(campaign)
         status = "active" if campaign.activity else "archived"
         messagebox.showinfo("Success", f"Campaign is now {status}!")
 
-        # Refresh the campaigns list
-        self.refresh_campaigns_list()
+        # Relabel just this campaign's card
+        self.campaign_list.update_item(campaign)
+
+    def toggle_campaign_clock(self, campaign):
+        """
+        Start or pause a campaign's own clock
+        """
+        
+        if campaign.clock.is_running:
+            campaign.clock.stop()
+        else:
+            campaign.clock.start()
+        self.app.save_campaign(campaign)
+
+        # Relabel just this campaign's card
+        self.campaign_list.update_item(campaign)
 
-    def delete_campaign(self, campaign_idx):
+    def delete_campaign(self, campaign):
         """
-        Delete a campaign
+        Delete one of the current user's campaigns
         """
         
-        campaign = self.app.current_user.campaigns[campaign_idx]
+        campaign_idx = self.app.current_user.campaigns.index(campaign)
 
         if messagebox.askyesno(
             "Confirm Delete",
-            f"Are you sure you want to delete '{campaign.title}'?\n\nThis will delete all {len(campaign.quests)} quest(s) in this campaign.\n\nThis action cannot be undone!"
+            f"Are you sure you want to delete '{campaign.title}'?\n\nThis will delete all {campaign.get_quest_count()} quest(s) in this campaign.\n\nThis action cannot be undone!"
         ):
+            self.app.untrack_campaign(campaign)
             self.app.current_user.delete_camp(campaign_idx)
+            self.app.save_user()
             messagebox.showinfo("Success", "Campaign deleted!")
 
-            # Refresh the campaigns list
-            self.refresh_campaigns_list()
+            # Remove just the deleted campaign's card
+            self.campaign_list.remove(self.campaign_list.index_of(campaign))
+            self.update_list_state()
 
-            # Refresh main menu to update campaign count
-            if "main_menu" in self.app.screens:
-                self.app.screens["main_menu"].destroy()
-                del self.app.screens["main_menu"]
-
-    def show_quest_management(self, campaign, campaign_idx):
+    def show_quest_management(self, campaign):
         """
         Navigate to quest management for this campaign
         """
@@ -503,23 +581,10 @@ class CampaignScreen(BaseScreen):
         # Imports here to avoid circular import
         from gui.screens.quest_screen import QuestScreen
 
-        # Create a unique key for this campaign's quest screen
-        screen_key = f"quest_{campaign_idx}"
-
-        # If screen exists, remove it to force refresh
-        if screen_key in self.app.screens:
-            self.app.screens[screen_key].destroy()
-            del self.app.screens[screen_key]
-
-        # Create new quest screen
-        quest_screen = QuestScreen(
-            self.app.container, self.app, campaign, campaign_idx)
-        self.app.screens[screen_key] = quest_screen
-
-        # Hide current screen
-        if self.app.current_screen and self.app.current_screen in self.app.screens:
-            self.app.screens[self.app.current_screen].pack_forget()
-
-        # Show quest screen
-        quest_screen.pack(fill='both', expand=True)
-        self.app.current_screen = screen_key
+        # One cached quest screen per campaign. Keyed by the campaign itself,
+        # not its index, which shifts when an earlier campaign is deleted;
+        # a deleted campaign's screen is invalidated before its id can be reused.
+        self.app.show_screen(
+            f"quest_{id(campaign)}",
+            lambda: QuestScreen(self.app.container, self.app, campaign)
+        )
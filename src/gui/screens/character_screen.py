@@ -5,7 +5,208 @@ Character management screen for GuildQuest: Allows creating, viewing, editing, a
 import tkinter as tk
 from tkinter import messagebox, ttk
 from gui.screens.base_screen import BaseScreen
-from models import Character, Item
+from gui.widgets import Card, CardList
+from models import Character, Inventory, default_catalog
+
+
+class CharacterCard(Card):
+    """
+    Character card, rebound to a different character on each refresh
+    """
+    def __init__(self, parent, screen):
+        """
+        Args:
+            parent: Parent widget (the list's inner frame)
+            screen (CharacterScreen): Screen handling the card's buttons
+        """
+        self.screen = screen
+        super().__init__(parent)
+
+    def build(self):
+        # Card frame
+        card = tk.Frame(self, bg='#3a3a3a', relief='raised', bd=2)
+        card.pack(fill='x', pady=10, padx=5)
+        
+        # Main content frame
+        content = tk.Frame(card, bg='#3a3a3a')
+        content.pack(fill='both', expand=True, padx=15, pady=10)
+        
+        # Top row: Name and Level
+        top_row = tk.Frame(content, bg='#3a3a3a')
+        top_row.pack(fill='x', pady=(0, 5))
+        
+        # Character name
+        self.name_label = tk.Label(
+            top_row,
+            bg='#3a3a3a',
+            fg='white',
+            font=('Courier', 16, 'bold'),
+            wraplength=500,
+            justify='left',
+            anchor='w'
+        )
+        self.name_label.pack(side='left', fill='x', expand=True)
+        
+        # Level badge
+        self.level_label = tk.Label(
+            top_row,
+            bg='#4a6a8a',
+            fg='white',
+            font=('Courier', 12, 'bold'),
+            padx=15,
+            pady=5
+        )
+        self.level_label.pack(side='left', padx=10)
+        
+        # Class row
+        self.class_label = tk.Label(
+            content,
+            bg='#3a3a3a',
+            fg='#cccccc',
+            font=('Courier', 12)
+        )
+        self.class_label.pack(anchor='w', pady=5)
+        
+        # Inventory info
+        self.inventory_label = tk.Label(
+            content,
+            bg='#3a3a3a',
+            fg='#888888',
+            font=('Courier', 10)
+        )
+        self.inventory_label.pack(anchor='w', pady=5)
+        
+        # Buttons row
+        button_row = tk.Frame(content, bg='#3a3a3a')
+        button_row.pack(fill='x', pady=(10, 0))
+        
+        button_config = {
+            'font': ('Courier', 10),
+            'width': 12,
+            'height': 1,
+            'relief': 'flat',
+            'bd': 0,
+            'highlightthickness': 0
+        }
+        
+        # Manage Inventory button
+        tk.Button(
+            button_row,
+            text="Manage Inventory",
+            command=lambda: self.screen.show_inventory_management(self.item, self.screen.index_of(self.item)),
+            bg='#4a7a8a',
+            **button_config
+        ).pack(side='left', padx=5)
+        
+        # Edit button
+        tk.Button(
+            button_row,
+            text="Edit",
+            command=lambda: self.screen.show_edit_character_dialog(self.item, self.screen.index_of(self.item)),
+            bg='#4a4a4a',
+            **button_config
+        ).pack(side='left', padx=5)
+        
+        # Delete button
+        tk.Button(
+            button_row,
+            text="Delete",
+            command=lambda: self.screen.delete_character(self.screen.index_of(self.item)),
+            bg='#8a4a4a',
+            **button_config
+        ).pack(side='left', padx=5)
+
+    def populate(self, character):
+        self.name_label.config(text=character.name)
+        self.level_label.config(text=f"Level {character.level}")
+        self.class_label.config(text=f"⚔️ {character.character_class}")
+        self.inventory_label.config(text=f"🎒 Inventory: {len(character.curr_inventory)} item(s)")
+
+
+class InventoryCard(Card):
+    """
+    Inventory row for one stack of identical items, bound to an (item, count) pair
+    """
+    def __init__(self, parent, on_remove):
+        """
+        Args:
+            parent: Parent widget (the list's inner frame)
+            on_remove (Callable[[Item], None]): Called with the item when Remove is pressed
+        """
+        self.on_remove = on_remove
+        super().__init__(parent)
+
+    def build(self):
+        item_frame = tk.Frame(self, bg='#3a3a3a', relief='raised', bd=1)
+        item_frame.pack(fill='x', pady=5)
+        
+        content = tk.Frame(item_frame, bg='#3a3a3a')
+        content.pack(fill='x', padx=10, pady=8)
+        
+        # Item name and rarity
+        info_frame = tk.Frame(content, bg='#3a3a3a')
+        info_frame.pack(fill='x')
+        
+        self.name_label = tk.Label(
+            info_frame,
+            bg='#3a3a3a',
+            fg='white',
+            font=('Courier', 12, 'bold')
+        )
+        self.name_label.pack(side='left')
+        
+        self.rarity_label = tk.Label(
+            info_frame,
+            bg='#3a3a3a',
+            fg='#888888',
+            font=('Courier', 10)
+        )
+        self.rarity_label.pack(side='left')
+        
+        # Damage
+        self.damage_label = tk.Label(
+            info_frame,
+            bg='#3a3a3a',
+            fg='#ffaa00',
+            font=('Courier', 10)
+        )
+        self.damage_label.pack(side='left')
+        
+        # Description; only packed for items that have one
+        self.desc_label = tk.Label(
+            content,
+            bg='#3a3a3a',
+            fg='#cccccc',
+            font=('Courier', 9),
+            wraplength=500,
+            justify='left'
+        )
+        
+        # Delete button
+        self.remove_button = tk.Button(
+            content,
+            text="Remove",
+            command=lambda: self.on_remove(self.item[0]),
+            bg='#8a4a4a',
+            font=('Courier', 9),
+            relief='flat',
+            highlightthickness=0,
+            padx=10,
+            pady=2
+        )
+        self.remove_button.pack(anchor='w', pady=(5, 0))
+
+    def populate(self, stack):
+        item, count = stack
+        self.name_label.config(text=item.name if count == 1 else f"{item.name} ×{count}")
+        self.rarity_label.config(text=f"  •  {item.rarity}")
+        self.damage_label.config(text=f"  •  Damage: {item.damage}")
+        if item.description:
+            self.desc_label.config(text=item.description)
+            self.desc_label.pack(anchor='w', pady=(5, 0), before=self.remove_button)
+        else:
+            self.desc_label.pack_forget()
+
 
 class CharacterScreen(BaseScreen):
     def create_widgets(self):
@@ -39,10 +240,9 @@ class CharacterScreen(BaseScreen):
         ).pack(side='left', padx=20, pady=15)
         
         # World clock
-        world_time = self.app.world_clock.get_current_time().get_fulltime()
         tk.Label(
             header_frame,
-            text=f"World Clock: {world_time}",
+            textvariable=self.app.clock_text,
             bg='#1a1a1a',
             fg='#00ff00',
             font=('Courier', 10)
@@ -79,6 +279,21 @@ class CharacterScreen(BaseScreen):
         # Characters list section
         self.characters_container = tk.Frame(content_frame, bg='#2b2b2b')
         self.characters_container.pack(fill='both', expand=True)
+
+        # No characters message, shown instead of the list
+        self.empty_label = tk.Label(
+            self.characters_container,
+            text="No characters yet! Create your first character to get started.",
+            bg='#2b2b2b',
+            fg='#888888',
+            font=('Courier', 14)
+        )
+
+        # Cards are kept and rebound across refreshes
+        self.character_list = CardList(
+            self.characters_container,
+            lambda parent: CharacterCard(parent, self)
+        )
         
         # Display characters
         self.refresh_characters_list()
@@ -88,147 +303,48 @@ class CharacterScreen(BaseScreen):
         Refresh the list of characters
         """
         
-        # Clear existing widgets
-        for widget in self.characters_container.winfo_children():
-            widget.destroy()
-        
-        characters = self.app.current_user.characters
-        
-        if not characters:
-            # No characters message
-            tk.Label(
-                self.characters_container,
-                text="No characters yet! Create your first character to get started.",
-                bg='#2b2b2b',
-                fg='#888888',
-                font=('Courier', 14)
-            ).pack(pady=50)
+        # Display each character
+        self.character_list.set_items(self.app.current_user.characters)
+        self.update_list_state()
+
+    def is_affected_by(self, change):
+        """
+        The cards show each character's fields and inventory size
+        """
+        return isinstance(change.entity, (Character, Inventory))
+
+    def update_list_state(self):
+        """
+        Schedule the swap between the character list and the empty message
+        """
+        self.mark_dirty("list_state", self.render_list_state)
+
+    def render_list_state(self):
+        """
+        Swap between the character list and the empty message
+        """
+        if not self.character_list.count():
+            self.character_list.pack_forget()
+            self.empty_label.pack(pady=50)
         else:
-            # Create scrollable frame for characters
-            canvas = tk.Canvas(self.characters_container, bg='#2b2b2b', highlightthickness=0)
-            scrollbar = tk.Scrollbar(self.characters_container, orient="vertical", command=canvas.yview)
-            scrollable_frame = tk.Frame(canvas, bg='#2b2b2b')
-            
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-            )
-            
-            canvas_window = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
-            
-            # Bind canvas width to scrollable_frame width
-            def configure_scroll_region(event):
-                canvas.configure(scrollregion=canvas.bbox("all"))
-                canvas.itemconfig(canvas_window, width=event.width)
-            
-            canvas.bind("<Configure>", configure_scroll_region)
-            
-            canvas.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
-            
-            # Display each character
-            for idx, character in enumerate(characters):
-                self.create_character_card(scrollable_frame, character, idx)
-    
-    def create_character_card(self, parent, character, idx):
+            self.empty_label.pack_forget()
+            self.character_list.pack(fill='both', expand=True)
+
+    def update_character_card(self, character):
         """
-        Create a card widget for a character
+        Schedule a character's card to be relabelled, once for however many
+        inventory edits were made in this event-loop turn
         """
-        
-        # Card frame
-        card = tk.Frame(parent, bg='#3a3a3a', relief='raised', bd=2)
-        card.pack(fill='x', pady=10, padx=5)
-        
-        # Main content frame
-        content = tk.Frame(card, bg='#3a3a3a')
-        content.pack(fill='both', expand=True, padx=15, pady=10)
-        
-        # Top row: Name and Level
-        top_row = tk.Frame(content, bg='#3a3a3a')
-        top_row.pack(fill='x', pady=(0, 5))
-        
-        # Character name
-        tk.Label(
-            top_row,
-            text=character.name,
-            bg='#3a3a3a',
-            fg='white',
-            font=('Courier', 16, 'bold'),
-            wraplength=500,
-            justify='left',
-            anchor='w'
-        ).pack(side='left', fill='x', expand=True)
-        
-        # Level badge
-        tk.Label(
-            top_row,
-            text=f"Level {character.level}",
-            bg='#4a6a8a',
-            fg='white',
-            font=('Courier', 12, 'bold'),
-            padx=15,
-            pady=5
-        ).pack(side='left', padx=10)
-        
-        # Class row
-        tk.Label(
-            content,
-            text=f"⚔️ {character.character_class}",
-            bg='#3a3a3a',
-            fg='#cccccc',
-            font=('Courier', 12)
-        ).pack(anchor='w', pady=5)
-        
-        # Inventory info
-        inventory_count = len(character.curr_inventory.items)
-        tk.Label(
-            content,
-            text=f"🎒 Inventory: {inventory_count} item(s)",
-            bg='#3a3a3a',
-            fg='#888888',
-            font=('Courier', 10)
-        ).pack(anchor='w', pady=5)
-        
-        # Buttons row
-        button_row = tk.Frame(content, bg='#3a3a3a')
-        button_row.pack(fill='x', pady=(10, 0))
-        
-        button_config = {
-            'font': ('Courier', 10),
-            'width': 12,
-            'height': 1,
-            'relief': 'flat',
-            'bd': 0,
-            'highlightthickness': 0
-        }
-        
-        # Manage Inventory button
-        tk.Button(
-            button_row,
-            text="Manage Inventory",
-            command=lambda c=character, i=idx: self.show_inventory_management(c, i),
-            bg='#4a7a8a',
-            **button_config
-        ).pack(side='left', padx=5)
-        
-        # Edit button
-        tk.Button(
-            button_row,
-            text="Edit",
-            command=lambda c=character, i=idx: self.show_edit_character_dialog(c, i),
-            bg='#4a4a4a',
-            **button_config
-        ).pack(side='left', padx=5)
-        
-        # Delete button
-        tk.Button(
-            button_row,
-            text="Delete",
-            command=lambda i=idx: self.delete_character(i),
-            bg='#8a4a4a',
-            **button_config
-        ).pack(side='left', padx=5)
+        self.mark_dirty(("card", id(character)), lambda: self.character_list.update_item(character))
+
+    def index_of(self, character):
+        """
+        Returns a character's position in the user's character list
+        """
+        for idx, c in enumerate(self.app.current_user.characters):
+            if c is character:
+                return idx
+        raise ValueError(f"'{character.name}' is not in the character list")
     
     def show_create_character_dialog(self):
         """
@@ -329,19 +445,16 @@ class CharacterScreen(BaseScreen):
                 level=level
             )
             
-            self.app.current_user.characters.append(character)
+            self.app.current_user.add_character(character)
+            self.app.save_user()
             
             messagebox.showinfo("Success", f"Character '{name}' created!")
             dialog.destroy()
             
-            # Refresh the characters list
-            self.refresh_characters_list()
-            
-            # Refresh main menu to update character count
-            if "main_menu" in self.app.screens:
-                self.app.screens["main_menu"].destroy()
-                del self.app.screens["main_menu"]
-        
+            # Add just the new character's card
+            self.character_list.insert(self.index_of(character), character)
+            self.update_list_state()
+                    
         name_entry.bind('<Return>', lambda e: do_create())
         
         tk.Button(
@@ -461,15 +574,14 @@ class CharacterScreen(BaseScreen):
                 return
             
             # Update character
-            character.name = name
-            character.level = level
-            character.character_class = class_var.get()
+            character.update_character(name=name, character_class=class_var.get(), level=level)
+            self.app.save_user()
             
             messagebox.showinfo("Success", "Character updated!")
             dialog.destroy()
             
-            # Refresh the characters list
-            self.refresh_characters_list()
+            # Relabel just the edited character's card
+            self.character_list.update_item(character)
         
         name_entry.bind('<Return>', lambda e: do_save())
         
@@ -506,20 +618,17 @@ class CharacterScreen(BaseScreen):
         if messagebox.askyesno(
             "Confirm Delete",
             f"Are you sure you want to delete '{character.name}'?\n\n"
-            f"This will also delete {len(character.curr_inventory.items)} item(s) in their inventory.\n\n"
+            f"This will also delete {len(character.curr_inventory)} item(s) in their inventory.\n\n"
             "This action cannot be undone!"
         ):
-            self.app.current_user.characters.pop(char_idx)
+            self.app.current_user.remove_character(char_idx)
+            self.app.save_user()
             messagebox.showinfo("Success", "Character deleted!")
             
-            # Refresh the characters list
-            self.refresh_characters_list()
-            
-            # Refresh main menu to update character count
-            if "main_menu" in self.app.screens:
-                self.app.screens["main_menu"].destroy()
-                del self.app.screens["main_menu"]
-    
+            # Remove just the deleted character's card
+            self.character_list.remove(char_idx)
+            self.update_list_state()
+                
     def show_inventory_management(self, character, char_idx):
         """
         Show inventory management dialog
@@ -559,112 +668,45 @@ class CharacterScreen(BaseScreen):
         inventory_container = tk.Frame(dialog, bg='#2b2b2b')
         inventory_container.pack(fill='both', expand=True, padx=20, pady=(0, 20))
         
-        def refresh_inventory():
-            # Clear existing widgets
-            for widget in inventory_container.winfo_children():
-                widget.destroy()
-            
-            if not character.curr_inventory.items:
-                tk.Label(
-                    inventory_container,
-                    text="No items in inventory",
-                    bg='#2b2b2b',
-                    fg='#888888',
-                    font=('Courier', 12)
-                ).pack(pady=50)
+        # No items message, shown instead of the list
+        empty_label = tk.Label(
+            inventory_container,
+            text="No items in inventory",
+            bg='#2b2b2b',
+            fg='#888888',
+            font=('Courier', 12)
+        )
+        
+        # Item cards are kept and rebound while the dialog is open
+        item_list = CardList(
+            inventory_container,
+            lambda parent: InventoryCard(parent, remove_item)
+        )
+        
+        def render_inventory():
+            if not len(character.curr_inventory):
+                item_list.pack_forget()
+                empty_label.pack(pady=50)
             else:
-                # Create scrollable frame
-                canvas = tk.Canvas(inventory_container, bg='#2b2b2b', highlightthickness=0)
-                scrollbar = tk.Scrollbar(inventory_container, orient="vertical", command=canvas.yview)
-                scrollable_frame = tk.Frame(canvas, bg='#2b2b2b')
-                
-                scrollable_frame.bind(
-                    "<Configure>",
-                    lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-                )
-                
-                canvas_window = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-                canvas.configure(yscrollcommand=scrollbar.set)
-                
-                def configure_scroll_region(event):
-                    canvas.configure(scrollregion=canvas.bbox("all"))
-                    canvas.itemconfig(canvas_window, width=event.width)
-                
-                canvas.bind("<Configure>", configure_scroll_region)
-                
-                canvas.pack(side="left", fill="both", expand=True)
-                scrollbar.pack(side="right", fill="y")
-                
-                # Display each item
-                for idx, item in enumerate(character.curr_inventory.items):
-                    item_frame = tk.Frame(scrollable_frame, bg='#3a3a3a', relief='raised', bd=1)
-                    item_frame.pack(fill='x', pady=5)
-                    
-                    content = tk.Frame(item_frame, bg='#3a3a3a')
-                    content.pack(fill='x', padx=10, pady=8)
-                    
-                    # Item name and rarity
-                    info_frame = tk.Frame(content, bg='#3a3a3a')
-                    info_frame.pack(fill='x')
-                    
-                    tk.Label(
-                        info_frame,
-                        text=item.name,
-                        bg='#3a3a3a',
-                        fg='white',
-                        font=('Courier', 12, 'bold')
-                    ).pack(side='left')
-                    
-                    tk.Label(
-                        info_frame,
-                        text=f"  •  {item.rarity}",
-                        bg='#3a3a3a',
-                        fg='#888888',
-                        font=('Courier', 10)
-                    ).pack(side='left')
-                    
-                    # Damage
-                    tk.Label(
-                        info_frame,
-                        text=f"  •  Damage: {item.damage}",
-                        bg='#3a3a3a',
-                        fg='#ffaa00',
-                        font=('Courier', 10)
-                    ).pack(side='left')
-                    
-                    # Description
-                    if item.description:
-                        tk.Label(
-                            content,
-                            text=item.description,
-                            bg='#3a3a3a',
-                            fg='#cccccc',
-                            font=('Courier', 9),
-                            wraplength=500,
-                            justify='left'
-                        ).pack(anchor='w', pady=(5, 0))
-                    
-                    # Delete button
-                    tk.Button(
-                        content,
-                        text="Remove",
-                        command=lambda i=item: remove_item(i),
-                        bg='#8a4a4a',
-                        font=('Courier', 9),
-                        relief='flat',
-                        highlightthickness=0,
-                        padx=10,
-                        pady=2
-                    ).pack(anchor='w', pady=(5, 0))
+                empty_label.pack_forget()
+                item_list.pack(fill='both', expand=True)
+            
+            # Display each distinct item once, with how many are held
+            item_list.set_items(character.curr_inventory.stacks())
         
         def remove_item(item):
             if messagebox.askyesno("Confirm", f"Remove '{item.name}' from inventory?"):
                 character.curr_inventory.remove_inventory(item)
+                self.app.save_user()
                 refresh_inventory()
-                # Refresh main character list
-                self.refresh_characters_list()
+                # Relabel the character's card in the main list
+                self.update_character_card(character)
+        
+        def refresh_inventory():
+            # Coalesced with other edits made before the event loop goes idle
+            self.app.redraw.mark_dirty(dialog, "inventory", render_inventory)
         
-        refresh_inventory()
+        render_inventory()
         
         # Store refresh function so add item dialog can use it
         dialog.refresh_inventory = refresh_inventory
@@ -783,8 +825,8 @@ class CharacterScreen(BaseScreen):
                 messagebox.showerror("Error", "Please enter a valid damage number!")
                 return
             
-            # Create item matching UML structure
-            item = Item(
+            # Shared item definition from the catalog
+            item = default_catalog.get(
                 name=name,
                 rarity=rarity_var.get(),
                 damage=damage,
@@ -793,6 +835,7 @@ class CharacterScreen(BaseScreen):
             
             # Use proper method from Inventory class
             character.curr_inventory.add_inventory(item)
+            self.app.save_user()
             
             messagebox.showinfo("Success", f"'{name}' added to inventory!")
             dialog.destroy()
@@ -801,8 +844,8 @@ class CharacterScreen(BaseScreen):
             if hasattr(parent_dialog, 'refresh_inventory'):
                 parent_dialog.refresh_inventory()
             
-            # Refresh main character list
-            self.refresh_characters_list()
+            # Relabel the character's card in the main list
+            self.update_character_card(character)
         
         name_entry.bind('<Return>', lambda e: do_add())
         
@@ -131,13 +131,10 @@ class LoginScreen(BaseScreen):
                 messagebox.showerror("Error", "Please enter a username!")
                 return
 
-            if username in self.app.users:
-                self.app.current_user = self.app.users[username]
-
-                # Refresh screen on login
-                if "main_menu" in self.app.screens:
-                    self.app.screens["main_menu"].destroy()
-                    del self.app.screens["main_menu"]
+            user = self.app.get_user(username)
+            if user is not None:
+                # Screens cached for another user are dropped on login
+                self.app.switch_user(user)
 
                 messagebox.showinfo("Success", f"Welcome back, {username}!")
                 self.navigate_to("main_menu")
@@ -217,7 +214,7 @@ class LoginScreen(BaseScreen):
                     "Error", "Username must be at least 3 characters!")
                 return
 
-            if username in self.app.users:
+            if self.app.get_user(username) is not None:
                 messagebox.showerror("Error", "Username already exists!")
                 return
 
@@ -234,12 +231,8 @@ class LoginScreen(BaseScreen):
                 user_settings=settings
             )
 
-            if "main_menu" in self.app.screens:
-                self.app.screens["main_menu"].destroy()
-                del self.app.screens["main_menu"]
-
-            self.app.users[username] = user
-            self.app.current_user = user
+            self.app.add_user(user)
+            self.app.switch_user(user)
 
             messagebox.showinfo("Success", f"User '{username}' created!")
             self.navigate_to("main_menu")
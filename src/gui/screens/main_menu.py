@@ -5,6 +5,7 @@ Main Menu Screen for GuildQuest
 import tkinter as tk
 from tkinter import messagebox
 from gui.screens.base_screen import BaseScreen
+from models.changes import UPDATED
 
 class MainMenu(BaseScreen):
     def create_widgets(self):
@@ -28,10 +29,9 @@ class MainMenu(BaseScreen):
         ).pack(side='left', padx=20, pady=15)
         
         # World clock on right
-        world_time = self.app.world_clock.get_current_time().get_fulltime()
         tk.Label(
             header_frame,
-            text=f"World Clock: {world_time}",
+            textvariable=self.app.clock_text,
             bg='#1a1a1a',
             fg='#00ff00',
             font=('Courier', 12)
@@ -109,6 +109,15 @@ class MainMenu(BaseScreen):
             **button_config
         ).pack(pady=8)
         
+        # Real-time clock toggle
+        self.clock_button = tk.Button(
+            button_container,
+            text=self._clock_button_text(),
+            command=self.toggle_clock,
+            **button_config
+        )
+        self.clock_button.pack(pady=8)
+        
         # Settings
         tk.Button(
             button_container,
@@ -129,6 +138,12 @@ class MainMenu(BaseScreen):
             activebackground='#9a5a5a'
         ).pack(pady=8)
     
+    def is_affected_by(self, change):
+        """
+        The menu shows the user's campaign and character counts
+        """
+        return change.kind != UPDATED and change.owner is self.app.current_user
+    
     def show_character_management(self):
         """
         Navigate to character management screen
@@ -136,6 +151,24 @@ class MainMenu(BaseScreen):
         
         self.navigate_to("character")
     
+    def _clock_button_text(self):
+        """
+        Label for the real-time clock toggle based on the clock's state
+        """
+        if self.app.world_clock.is_running:
+            return "Pause Real-Time Clock"
+        return "Start Real-Time Clock"
+    
+    def toggle_clock(self):
+        """
+        Start or pause the world clock's real-time mode
+        """
+        if self.app.world_clock.is_running:
+            self.app.stop_clock()
+        else:
+            self.app.start_clock()
+        self.clock_button.config(text=self._clock_button_text())
+    
     # SHOW AVAILABLE REALMS WINDOW
     def show_realm_info(self):
         """
@@ -223,6 +256,18 @@ class MainMenu(BaseScreen):
                 bg='#3a3a3a',
                 fg='#00ff00',
                 font=('Courier', 10)
+            ).pack(anchor='w', padx=15, pady=5)
+            
+            # What the user can see here, from the registry's reverse index
+            campaigns_here = self.app.realms.campaigns_in(realm, self.app.current_user)
+            quests_here = self.app.realms.quest_count_in(realm, self.app.current_user)
+            
+            tk.Label(
+                realm_frame,
+                text=f"Campaigns Here: {len(campaigns_here)} | Quests Here: {quests_here}",
+                bg='#3a3a3a',
+                fg='#888888',
+                font=('Arial', 10)
             ).pack(anchor='w', padx=15, pady=(5, 10))
         
         # Close button
@@ -297,15 +342,26 @@ class MainMenu(BaseScreen):
                     messagebox.showerror("Error", "Values cannot be negative!")
                     return
                 
+                self.app.clear_triggered_events()
                 self.app.world_clock.advance(days=days, hours=hours, minutes=minutes)
                 new_time = self.app.world_clock.get_current_time()
-                
-                messagebox.showinfo("Success", f"Clock advanced!\nNew time: {new_time.get_fulltime()}")
+                self.app.update_clock_display()
+
+                # Summarize quests that started or ended while advancing
+                message = f"Clock advanced!\nNew time: {new_time.get_fulltime()}"
+                events = list(self.app.triggered_events)
+                if events:
+                    lines = [f"{when.get_fulltime()}: '{quest.name}' {'started' if kind == 'start' else 'ended'}"
+                             for kind, quest, campaign, when in events[:10]]
+                    # The deque only keeps the latest events; the count covers all of them
+                    if self.app.triggered_count > len(lines):
+                        lines.append(f"...and {self.app.triggered_count - len(lines)} more")
+                    message += "\n\nQuest events:\n" + "\n".join(lines)
+                    self.app.clear_triggered_events()
+
+                messagebox.showinfo("Success", message)
                 dialog.destroy()
                 
-                # Refresh the main menu to show updated time
-                self.app.refresh_screen("main_menu")
-                
             except ValueError:
                 messagebox.showerror("Error", "Please enter valid numbers!")
         
@@ -342,5 +398,5 @@ class MainMenu(BaseScreen):
         Logout and return to login screen
         """
         if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
-            self.app.current_user = None
+            self.app.switch_user(None)
             self.navigate_to("login")
\ No newline at end of file
@@ -4,14 +4,159 @@ Allows creating, viewing, editing, and deleting quest events within a campaign
 """
 
 import tkinter as tk
+from bisect import bisect_left, bisect_right
 from tkinter import messagebox, ttk
 from gui.screens.base_screen import BaseScreen
-from core import GameTime
-from utils import convert_to_realm_time
+from gui.widgets import Card, VirtualList
+from core import GameTime, GameDuration
+from utils import convert_to_realm_time, localize_quests
+
+# Fixed height of a quest card row in the virtualized list, in pixels
+QUEST_ROW_HEIGHT = 190
+
+# Window shown by each timeline view, starting from the beginning of the current day
+VIEW_WINDOWS = {
+    "day": GameDuration(days=1),
+    "week": GameDuration(days=7),
+    "month": GameDuration(days=30),
+    "year": GameDuration(days=365)
+}
+
+
+class QuestCard(Card):
+    """
+    Quest card row for the virtualized quest list, rebound to whichever
+    quest scrolls into the row
+    """
+    def __init__(self, parent, screen):
+        """
+        Args:
+            parent: Parent widget (the list's canvas)
+            screen (QuestScreen): Screen handling the card's Edit/Delete buttons
+        """
+        self.screen = screen
+        super().__init__(parent)
+
+    def build(self):
+        # Card frame
+        card = tk.Frame(self, bg='#3a3a3a', relief='raised', bd=2)
+        card.pack(fill='both', expand=True, pady=8, padx=5)
+
+        # Main content frame
+        content = tk.Frame(card, bg='#3a3a3a')
+        content.pack(fill='both', expand=True, padx=15, pady=12)
+
+        # Quest title; one line so every card has the same height
+        self.title_label = tk.Label(
+            content,
+            bg='#3a3a3a',
+            font=('Courier', 14, 'bold'),
+            justify='left',
+            anchor='w'
+        )
+        self.title_label.pack(fill='x', pady=(0, 8))
+
+        # Time info - stacked vertically
+        time_container = tk.Frame(content, bg='#3a3a3a')
+        time_container.pack(fill='x', pady=5)
+
+        # World Clock time
+        self.world_label = tk.Label(
+            time_container,
+            bg='#3a3a3a',
+            fg='#00ff00',
+            font=('Courier', 11)
+        )
+        self.world_label.pack(anchor='w')
+
+        # Realm local time (if different) or realm name - appears below world time
+        self.realm_label = tk.Label(
+            time_container,
+            bg='#3a3a3a',
+            font=('Courier', 11)
+        )
+        self.realm_label.pack(anchor='w', pady=(2, 0))
+
+        # End time if specified; left blank otherwise
+        self.end_label = tk.Label(
+            content,
+            bg='#3a3a3a',
+            fg='#888888',
+            font=('Courier', 9)
+        )
+        self.end_label.pack(anchor='w', pady=(2, 5))
+
+        # Participants and items info
+        self.info_label = tk.Label(
+            content,
+            bg='#3a3a3a',
+            fg='#888888',
+            font=('Courier', 9)
+        )
+        self.info_label.pack(anchor='w', pady=(0, 10))
+
+        # Buttons row
+        button_row = tk.Frame(content, bg='#3a3a3a')
+        button_row.pack(fill='x')
+
+        button_config = {
+            'font': ('Courier', 9),
+            'width': 10,
+            'height': 1,
+            'relief': 'flat',
+            'bd': 0,
+            'highlightthickness': 0
+        }
+
+        # Edit button
+        tk.Button(
+            button_row,
+            text="Edit",
+            command=lambda: self.screen.show_edit_quest_dialog(self.item),
+            bg='#4a7a8a',
+            **button_config
+        ).pack(side='left', padx=5)
+
+        # Delete button
+        tk.Button(
+            button_row,
+            text="Delete",
+            command=lambda: self.screen.delete_quest(self.item.quest_id),
+            bg='#8a4a4a',
+            **button_config
+        ).pack(side='left', padx=5)
+
+    def populate(self, quest):
+        self.title_label.config(text=quest.name)
+        self.world_label.config(text=f"🌍 World Time: {quest.time.get_fulltime()}")
+
+        if quest.c_realm.time_rule != 0:
+            # Memo hit: the list localized the rows entering view in one batch
+            local_time = convert_to_realm_time(quest.time, quest.c_realm)
+            self.realm_label.config(
+                text=f"🏰 Local Time ({quest.c_realm.name}): {local_time.get_fulltime()}", fg='#ffaa00')
+        else:
+            self.realm_label.config(text=f"🏰 Realm: {quest.c_realm.name}", fg='#cccccc')
+
+        if quest.end is not None:
+            self.end_label.config(
+                text=f"⏱️  Ends: {quest.end_time} (lasts {quest.get_duration().get_fulltime()})")
+        else:
+            self.end_label.config(text="")
+
+        info_items = []
+        if quest.partaking_users:
+            info_items.append(f"👥 {len(quest.partaking_users)} participant(s)")
+        if quest.reward_items:
+            info_items.append(f"🎁 {len(quest.reward_items)} reward(s)")
+        if quest.required_items:
+            info_items.append(
+                f"📦 {len(quest.required_items)} required item(s)")
+        self.info_label.config(text="  •  ".join(info_items))
 
 
 class QuestScreen(BaseScreen):
-    def __init__(self, parent, app, campaign, campaign_idx):
+    def __init__(self, parent, app, campaign):
         """
         Initialize quest management screen for a specific campaign
 
@@ -19,10 +164,8 @@ class QuestScreen(BaseScreen):
             parent: Parent widget
             app: Main app reference
             campaign: The campaign to manage quests for
-            campaign_idx: Index of the campaign in user's campaigns list
         """
         self.campaign = campaign
-        self.campaign_idx = campaign_idx
         super().__init__(parent, app)
 
     def create_widgets(self):
@@ -56,10 +199,9 @@ class QuestScreen(BaseScreen):
         ).pack(side='left', padx=20, pady=15)
 
         # World clock
-        world_time = self.app.world_clock.get_current_time().get_fulltime()
         tk.Label(
             header_frame,
-            text=f"World Clock: {world_time}",
+            textvariable=self.app.clock_text,
             bg='#1a1a1a',
             fg='#00ff00',
             font=('Courier', 12)
@@ -77,13 +219,14 @@ class QuestScreen(BaseScreen):
         info_frame = tk.Frame(top_section, bg='#2b2b2b')
         info_frame.pack(side='left')
 
-        tk.Label(
+        self.count_label = tk.Label(
             info_frame,
             text=f"Quest Events ({len(self.campaign.quests)})",
             bg='#2b2b2b',
             fg='white',
             font=('Arial', 20, 'bold')
-        ).pack(side='left')
+        )
+        self.count_label.pack(side='left')
 
         tk.Label(
             info_frame,
@@ -134,7 +277,7 @@ class QuestScreen(BaseScreen):
                 text=text,
                 variable=self.view_mode,
                 value=mode,
-                command=self.refresh_quest_list,
+                command=lambda: self.mark_dirty("list", self.refresh_quest_list),
                 bg='#2b2b2b',
                 fg='white',
                 selectcolor='#4a4a4a',
@@ -147,6 +290,22 @@ class QuestScreen(BaseScreen):
         self.quests_container = tk.Frame(content_frame, bg='#2b2b2b')
         self.quests_container.pack(fill='both', expand=True)
 
+        # Shown instead of the list when there is nothing to list
+        self.empty_label = tk.Label(
+            self.quests_container,
+            bg='#2b2b2b',
+            fg='#888888',
+            font=('Courier', 14)
+        )
+
+        # Only the cards in view are built; they are rebound as the list scrolls
+        self.quest_list = VirtualList(
+            self.quests_container,
+            QUEST_ROW_HEIGHT,
+            make_card=lambda parent: QuestCard(parent, self),
+            prepare=localize_quests
+        )
+
         # Display quests
         self.refresh_quest_list()
 
@@ -154,241 +313,167 @@ class QuestScreen(BaseScreen):
         """
         Refresh the list of quests based on current view mode
         """
-        
-        # Clear existing widgets
-        for widget in self.quests_container.winfo_children():
-            widget.destroy()
-
-        quests = self.campaign.quests
-
-        if not quests:
-            # No quests message
-            tk.Label(
-                self.quests_container,
-                text="No quest events yet! Create your first quest to get started.",
-                bg='#2b2b2b',
-                fg='#888888',
-                font=('Courier', 14)
-            ).pack(pady=50)
-            return
-
-        # Sort quests by time
-        sorted_quests = sorted(quests, key=lambda q: q.time.to_total_minutes())
 
-        # Filter based on view mode
+        # Filter based on view mode; the campaign's timeline index is already sorted
         view_mode = self.view_mode.get()
-        if view_mode != "all":
-            sorted_quests = self.filter_quests_by_view(
-                sorted_quests, view_mode)
-
-            if not sorted_quests:
-                tk.Label(
-                    self.quests_container,
-                    text=f"No quests in selected {view_mode} view.",
-                    bg='#2b2b2b',
-                    fg='#888888',
-                    font=('Courier', 14)
-                ).pack(pady=50)
-                return
-
-        # Create scrollable frame for quests
-        canvas = tk.Canvas(self.quests_container,
-                           bg='#2b2b2b', highlightthickness=0)
-        scrollbar = tk.Scrollbar(
-            self.quests_container, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg='#2b2b2b')
+        self.view_bounds = self.get_view_bounds(view_mode)
+        sorted_quests = self.filter_quests_by_view(view_mode)
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Start ticks of the listed quests, parallel to the list, so single
+        # quests can be found, inserted and removed by bisection
+        self.shown_ticks = [q.time.ticks for q in sorted_quests]
+        self.quest_list.set_items(sorted_quests)
+        self.update_list_state()
 
-        canvas_window = canvas.create_window(
-            (0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+    def on_show(self):
+        """
+        Re-filter the list if the world clock moved the view window since the last visit
+        """
+        if self.view_bounds != self.get_view_bounds(self.view_mode.get()):
+            self.mark_dirty("list", self.refresh_quest_list)
 
-        # Bind canvas width to scrollable_frame width so cards expand to fill
-        def configure_scroll_region(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            # Make the window width match the canvas width
-            canvas.itemconfig(canvas_window, width=event.width)
+    def is_affected_by(self, change):
+        """
+        The screen shows this campaign and its quests
+        """
+        return change.entity is self.campaign or change.owner is self.campaign
 
-        canvas.bind("<Configure>", configure_scroll_region)
+    def update_list_state(self):
+        """
+        Schedule the quest count and empty message to be updated, once for
+        however many quests were added or removed in this event-loop turn
+        """
+        self.mark_dirty("list_state", self.render_list_state)
 
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+    def render_list_state(self):
+        """
+        Update the quest count, and swap between the list and the empty message
+        """
+        self.count_label.config(text=f"Quest Events ({self.campaign.get_quest_count()})")
 
-        # Display each quest
-        for idx, quest in enumerate(sorted_quests):
-            original_idx = self.campaign.quests.index(quest)
-            self.create_quest_card(scrollable_frame, quest, original_idx)
+        if self.quest_list.count():
+            self.empty_label.pack_forget()
+            self.quest_list.pack(fill='both', expand=True)
+        elif not self.campaign.get_quest_count():
+            # No quests message
+            self.show_empty("No quest events yet! Create your first quest to get started.")
+        else:
+            self.show_empty(f"No quests in selected {self.view_mode.get()} view.")
 
-    def filter_quests_by_view(self, quests: list, view_mode: str):
+    def show_empty(self, message: str):
         """
-        Filter quests based on timeline view mode
+        Show a message in place of the quest list
 
         Args:
-            quests (list): List of quest events
-            view_mode (str): Type of view mode to show quests (quests in a week, month, etc.)
+            message (str): Message to show
         """
-        if view_mode == "all":
-            return quests
-
-        # Get the target time range (you'd typically ask user for this)
-        # For now, we'll use current world clock time as reference
-        current_time = self.app.world_clock.get_current_time()
-        current_day = current_time.get_day()
+        self.quest_list.pack_forget()
+        self.empty_label.config(text=message)
+        self.empty_label.pack(pady=50)
 
-        filtered = []
+    # Keyed updates: touch one card instead of rebuilding the list
 
-        if view_mode == "day":
-            # Show quests for current day (or you could prompt for specific day)
-            filtered = [q for q in quests if q.time.get_day() == current_day]
+    def find_shown_quest(self, quest, ticks: int) -> int:
+        """
+        Find a quest's position in the list by bisecting on its start tick
 
-        elif view_mode == "week":
-            # Show quests for current week (7 days from current day)
-            week_start = current_day
-            week_end = current_day + 6
-            filtered = [q for q in quests if week_start <=
-                        q.time.get_day() <= week_end]
+        Args:
+            quest (Quest_Event): Quest to find
+            ticks (int): Start tick the quest was listed under
 
-        elif view_mode == "month":
-            # Show quests for current month (30 days from current day)
-            month_start = current_day
-            month_end = current_day + 29
-            filtered = [q for q in quests if month_start <=
-                        q.time.get_day() <= month_end]
+        Returns:
+            int: Position in the list, or -1 if it is not listed
+        """
+        lo = bisect_left(self.shown_ticks, ticks)
+        hi = bisect_right(self.shown_ticks, ticks, lo=lo)
 
-        elif view_mode == "year":
-            # Show quests for current year (365 days from current day)
-            year_start = current_day
-            year_end = current_day + 364
-            filtered = [q for q in quests if year_start <=
-                        q.time.get_day() <= year_end]
+        # Only quests sharing the same start tick need an identity scan
+        for i in range(lo, hi):
+            if self.quest_list.item_at(i) is quest:
+                return i
+        return -1
 
-        return filtered
+    def show_quest(self, quest):
+        """
+        Insert a new quest's card at its sorted position, if the current view includes it
 
-    def create_quest_card(self, parent, quest, idx):
+        Args:
+            quest (Quest_Event): Quest to show
+        """
+        ticks = quest.time.ticks
+        bounds = self.view_bounds
+        if bounds is None or bounds[0] <= ticks < bounds[1]:
+            # After quests with the same start tick, as in the campaign's timeline
+            pos = bisect_right(self.shown_ticks, ticks)
+            self.shown_ticks.insert(pos, ticks)
+            self.quest_list.insert(pos, quest)
+        self.update_list_state()
+
+    def hide_quest(self, quest, ticks: int):
         """
-        Create a card widget for a quest
+        Remove a quest's card from the list
 
         Args:
-            parent (Frame): Parent window for where the card will populate
-            quest (Quest_Event): Indiivdual quest to create the card for
-            idx (int): Index for specific quest
+            quest (Quest_Event): Quest to remove
+            ticks (int): Start tick the quest was listed under
         """
-        
-        # Card frame
-        card = tk.Frame(parent, bg='#3a3a3a', relief='raised', bd=2)
-        card.pack(fill='x', pady=8, padx=5)
+        pos = self.find_shown_quest(quest, ticks)
+        if pos >= 0:
+            del self.shown_ticks[pos]
+            self.quest_list.remove(pos)
+        self.update_list_state()
 
-        # Main content frame
-        content = tk.Frame(card, bg='#3a3a3a')
-        content.pack(fill='both', expand=True, padx=15, pady=12)
+    def update_quest_card(self, quest, old_ticks: int):
+        """
+        Relabel an edited quest's card, moving it only if its start time changed
 
-        # Quest title
-        title_label = tk.Label(
-            content,
-            text=quest.name,
-            bg='#3a3a3a',
-            font=('Courier', 14, 'bold'),
-            wraplength=600,
-            justify='left',
-            anchor='w'
-        )
-        title_label.pack(fill='x', pady=(0, 8))
+        Args:
+            quest (Quest_Event): Edited quest
+            old_ticks (int): Start tick before the edit
+        """
+        if quest.time.ticks != old_ticks:
+            self.hide_quest(quest, old_ticks)
+            self.show_quest(quest)
+            return
 
-        # Time info - stacked vertically
-        time_container = tk.Frame(content, bg='#3a3a3a')
-        time_container.pack(fill='x', pady=5)
+        pos = self.find_shown_quest(quest, old_ticks)
+        if pos >= 0:
+            self.quest_list.update_at(pos)
 
-        # World Clock time
-        tk.Label(
-            time_container,
-            text=f"🌍 World Time: {quest.time.get_fulltime()}",
-            bg='#3a3a3a',
-            fg='#00ff00',
-            font=('Courier', 11)
-        ).pack(anchor='w')
+    def get_view_bounds(self, view_mode: str):
+        """
+        Get the start ticks covered by a timeline view
 
-        # Realm local time (if different) - appears below world time
-        if quest.c_realm.time_rule != 0:
-            local_time = convert_to_realm_time(quest.time, quest.c_realm)
-            tk.Label(
-                time_container,
-                text=f"🏰 Local Time ({quest.c_realm.name}): {local_time.get_fulltime()}",
-                bg='#3a3a3a',
-                fg='#ffaa00',
-                font=('Courier', 11)
-            ).pack(anchor='w', pady=(2, 0))
-        else:
-            tk.Label(
-                time_container,
-                text=f"🏰 Realm: {quest.c_realm.name}",
-                bg='#3a3a3a',
-                fg='#cccccc',
-                font=('Courier', 11)
-            ).pack(anchor='w', pady=(2, 0))
-
-        # End time if specified
-        if quest.end_time != "N/A":
-            tk.Label(
-                content,
-                text=f"⏱️  Ends: {quest.end_time}",
-                bg='#3a3a3a',
-                fg='#888888',
-                font=('Courier', 9)
-            ).pack(anchor='w', pady=(2, 5))
+        Args:
+            view_mode (str): Type of view mode (day, week, etc.)
 
-        # Participants and items info
-        info_items = []
-        if quest.partaking_users:
-            info_items.append(f"👥 {len(quest.partaking_users)} participant(s)")
-        if quest.reward_items:
-            info_items.append(f"🎁 {len(quest.reward_items)} reward(s)")
-        if quest.required_items:
-            info_items.append(
-                f"📦 {len(quest.required_items)} required item(s)")
+        Returns:
+            Optional[tuple[int, int]]: [start, end) ticks, or None when every quest is shown
+        """
+        if view_mode not in VIEW_WINDOWS:
+            return None
+        start = GameTime(self.app.world_clock.get_current_time().get_day())
+        return (start.ticks, start.ticks + VIEW_WINDOWS[view_mode].ticks)
 
-        if info_items:
-            tk.Label(
-                content,
-                text="  •  ".join(info_items),
-                bg='#3a3a3a',
-                fg='#888888',
-                font=('Courier', 9)
-            ).pack(anchor='w', pady=(0, 10))
+    def filter_quests_by_view(self, view_mode: str):
+        """
+        Filter quests based on timeline view mode using the campaign's timeline index
 
-        # Buttons row
-        button_row = tk.Frame(content, bg='#3a3a3a')
-        button_row.pack(fill='x')
+        Args:
+            view_mode (str): Type of view mode to show quests (quests in a week, month, etc.)
+        """
+        if view_mode == "all":
+            return self.campaign.get_timeline()
 
-        button_config = {
-            'font': ('Courier', 9),
-            'width': 10,
-            'height': 1,
-            'relief': 'flat',
-            'bd': 0,
-            'highlightthickness': 0
-        }
+        if view_mode not in VIEW_WINDOWS:
+            return []
 
-        # Edit button
-        tk.Button(
-            button_row,
-            text="Edit",
-            command=lambda q=quest, i=idx: self.show_edit_quest_dialog(q, i),
-            bg='#4a7a8a',
-            **button_config
-        ).pack(side='left', padx=5)
+        # Get the target time range (you'd typically ask user for this)
+        # For now, we'll use current world clock time as reference
+        current_time = self.app.world_clock.get_current_time()
+        current_day = current_time.get_day()
 
-        # Delete button
-        tk.Button(
-            button_row,
-            text="Delete",
-            command=lambda i=idx: self.delete_quest(i),
-            bg='#8a4a4a',
-            **button_config
-        ).pack(side='left', padx=5)
+        return self.campaign.quests_in_window(GameTime(current_day), VIEW_WINDOWS[view_mode])
 
     def show_create_quest_dialog(self):
         """
@@ -505,8 +590,7 @@ class QuestScreen(BaseScreen):
         realm_var = tk.StringVar(dialog)
         realm_names = list(self.app.realms.keys())
         # Default to campaign's realm
-        default_realm = next((name for name, realm in self.app.realms.items(
-        ) if realm == self.campaign.c_realm), realm_names[0])
+        default_realm = self.app.realms.key_of(self.campaign.c_realm, realm_names[0])
         realm_var.set(default_realm)
 
         realm_dropdown = tk.OptionMenu(form_frame, realm_var, *realm_names)
@@ -554,7 +638,7 @@ class QuestScreen(BaseScreen):
             quest_time = GameTime(day, hour, minute, 0)
 
             # Handle optional end time
-            end_time_str = "N/A"
+            end_quest_time = None
             end_day_val = end_day_entry.get().strip()
             end_hour_val = end_hour_entry.get().strip()
             end_minute_val = end_minute_entry.get().strip()
@@ -582,13 +666,11 @@ class QuestScreen(BaseScreen):
                     end_quest_time = GameTime(end_day, end_hour, end_minute, 0)
 
                     # Validate end time is after start time
-                    if end_quest_time.to_total_minutes() <= quest_time.to_total_minutes():
+                    if not (end_quest_time - quest_time).is_positive():
                         messagebox.showerror(
                             "Error", "End time must be after start time!")
                         return
 
-                    end_time_str = end_quest_time.get_fulltime()
-
                 except ValueError:
                     messagebox.showerror(
                         "Error", "Please enter valid numbers for end time!")
@@ -602,15 +684,16 @@ class QuestScreen(BaseScreen):
                 name=name,
                 time=quest_time,
                 ch_realm=selected_realm,
-                start_time=quest_time.get_fulltime(),
-                end_time=end_time_str
+                end_time=end_quest_time
             )
+            self.app.world_clock.scheduler.schedule_quest(quest, self.campaign)
+            self.app.save_quest(self.campaign, quest)
 
             messagebox.showinfo("Success", f"Quest '{name}' created!")
             dialog.destroy()
 
-            # Refresh the quest list
-            self.refresh_quest_list()
+            # Add just the new quest's card
+            self.show_quest(quest)
 
         # Bind Enter key on name entry
         name_entry.bind('<Return>', lambda e: do_create())
@@ -637,13 +720,12 @@ class QuestScreen(BaseScreen):
             highlightthickness=0
         ).pack(side='left', padx=5)
 
-    def show_edit_quest_dialog(self, quest, quest_idx):
+    def show_edit_quest_dialog(self, quest):
         """
         Show dialog to edit a quest
 
         Args:
             quest (Quest_Event): Quest_Event obj to be edited
-            quest_idx (int): Index of Quest_Event
         """
         
         dialog = tk.Toplevel(self.app)
@@ -727,24 +809,15 @@ class QuestScreen(BaseScreen):
             font=('Arial', 9)
         ).grid(row=6, column=0, columnspan=2, sticky='w', pady=(0, 5))
 
-        # Parse existing end time if it exists
+        # Prefill existing end time if it exists
         end_day_val = ""
         end_hour_val = ""
         end_minute_val = ""
 
-        if quest.end_time != "N/A":
-            # Try to parse end time string like "Day 15, 14:30:00"
-            try:
-                parts = quest.end_time.replace(
-                    "Day ", "").replace(",", "").split()
-                if len(parts) >= 2:
-                    end_day_val = parts[0]
-                    time_parts = parts[1].split(":")
-                    if len(time_parts) >= 2:
-                        end_hour_val = time_parts[0]
-                        end_minute_val = time_parts[1]
-            except:
-                pass  # If parsing fails, leave blank
+        if quest.end is not None:
+            end_day_val = str(quest.end.get_day())
+            end_hour_val = str(quest.end.get_hour())
+            end_minute_val = str(quest.end.get_minute())
 
         # End Day
         tk.Label(form_frame, text="Day:", bg='#2b2b2b', fg='white', font=(
@@ -783,8 +856,7 @@ class QuestScreen(BaseScreen):
         realm_var = tk.StringVar(dialog)
         realm_names = list(self.app.realms.keys())
         # Set current realm
-        current_realm_name = next((name for name, realm in self.app.realms.items(
-        ) if realm == quest.c_realm), realm_names[0])
+        current_realm_name = self.app.realms.key_of(quest.c_realm, realm_names[0])
         realm_var.set(current_realm_name)
 
         realm_dropdown = tk.OptionMenu(form_frame, realm_var, *realm_names)
@@ -832,7 +904,7 @@ class QuestScreen(BaseScreen):
             new_time = GameTime(day, hour, minute, 0)
 
             # Handle optional end time
-            end_time_str = "N/A"
+            end_quest_time = None
             end_day_val = end_day_entry.get().strip()
             end_hour_val = end_hour_entry.get().strip()
             end_minute_val = end_minute_entry.get().strip()
@@ -860,13 +932,11 @@ class QuestScreen(BaseScreen):
                     end_quest_time = GameTime(end_day, end_hour, end_minute, 0)
 
                     # Validate end time is after start time
-                    if end_quest_time.to_total_minutes() <= new_time.to_total_minutes():
+                    if not (end_quest_time - new_time).is_positive():
                         messagebox.showerror(
                             "Error", "End time must be after start time!")
                         return
 
-                    end_time_str = end_quest_time.get_fulltime()
-
                 except ValueError:
                     messagebox.showerror(
                         "Error", "Please enter valid numbers for end time!")
@@ -875,23 +945,26 @@ class QuestScreen(BaseScreen):
             # Get selected realm
             selected_realm = self.app.realms[realm_var.get()]
 
-            # Update quest using campaign's method
+            # Update quest using campaign's method (re-indexes its timeline)
+            old_ticks = quest.time.ticks
             self.campaign.update_quest(
-                quest_idx,
+                quest.quest_id,
                 name=name,
-                start_time=new_time.get_fulltime(),
-                realm=selected_realm
+                realm=selected_realm,
+                time=new_time,
+                end_time=end_quest_time,
+                clear_end=end_quest_time is None
             )
 
-            # Also update the time object and end time directly
-            quest.time = new_time
-            quest.end_time = end_time_str
+            # Replace the quest's pending start/end events
+            self.app.world_clock.scheduler.schedule_quest(quest, self.campaign)
+            self.app.save_quest(self.campaign, quest)
 
             messagebox.showinfo("Success", "Quest updated!")
             dialog.destroy()
 
-            # Refresh the quest list
-            self.refresh_quest_list()
+            # Relabel (or move) just the edited quest's card
+            self.update_quest_card(quest, old_ticks)
 
         name_entry.bind('<Return>', lambda e: do_save())
 
@@ -917,34 +990,30 @@ class QuestScreen(BaseScreen):
             highlightthickness=0
         ).pack(side='left', padx=5)
 
-    def delete_quest(self, quest_idx):
+    def delete_quest(self, quest_id):
         """
         Delete a quest
 
         Args:
-            quest_idx (int): Index of quest to delete
+            quest_id (int): Id of quest to delete
         """
         
-        quest = self.campaign.quests[quest_idx]
+        quest = self.campaign.get_quest(quest_id)
 
         if messagebox.askyesno(
             "Confirm Delete",
             f"Are you sure you want to delete quest '{quest.name}'?\n\nThis action cannot be undone!"
         ):
-            self.campaign.delete_quest(quest_idx)
+            self.app.world_clock.scheduler.unschedule_quest(quest)
+            self.campaign.delete_quest(quest_id)
+            self.app.delete_saved_quest(self.campaign, quest)
             messagebox.showinfo("Success", "Quest deleted!")
 
-            # Refresh the quest list
-            self.refresh_quest_list()
+            # Remove just the deleted quest's card
+            self.hide_quest(quest, quest.time.ticks)
 
     def go_back(self):
         """
         Go back to campaign screen
         """
-        
-        # Clear quest screen from cache to refresh campaign data
-        if "campaign" in self.app.screens:
-            self.app.screens["campaign"].destroy()
-            del self.app.screens["campaign"]
-
         self.navigate_to("campaign")
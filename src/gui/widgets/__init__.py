@@ -0,0 +1,5 @@
+from .card import Card, CardPool
+from .card_list import CardList
+from .virtual_list import VirtualList
+
+__all__ = ['Card', 'CardPool', 'CardList', 'VirtualList']
@@ -0,0 +1,109 @@
+"""
+Reusable list cards and the pool that recycles them
+"""
+
+import tkinter as tk
+from typing import Callable, Optional
+
+# Hidden cards a pool keeps for reuse before destroying the surplus
+MAX_FREE_CARDS = 32
+
+
+class Card(tk.Frame):
+    """
+    Base class for list cards. A card builds its widgets once, in build(),
+    and bind_item() points it at a model object and relabels those
+    widgets, so a list refresh rebinds existing cards instead of
+    destroying and recreating their widget trees.
+    """
+    def __init__(self, parent, bg: str = '#2b2b2b'):
+        """
+        Args:
+            parent: Parent widget
+            bg (str, optional): Background colour around the card. Defaults to '#2b2b2b'.
+        """
+        super().__init__(parent, bg=bg)
+        self.item = None
+        self.build()
+
+    def build(self):
+        """Override this in child classes to create the card's widgets"""
+        pass
+
+    def bind_item(self, item):
+        """
+        Shows a model object in the card
+
+        Args:
+            item: Model object to show
+        """
+        self.item = item
+        self.populate(item)
+
+    def populate(self, item):
+        """Override this in child classes to fill the widgets from item"""
+        pass
+
+
+class CardPool:
+    """
+    Hands out cards for one parent widget, reusing released cards before
+    building new ones. Tk widgets cannot change parent, so each list keeps
+    its own pool.
+    """
+    def __init__(self, parent, make_card: Callable[[tk.Widget], Card], max_free: Optional[int] = MAX_FREE_CARDS):
+        """
+        Args:
+            parent: Widget the cards are created in
+            make_card (Callable[[tk.Widget], Card]): Builds an empty card inside the given parent
+            max_free (Optional[int], optional): Released cards kept for reuse; None keeps all. Defaults to MAX_FREE_CARDS.
+        """
+        self.parent = parent
+        self.make_card = make_card
+        self.max_free = max_free
+        self._free: list[Card] = []
+        self.created = 0
+        self.reused = 0
+        self.destroyed = 0
+
+    def acquire(self) -> Card:
+        """
+        Returns a released card, or a new one if none are free
+
+        Returns:
+            Card: Card to bind; not yet placed in its parent
+        """
+        if self._free:
+            self.reused += 1
+            return self._free.pop()
+        self.created += 1
+        return self.make_card(self.parent)
+
+    def release(self, card: Card) -> None:
+        """
+        Takes back a card its list no longer shows. The caller hides it
+        first; cards beyond max_free are destroyed.
+
+        Args:
+            card (Card): Card to take back
+        """
+        card.item = None
+        if self.max_free is not None and len(self._free) >= self.max_free:
+            card.destroy()
+            self.destroyed += 1
+        else:
+            self._free.append(card)
+
+    def get_stats(self) -> dict:
+        """
+        Returns the pool counters
+
+        Returns:
+            dict: created, reused and destroyed cards, and how many are free
+        """
+        return {
+            'created': self.created,
+            'reused': self.reused,
+            'destroyed': self.destroyed,
+            'free': len(self._free)
+        }
@@ -0,0 +1,137 @@
+"""
+Scrollable list of pooled cards, one per item, for short lists such as
+campaigns, characters and inventory stacks
+"""
+
+import tkinter as tk
+from typing import Callable, Iterable, Optional
+from gui.widgets.card import Card, CardPool, MAX_FREE_CARDS
+
+
+class CardList(tk.Frame):
+    def __init__(self, parent, make_card: Callable[[tk.Widget], Card],
+                 max_free: Optional[int] = MAX_FREE_CARDS, bg: str = '#2b2b2b'):
+        """
+        Args:
+            parent: Parent widget
+            make_card (Callable[[tk.Widget], Card]): Builds an empty card inside the given parent
+            max_free (Optional[int], optional): Hidden cards kept for reuse. Defaults to MAX_FREE_CARDS.
+            bg (str, optional): Background colour. Defaults to '#2b2b2b'.
+        """
+        super().__init__(parent, bg=bg)
+
+        # Create scrollable frame for the cards
+        self.canvas = tk.Canvas(self, bg=bg, highlightthickness=0)
+        scrollbar = tk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.inner = tk.Frame(self.canvas, bg=bg)
+
+        self.inner.bind(
+            "<Configure>",
+            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        )
+
+        window = self.canvas.create_window((0, 0), window=self.inner, anchor="nw")
+        self.canvas.configure(yscrollcommand=scrollbar.set)
+
+        # Make the inner frame as wide as the canvas so cards fill it
+        def configure_scroll_region(event):
+            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+            self.canvas.itemconfig(window, width=event.width)
+
+        self.canvas.bind("<Configure>", configure_scroll_region)
+
+        self.canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        self.pool = CardPool(self.inner, make_card, max_free)
+        # Cards currently shown, in display order
+        self.cards: list[Card] = []
+
+    def set_items(self, items: Iterable) -> None:
+        """
+        Shows a list of items, rebinding the cards already shown, taking
+        extra cards from the pool and returning surplus ones to it
+
+        Args:
+            items (Iterable): Items to show, in display order
+        """
+        items = list(items)
+        shown = len(self.cards)
+
+        for card, item in zip(self.cards, items):
+            card.bind_item(item)
+
+        for item in items[shown:]:
+            card = self.pool.acquire()
+            card.bind_item(item)
+            card.pack(fill='x')
+            self.cards.append(card)
+
+        for card in self.cards[len(items):]:
+            card.pack_forget()
+            self.pool.release(card)
+        del self.cards[len(items):]
+
+    def index_of(self, item) -> int:
+        """
+        Returns the position of the card showing an item
+
+        Args:
+            item: Item to look up, compared by identity
+
+        Returns:
+            int: Position of its card, or -1 if it is not shown
+        """
+        for idx, card in enumerate(self.cards):
+            if card.item is item:
+                return idx
+        return -1
+
+    def insert(self, index: int, item) -> None:
+        """
+        Shows one more item at a position, leaving the other cards untouched
+
+        Args:
+            index (int): Position to insert at
+            item: Item to show
+        """
+        card = self.pool.acquire()
+        card.bind_item(item)
+        if index < len(self.cards):
+            card.pack(fill='x', before=self.cards[index])
+        else:
+            card.pack(fill='x')
+        self.cards.insert(index, card)
+
+    def remove(self, index: int) -> None:
+        """
+        Stops showing the item at a position, returning its card to the pool
+
+        Args:
+            index (int): Position of the item
+        """
+        card = self.cards.pop(index)
+        card.pack_forget()
+        self.pool.release(card)
+
+    def update_item(self, item) -> None:
+        """
+        Rebinds the card showing an item, e.g. after the item was edited
+
+        Args:
+            item: Item whose card to rebind
+        """
+        idx = self.index_of(item)
+        if idx >= 0:
+            self.cards[idx].bind_item(item)
+
+    def refresh(self) -> None:
+        """
+        Rebinds every shown card to its item, e.g. after the items changed in place
+        """
+        for card in self.cards:
+            card.bind_item(card.item)
+
+    def count(self) -> int:
+        # Not __len__: an empty list would then make the widget falsy
+        return len(self.cards)
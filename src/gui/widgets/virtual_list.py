@@ -0,0 +1,247 @@
+"""
+Virtualized scrolling list: only the rows in view (plus a small overscan)
+exist as cards, and they are rebound to other items as the list scrolls
+"""
+
+import tkinter as tk
+from typing import Callable, Optional, Sequence
+from gui.widgets.card import Card, CardPool
+
+# Rows materialized above and below the viewport
+OVERSCAN_ROWS = 3
+
+# Mouse wheel events: <MouseWheel> on Windows and macOS, buttons 4/5 on X11
+WHEEL_EVENTS = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+
+class VirtualList(tk.Frame):
+    def __init__(self, parent, row_height: int,
+                 make_card: Callable[[tk.Widget], Card],
+                 overscan: int = OVERSCAN_ROWS,
+                 bg: str = '#2b2b2b',
+                 prepare: Optional[Callable[[list], None]] = None):
+        """
+        Args:
+            parent: Parent widget
+            row_height (int): Height of every row in pixels
+            make_card (Callable[[tk.Widget], Card]): Builds an empty card inside the given canvas
+            overscan (int, optional): Rows kept above and below the viewport. Defaults to OVERSCAN_ROWS.
+            bg (str, optional): Background colour. Defaults to '#2b2b2b'.
+            prepare (Optional[Callable[[list], None]], optional): Called with the items
+                scrolling into view before their cards are bound, so per-row work can
+                be done in one batch. Defaults to None.
+        """
+        super().__init__(parent, bg=bg)
+        self.row_height = row_height
+        self.overscan = overscan
+        self.prepare = prepare
+
+        self._items: Sequence = ()
+        # index -> card shown for it, and card -> its canvas window item
+        self._rows: dict[int, Card] = {}
+        self._windows: dict[Card, int] = {}
+        self._width = 1
+
+        self.canvas = tk.Canvas(self, bg=bg, highlightthickness=0)
+        # Cards scrolled out of view wait here to be rebound; the viewport bounds how many exist
+        self.pool = CardPool(self.canvas, make_card, max_free=None)
+        self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        # Wheel events go to the widget under the pointer, which is usually a
+        # row's child. The canvas and every card carry a bind tag of this
+        # list's own, so the wheel scrolls it from anywhere over the list
+        # without touching application-wide bindings.
+        self._wheel_tag = f"VirtualListWheel{id(self)}"
+        for sequence in WHEEL_EVENTS:
+            self.bind_class(self._wheel_tag, sequence, self._on_wheel)
+        self._add_wheel_tag(self.canvas)
+
+    def destroy(self) -> None:
+        # Class bindings outlive the widgets that carry the tag, so drop them with the list
+        for sequence in WHEEL_EVENTS:
+            self.unbind_class(self._wheel_tag, sequence)
+        super().destroy()
+
+    # Items
+
+    def set_items(self, items: Sequence) -> None:
+        """
+        Shows a new sequence of items, rebinding the rows in view. The list
+        keeps its own copy, which insert() and remove() then edit.
+
+        Args:
+            items (Sequence): Items to list, in display order
+        """
+        self._items = list(items)
+        self._release_all()
+        self._update_scrollregion()
+        self._render()
+
+    def item_at(self, index: int):
+        return self._items[index]
+
+    def insert(self, index: int, item) -> None:
+        """
+        Inserts one item, moving only the rows in view below it down
+
+        Args:
+            index (int): Position to insert at
+            item: Item to insert
+        """
+        self._items.insert(index, item)
+        self._shift(index, 1)
+        self._update_scrollregion()
+        self._render()
+
+    def remove(self, index: int) -> None:
+        """
+        Removes one item, moving only the rows in view below it up
+
+        Args:
+            index (int): Position of the item
+        """
+        del self._items[index]
+        if index in self._rows:
+            self._release(index)
+        self._shift(index + 1, -1)
+        self._update_scrollregion()
+        self._render()
+
+    def update_at(self, index: int) -> None:
+        """
+        Rebinds one item's row if it is in view, e.g. after the item was edited
+
+        Args:
+            index (int): Position of the item
+        """
+        card = self._rows.get(index)
+        if card is not None:
+            card.bind_item(self._items[index])
+
+    def _shift(self, start: int, by: int) -> None:
+        """
+        Moves the rows at or after start by `by` positions
+        """
+        rows = {}
+        for index, card in self._rows.items():
+            if index >= start:
+                index += by
+                self.canvas.coords(self._windows[card], 0, index * self.row_height)
+            rows[index] = card
+        self._rows = rows
+
+    def refresh(self) -> None:
+        """
+        Rebinds the rows in view, e.g. after their items changed in place
+        """
+        for index, card in self._rows.items():
+            card.bind_item(self._items[index])
+
+    def count(self) -> int:
+        # Not __len__: an empty list would then make the widget falsy
+        return len(self._items)
+
+    def materialized(self) -> int:
+        """
+        Returns how many cards exist, in view or waiting for reuse
+
+        Returns:
+            int: Number of cards
+        """
+        return len(self._windows)
+
+    # Scrolling
+
+    def scroll_to(self, index: int) -> None:
+        """
+        Scrolls so that an item's row is at the top of the viewport
+
+        Args:
+            index (int): Position of the item
+        """
+        if self._items:
+            self.canvas.yview_moveto(index / len(self._items))
+            self._render()
+
+    def _on_scrollbar(self, *args) -> None:
+        self.canvas.yview(*args)
+        self._render()
+
+    def _on_wheel(self, event) -> None:
+        if not self.winfo_exists():
+            return
+        if event.num == 4 or event.delta > 0:
+            self.canvas.yview_scroll(-1, "units")
+        else:
+            self.canvas.yview_scroll(1, "units")
+        self._render()
+
+    def _add_wheel_tag(self, widget: tk.Misc) -> None:
+        """
+        Puts the list's wheel bind tag first on a widget and its descendants
+        """
+        widget.bindtags((self._wheel_tag,) + widget.bindtags())
+        for child in widget.winfo_children():
+            self._add_wheel_tag(child)
+
+    def _on_configure(self, event) -> None:
+        self._width = event.width
+        for window in self._windows.values():
+            self.canvas.itemconfigure(window, width=event.width)
+        self._update_scrollregion()
+        self._render()
+
+    def _update_scrollregion(self) -> None:
+        height = len(self._items) * self.row_height
+        self.canvas.configure(scrollregion=(0, 0, self._width, height),
+                              yscrollincrement=max(1, self.row_height // 4))
+
+    # Row recycling
+
+    def _render(self) -> None:
+        """
+        Materializes the rows for the viewport plus overscan, rebinding rows
+        that scrolled out of range rather than creating new ones
+        """
+        count = len(self._items)
+        top = self.canvas.canvasy(0)
+        height = max(self.canvas.winfo_height(), self.row_height)
+        first = max(0, int(top // self.row_height) - self.overscan)
+        last = min(count, int((top + height) // self.row_height) + 1 + self.overscan)
+
+        for index in [i for i in self._rows if i < first or i >= last]:
+            self._release(index)
+
+        shown = [i for i in range(first, last) if i not in self._rows]
+        if shown and self.prepare is not None:
+            self.prepare([self._items[i] for i in shown])
+        for index in shown:
+            self._show(index)
+
+    def _show(self, index: int) -> None:
+        y = index * self.row_height
+        card = self.pool.acquire()
+        window = self._windows.get(card)
+        if window is None:
+            self._windows[card] = self.canvas.create_window(
+                (0, y), window=card, anchor="nw", width=self._width, height=self.row_height)
+            # A new card: scroll the list when the wheel turns over it
+            self._add_wheel_tag(card)
+        else:
+            self.canvas.coords(window, 0, y)
+            self.canvas.itemconfigure(window, state='normal')
+        self._rows[index] = card
+        card.bind_item(self._items[index])
+
+    def _release(self, index: int) -> None:
+        card = self._rows.pop(index)
+        self.canvas.itemconfigure(self._windows[card], state='hidden')
+        self.pool.release(card)
+
+    def _release_all(self) -> None:
+        for index in list(self._rows):
+            self._release(index)
@@ -1,5 +1,8 @@
+import sys
 from gui.gq_gui import gq_GUI
+from storage import default_data_path
 
 if __name__ == "__main__":
-    app = gq_GUI()
+    # Optional argument: SQLite file or journal directory to use instead of the default
+    app = gq_GUI(sys.argv[1] if len(sys.argv) > 1 else default_data_path())
     app.mainloop()
@@ -1,8 +1,12 @@
-from .Campaign import Campaign
-from .Character import Character
-from .Inventory import Inventory
-from .Item import Item
-from .Quest_Event import Quest_Event
-from .Realm import Realm
-from .User_Settings import User_Settings
-from .User import User
+from .campaign import Campaign
+from .changes import Change, ChangeTracker
+from .character import Character
+from .inventory import Inventory
+from .item import Item
+from .item_catalog import ItemCatalog, default_catalog
+from .permissions import PermissionIndex
+from .quest_event import Quest_Event
+from .realm import Realm
+from .realm_registry import RealmRegistry
+from .user_settings import User_Settings
+from .user import User
@@ -1,11 +1,25 @@
-from typing import Optional
-from core import GameTime
-from .Realm import Realm
-from .User import User
-from .Quest_Event import Quest_Event
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Union, ValuesView
+from core import GameTime, GameDuration, CampaignClock
+from core.GameTime import SECONDS_PER_DAY
+from .realm import Realm
+from .user import User
+from .quest_event import Quest_Event
+
+if TYPE_CHECKING:
+    from .permissions import PermissionIndex
+    from .realm_registry import RealmRegistry
+    from .changes import ChangeTracker
+    from core import QuestScheduler
 
 
 class Campaign:
+    __slots__ = ('title', 'activity', 'time', 'c_realm', 'events_display',
+                 '_quests', '_next_quest_id', '_viewers', '_editors', '_acl_index', '_realm_index',
+                 'clock', 'db_id', '_quest_loader', '_quest_count', '_quest_span', '_quest_realms',
+                 '_scheduler',
+                 '_timeline_ticks', '_timeline', '_tracker')
+
     def __init__(self,
                  title: str,
                  activity: bool,
@@ -21,15 +35,245 @@ class Campaign:
         self.time = time
         self.c_realm = c_realm
         self.events_display = events_display
-        self.quests = quests if quests is not None else []
-        self.permitted_users = permitted_users if permitted_users is not None else []
-        self.edit_users = edit_users if edit_users is not None else []
+        # Quests by quest_id; dicts keep insertion order, so iteration stays in creation order
+        self._quests: dict[int, Quest_Event] = {}
+        self._next_quest_id = 1
+        self._store_quests(quests if quests is not None else [])
+        # Viewer/editor sets keyed by username, for O(1) permission checks
+        self._viewers: dict[str, User] = {u.username: u for u in permitted_users or []}
+        self._editors: dict[str, User] = {u.username: u for u in edit_users or []}
+        # Reverse index told about every grant and revoke, once the campaign is added to one
+        self._acl_index: Optional['PermissionIndex'] = None
+        # Realm registry told about quest and campaign realm changes, once added to one
+        self._realm_index: Optional['RealmRegistry'] = None
+        # Change tracker reporting this campaign's changes, once it is watched
+        self._tracker: Optional['ChangeTracker'] = None
+
+        # Optional running clock; self.time stays the campaign's start time
+        self.clock: Optional[CampaignClock] = None
+
+        # Storage row id, and the loader used while quests are not loaded yet
+        self.db_id: Optional[int] = None
+        self._quest_loader: Optional[Callable[['Campaign'], list[Quest_Event]]] = None
+        self._quest_count = len(self._quests)
+        self._quest_span: Optional[tuple[int, int]] = None
+        # map_id -> number of deferred quests in that realm, as given to set_quest_loader
+        self._quest_realms: Optional[dict[int, int]] = None
+        # Scheduler waiting for the deferred quests to load, once scheduled with some pending
+        self._scheduler: Optional['QuestScheduler'] = None
+
+        # Timeline index: quests sorted by start tick, kept as two parallel
+        # lists so range queries can bisect on plain ints
+        self._timeline_ticks: list[int] = []
+        self._timeline: list[Quest_Event] = []
+        self._rebuild_timeline()
+
+    @property
+    def quests(self) -> ValuesView[Quest_Event]:
+        # Quests of a lazily loaded campaign are fetched on first access
+        if self._quest_loader is not None:
+            self._load_quests()
+        return self._quests.values()
+
+    @quests.setter
+    def quests(self, quests: Iterable[Quest_Event]) -> None:
+        deferred = self._quest_loader is not None
+        self._quest_loader = None
+        self._index_realms(self._quests.values(), False)
+        self._watch_quests(self._quests.values(), False)
+        self._quests = {}
+        self._store_quests(quests)
+        self._index_realms(self._quests.values(), True)
+        self._watch_quests(self._quests.values(), True)
+        self._rebuild_timeline()
+        if deferred:
+            self._quests_loaded()
+        if self._tracker is not None:
+            self._tracker.record(self, ('quests',))
+
+    def _index_realms(self, quests: Iterable[Quest_Event], add: bool) -> None:
+        """
+        Internal helper that adds quests to, or drops them from, the realm registry's index
+
+        Args:
+            quests (Iterable[Quest_Event]): Quests to (un)index
+            add (bool): True to add, False to drop
+        """
+        index = self._realm_index
+        if index is None:
+            return
+        for quest in quests:
+            if add:
+                index.on_quest_realm(quest, None, quest.c_realm, self)
+            else:
+                index.on_quest_realm(quest, quest.c_realm, None)
+
+    def _watch_quests(self, quests: Iterable[Quest_Event], watch: bool) -> None:
+        """
+        Internal helper that starts or stops reporting quests' changes to the campaign's tracker
+
+        Args:
+            quests (Iterable[Quest_Event]): Quests to (un)watch
+            watch (bool): True to watch, False to stop
+        """
+        tracker = self._tracker
+        if tracker is None:
+            return
+        for quest in quests:
+            if watch:
+                tracker.watch(quest, self)
+            else:
+                tracker.unwatch(quest)
+
+    def _store_quests(self, quests: Iterable[Quest_Event]) -> None:
+        """
+        Internal helper that adds quests to the id-keyed store, keeping the
+        ids they already have and numbering the rest
+
+        Args:
+            quests (Iterable[Quest_Event]): Quests to add
+        """
+        quests = list(quests)
+        known = [q.quest_id for q in quests if q.quest_id is not None]
+        if known:
+            self._next_quest_id = max(self._next_quest_id, max(known) + 1)
+        for quest in quests:
+            if quest.quest_id is None:
+                quest.quest_id = self._next_quest_id
+                self._next_quest_id += 1
+            self._quests[quest.quest_id] = quest
+
+    def set_quest_loader(self, loader: Callable[['Campaign'], list[Quest_Event]], count: int,
+                         span: Optional[tuple[int, int]] = None,
+                         realms: Optional[dict[int, int]] = None) -> None:
+        """
+        Defers loading the campaign's quests until they are first needed
+
+        Args:
+            loader (Callable[[Campaign], list[Quest_Event]]): Returns the campaign's quests when called
+            count (int): Number of quests the loader will return
+            span (Optional[tuple[int, int]], optional): Ticks of the earliest and latest start or end among those quests. Defaults to None (unknown).
+            realms (Optional[dict[int, int]], optional): Number of those quests per realm map_id. Defaults to None (unknown).
+        """
+        self._quest_loader = loader
+        self._quest_count = count
+        self._quest_span = span
+        self._quest_realms = realms
+
+    def quest_span(self) -> Optional[tuple[int, int]]:
+        """
+        Returns the first and last quest instant of a campaign whose quests
+        are not loaded, as given to set_quest_loader
+
+        Returns:
+            Optional[tuple[int, int]]: Earliest and latest start or end tick, or None if unknown or loaded
+        """
+        return self._quest_span
+
+    def quest_realm_counts(self) -> Optional[dict[int, int]]:
+        """
+        Returns how many quests of a campaign whose quests are not loaded
+        take place in each realm, as given to set_quest_loader
+
+        Returns:
+            Optional[dict[int, int]]: Quest count per realm map_id, or None if unknown or loaded
+        """
+        return self._quest_realms
+
+    def is_loaded(self) -> bool:
+        """
+        Returns whether the campaign's quests are in memory
+
+        Returns:
+            bool: False while quests are still deferred to a loader
+        """
+        return self._quest_loader is None
+
+    def _load_quests(self) -> None:
+        """
+        Internal helper that runs the quest loader and indexes the result
+        """
+        loader = self._quest_loader
+        self._quest_loader = None
+        self._quests = {}
+        self._store_quests(loader(self))
+        self._index_realms(self._quests.values(), True)
+        self._watch_quests(self._quests.values(), True)
+        self._rebuild_timeline()
+        self._quests_loaded()
+
+    def _quests_loaded(self) -> None:
+        """
+        Internal helper that drops the deferred-quest summary and hands the
+        loaded quests to a scheduler that was waiting for them
+        """
+        if self._realm_index is not None:
+            self._realm_index.on_quests_loaded(self)
+        self._quest_span = None
+        self._quest_realms = None
+        if self._scheduler is not None:
+            self._scheduler.on_quests_loaded(self)
+
+    def _ensure_loaded(self) -> None:
+        if self._quest_loader is not None:
+            self._load_quests()
+
+    def get_quest_count(self) -> int:
+        """
+        Returns the number of quests without forcing them to load
+
+        Returns:
+            int: Number of quests in the campaign
+        """
+        if self._quest_loader is not None:
+            return self._quest_count
+        return len(self._quests)
+
+    def _rebuild_timeline(self) -> None:
+        """
+        Rebuilds the timeline index from scratch out of self.quests
+        """
+        ordered = sorted(self._quests.values(), key=lambda q: q.time.ticks)
+        self._timeline = ordered
+        self._timeline_ticks = [q.time.ticks for q in ordered]
+
+    def _index_quest(self, quest: Quest_Event) -> None:
+        """
+        Inserts a quest into the timeline index, after any quests with the same start tick
+
+        Args:
+            quest (Quest_Event): Quest to index
+        """
+        ticks = quest.time.ticks
+        pos = bisect_right(self._timeline_ticks, ticks)
+        self._timeline_ticks.insert(pos, ticks)
+        self._timeline.insert(pos, quest)
+
+    def _unindex_quest(self, quest: Quest_Event, ticks: int) -> None:
+        """
+        Removes a quest from the timeline index
+
+        Args:
+            quest (Quest_Event): Quest to remove
+            ticks (int): Start tick the quest was indexed under
+        """
+        pos = bisect_left(self._timeline_ticks, ticks)
+        end = bisect_right(self._timeline_ticks, ticks, lo=pos)
+
+        # Only quests sharing the same start tick need an identity scan
+        for i in range(pos, end):
+            if self._timeline[i] is quest:
+                del self._timeline_ticks[i]
+                del self._timeline[i]
+                return
 
     def start_campaign(self) -> None:
         """ 
         Starts the campaign by setting the activity status to True
         """
         self.activity = True
+        if self._tracker is not None:
+            self._tracker.record(self, ('activity',))
 
     def rename(self, name: str) -> None:
         """
@@ -39,12 +283,16 @@ class Campaign:
             name (str): New name to rename campaign
         """
         self.title = name
+        if self._tracker is not None:
+            self._tracker.record(self, ('title',))
 
     def change_act(self) -> None:
         """
         Changes the activity status to the opposite state.
         """
         self.activity = not self.activity
+        if self._tracker is not None:
+            self._tracker.record(self, ('activity',))
 
     def delete_camp(self) -> None:
         """
@@ -52,9 +300,43 @@ class Campaign:
         """
         # handle fr after storage implementation
         self.activity = False
-        self.quests.clear()
-        self.permitted_users.clear()
-        self.edit_users.clear()
+        if self._realm_index is not None:
+            self._realm_index.remove_campaign(self)
+        self._quest_loader = None
+        self._quest_span = None
+        self._quest_realms = None
+        self._watch_quests(self._quests.values(), False)
+        self._quests.clear()
+        self._timeline.clear()
+        self._timeline_ticks.clear()
+        if self._acl_index is not None:
+            self._acl_index.remove_campaign(self)
+        self._viewers.clear()
+        self._editors.clear()
+        if self._tracker is not None:
+            self._tracker.record(self, ('activity', 'quests', 'permitted_users', 'edit_users'))
+
+    def attach_clock(self, clock: CampaignClock) -> None:
+        """
+        Gives the campaign its own running clock
+
+        Args:
+            clock (CampaignClock): Clock for the campaign, normally sharing the world clock's source
+        """
+        self.clock = clock
+        if self._tracker is not None:
+            self._tracker.record(self, ('clock',))
+
+    def get_clock_time(self) -> GameTime:
+        """
+        Returns the campaign's current time, read from its clock in O(1)
+
+        Returns:
+            GameTime: Current campaign time, or the start time if the campaign has no clock
+        """
+        if self.clock is None:
+            return self.time
+        return self.clock.get_current_time()
 
     def change_camp_realm(self, cho_realm: Realm) -> None:
         """
@@ -63,57 +345,246 @@ class Campaign:
         Args:
             cho_realm (Realm): New realm to change current realm to.
         """
+        if self._realm_index is not None:
+            self._realm_index.on_campaign_realm(self, self.c_realm, cho_realm)
         self.c_realm = cho_realm
+        if self._tracker is not None:
+            self._tracker.record(self, ('c_realm',))
 
     def create_quest(self, name: str,
-                     time: GameTime,
+                     time: Optional[GameTime],
                      ch_realm: Realm,
-                     start_time: str,
-                     end_time: str = "N/A") -> Quest_Event:
+                     start_time: Optional[str] = None,
+                     end_time: Union[GameTime, str, None] = None) -> Quest_Event:
         """
         Creates a new quest object to add to a Campaign's list of quests
 
+        Args:
+            name (str): Quest name
+            time (Optional[GameTime]): World time the quest starts; None to parse start_time instead
+            ch_realm (Realm): Realm the quest takes place in
+            start_time (Optional[str], optional): Legacy "Day D, HH:MM:SS" start string, only read when time is None. Defaults to None.
+            end_time (Union[GameTime, str, None], optional): End time, or a legacy "Day D, HH:MM:SS"/"N/A" string. Defaults to None.
+
+        Raises:
+            ValueError: If neither time nor start_time is given
+
         Returns:
             Quest_Event: Quest_Event object we created
         """
-
-        q = Quest_Event(name, ch_realm, time, start_time, end_time)
-        self.quests.append(q)
+        if time is None:
+            if start_time is None:
+                raise ValueError("A quest needs a start time")
+            time = GameTime.from_fulltime(start_time)
+
+        self._ensure_loaded()
+        q = Quest_Event(name, ch_realm, time)
+        q.set_endtime(end_time)
+        q.quest_id = self._next_quest_id
+        self._next_quest_id += 1
+        self._quests[q.quest_id] = q
+        self._index_quest(q)
+        if self._realm_index is not None:
+            self._realm_index.on_quest_realm(q, None, ch_realm, self)
+        if self._tracker is not None:
+            self._tracker.added(q, self, 'quests')
         return q
 
-    def update_quest(self, q_num: int, *, name: Optional[str] = None, start_time: Optional[str] = None, realm: Optional[Realm] = None) -> None:
+    def get_quest(self, quest_id: int) -> Quest_Event:
+        """
+        Looks up a quest by its id in O(1)
+
+        Args:
+            quest_id (int): Id of the quest
+
+        Raises:
+            KeyError: If the campaign has no quest with that id
+
+        Returns:
+            Quest_Event: The quest
+        """
+        self._ensure_loaded()
+        try:
+            return self._quests[quest_id]
+        except KeyError:
+            raise KeyError(f"No quest with id {quest_id}") from None
+
+    def has_quest(self, quest_id: int) -> bool:
+        """
+        Checks whether the campaign has a quest with the given id
+
+        Args:
+            quest_id (int): Id of the quest
+
+        Returns:
+            bool: True if the quest exists
+        """
+        self._ensure_loaded()
+        return quest_id in self._quests
+
+    def update_quest(self, quest_id: int, *, name: Optional[str] = None, start_time: Optional[str] = None, realm: Optional[Realm] = None, time: Optional[GameTime] = None, end_time: Union[GameTime, str, None] = None, clear_end: bool = False) -> None:
         """
         Updates a quest's info based on the given optional keyword arguments
 
         Args:
-            q_num (int): Quest index 
+            quest_id (int): Id of the quest to update
             realm (Optional[Realm]): New Realm to change quest to. Defaults to None.
             name (Optional[str], optional): New quest name to rename. Defaults to None.
-            start_time (Optional[str], optional): New start time for the quest. Defaults to None.
+            start_time (Optional[str], optional): New start time for the quest as a legacy "Day D, HH:MM:SS" string. Defaults to None.
+            time (Optional[GameTime], optional): New world time for the quest. Re-positions the quest in the timeline. Defaults to None.
+            end_time (Union[GameTime, str, None], optional): New end time, or "N/A" to clear it. Defaults to None (unchanged).
+            clear_end (bool, optional): Remove the quest's end time; end_time is ignored. Defaults to False.
+        """
+        quest = self.get_quest(quest_id)
+        # Report the edit as one change rather than one per setter
+        tracker, quest._tracker = quest._tracker, None
+        changed = []
+        try:
+            if name is not None:
+                quest.set_name(name)
+                changed.append('name')
+
+            if start_time is not None and time is None:
+                time = GameTime.from_fulltime(start_time)
+
+            if realm is not None:
+                if self._realm_index is not None:
+                    self._realm_index.on_quest_realm(quest, quest.c_realm, realm, self)
+                quest.set_realm(realm)
+                changed.append('c_realm')
+
+            if time is not None and time != quest.time:
+                self._unindex_quest(quest, quest.time.ticks)
+                quest.time = time
+                self._index_quest(quest)
+                changed.append('time')
+
+            if clear_end:
+                if quest.end is not None:
+                    quest.set_endtime(None)
+                    changed.append('end')
+            elif end_time is not None:
+                quest.set_endtime(end_time)
+                changed.append('end')
+        finally:
+            quest._tracker = tracker
+        if tracker is not None and changed:
+            tracker.record(quest, changed)
+
+    def delete_quest(self, quest_id: int) -> Quest_Event:
+        """
+        Removes a Quest_Event from a Campaign's quests
+
+        Args:
+            quest_id (int): Id of the quest to delete
+
+        Raises:
+            KeyError: If the campaign has no quest with that id
+
+        Returns:
+            Quest_Event: The removed quest
+        """
+        quest = self.get_quest(quest_id)
+        del self._quests[quest_id]
+        self._unindex_quest(quest, quest.time.ticks)
+        if self._realm_index is not None:
+            self._realm_index.on_quest_realm(quest, quest.c_realm, None)
+        if self._tracker is not None:
+            self._tracker.removed(quest, self, 'quests')
+        return quest
+
+    def get_timeline(self) -> list[Quest_Event]:
+        """
+        Returns the campaign's quests in chronological order, without re-sorting
+
+        Returns:
+            list[Quest_Event]: Quests sorted by start time
+        """
+        self._ensure_loaded()
+        return list(self._timeline)
+
+    def quests_between(self, start: GameTime, end: GameTime) -> list[Quest_Event]:
+        """
+        Returns quests starting within [start, end], in chronological order.
+        Runs in O(log n + k) for k matching quests.
+
+        Args:
+            start (GameTime): Earliest start time (inclusive)
+            end (GameTime): Latest start time (inclusive)
+
+        Returns:
+            list[Quest_Event]: Matching quests sorted by start time
+        """
+        self._ensure_loaded()
+        lo = bisect_left(self._timeline_ticks, start.ticks)
+        hi = bisect_right(self._timeline_ticks, end.ticks, lo=lo)
+        return self._timeline[lo:hi]
+
+    def quests_by_end_time(self) -> list[Quest_Event]:
         """
-        # q_num is an index for now; later replace with quest_id
-        if q_num < 0 or q_num >= len(self.quests):
-            raise IndexError("Quest index out of range")
+        Returns the campaign's quests ordered by end time; quests without an end time come last
 
-        quest = self.quests[q_num]
+        Returns:
+            list[Quest_Event]: Quests sorted by end time
+        """
+        self._ensure_loaded()
+        return sorted(self._timeline, key=lambda q: (q.end is None, q.end.ticks if q.end is not None else 0))
 
-        if name is not None:
-            quest.set_name(name)
+    def quests_with_duration(self, shortest: GameDuration, longest: Optional[GameDuration] = None) -> list[Quest_Event]:
+        """
+        Returns quests whose duration falls within [shortest, longest], in chronological order
 
-        if start_time is not None:
-            quest.set_starttime(start_time)
+        Args:
+            shortest (GameDuration): Shortest duration (inclusive)
+            longest (Optional[GameDuration], optional): Longest duration (inclusive). Defaults to None (no limit).
 
-        if realm is not None:
-            quest.set_realm(realm)
+        Returns:
+            list[Quest_Event]: Matching quests sorted by start time
+        """
+        self._ensure_loaded()
+        # Compare on raw ticks so no GameDuration is built per quest
+        min_ticks = shortest.ticks
+        max_ticks = longest.ticks if longest is not None else None
+        result = []
+        for q in self._timeline:
+            if q.end is None:
+                continue
+            duration = q.end.ticks - q.time.ticks
+            if duration >= min_ticks and (max_ticks is None or duration <= max_ticks):
+                result.append(q)
+        return result
+
+    def quests_in_window(self, start: GameTime, length: GameDuration) -> list[Quest_Event]:
+        """
+        Returns quests starting within [start, start + length), in chronological order
 
-    def delete_quest(self, q_num: int) -> None:
+        Args:
+            start (GameTime): Start of the window (inclusive)
+            length (GameDuration): Length of the window
+
+        Returns:
+            list[Quest_Event]: Matching quests sorted by start time
+        """
+        self._ensure_loaded()
+        lo = bisect_left(self._timeline_ticks, start.ticks)
+        hi = bisect_left(self._timeline_ticks, start.ticks + length.ticks, lo=lo)
+        return self._timeline[lo:hi]
+
+    def quests_in_days(self, first_day: int, last_day: int) -> list[Quest_Event]:
         """
-        Removes a Quest_Event from a Campaign's quests list
+        Returns quests starting on any day from first_day to last_day (both inclusive)
 
         Args:
-            q_num (int): index of quest
+            first_day (int): First day of the range
+            last_day (int): Last day of the range
+
+        Returns:
+            list[Quest_Event]: Matching quests sorted by start time
         """
-        self.quests.pop(q_num)
+        self._ensure_loaded()
+        lo = bisect_left(self._timeline_ticks, first_day * SECONDS_PER_DAY)
+        hi = bisect_left(self._timeline_ticks, (last_day + 1) * SECONDS_PER_DAY, lo=lo)
+        return self._timeline[lo:hi]
 
     def change_eventD_type(self, selected: str) -> None:
         """
@@ -123,9 +594,37 @@ class Campaign:
             selected (str): Selected display type to change to
         """
         self.events_display = selected
+        if self._tracker is not None:
+            self._tracker.record(self, ('events_display',))
 
     # New functions separate from class diagram
 
+    @property
+    def permitted_users(self) -> list[User]:
+        return list(self._viewers.values())
+
+    @property
+    def edit_users(self) -> list[User]:
+        return list(self._editors.values())
+
+    def viewer_ids(self) -> list[str]:
+        """
+        Returns the usernames with view permission
+
+        Returns:
+            list[str]: Viewer usernames
+        """
+        return list(self._viewers)
+
+    def editor_ids(self) -> list[str]:
+        """
+        Returns the usernames with edit permission
+
+        Returns:
+            list[str]: Editor usernames
+        """
+        return list(self._editors)
+
     def can_view(self, user: User) -> bool:
         """
         Returns bool of whether a user can view campaign
@@ -136,7 +635,7 @@ class Campaign:
         Returns:
             bool: View status of user
         """
-        return user in self.permitted_users or user in self.edit_users
+        return user.username in self._viewers or user.username in self._editors
 
     def can_edit(self, user: User) -> bool:
         """
@@ -148,18 +647,31 @@ class Campaign:
         Returns:
             bool: Edit status of user
         """
-
-        return user in self.edit_users
+        return user.username in self._editors
+
+    def _grant(self, members: dict, user: User, edit: bool) -> None:
+        if user.username not in members:
+            members[user.username] = user
+            if self._acl_index is not None:
+                self._acl_index.on_grant(self, user.username, edit)
+            if self._tracker is not None:
+                self._tracker.record(self, ('edit_users' if edit else 'permitted_users',))
+
+    def _revoke(self, members: dict, user: User, edit: bool) -> None:
+        if members.pop(user.username, None) is not None:
+            if self._acl_index is not None:
+                self._acl_index.on_revoke(self, user.username, edit)
+            if self._tracker is not None:
+                self._tracker.record(self, ('edit_users' if edit else 'permitted_users',))
 
     def add_permitted_user(self, user: User) -> None:
         """
-        Add user to permitted_users list
+        Add user to permitted users
 
         Args:
             user (User): User to add
         """
-        if user not in self.permitted_users:
-            self.permitted_users.append(user)
+        self._grant(self._viewers, user, False)
 
     def add_edit_user(self, user: User) -> None:
         """
@@ -168,23 +680,28 @@ class Campaign:
         Args:
             user (User): User to add
         """
-        if user not in self.edit_users:
-            self.edit_users.append(user)
+        self._grant(self._editors, user, True)
 
         # Editor should also have view permissions
-        if user not in self.permitted_users:
-            self.permitted_users.append(user)
+        self._grant(self._viewers, user, False)
 
     def remove_permitted_user(self, user: User) -> None:
         """
-        Remove a user from permitted list
+        Remove a user from permitted users
 
         Args:
             user (User): User to remove
         """
-        if user not in self.permitted_users:
-            self.permitted_users.append(user)
+        self._revoke(self._viewers, user, False)
 
         # Non-viewers should also not be able to edit
-        if user not in self.edit_users:
-            self.edit_users.append(user)
+        self._revoke(self._editors, user, True)
+
+    def remove_edit_user(self, user: User) -> None:
+        """
+        Revokes a user's edit permission, leaving view permission as it is
+
+        Args:
+            user (User): User to remove
+        """
+        self._revoke(self._editors, user, True)
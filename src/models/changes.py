@@ -0,0 +1,275 @@
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+# Change kinds
+UPDATED = 'updated'
+ADDED = 'added'
+REMOVED = 'removed'
+
+
+@dataclass(frozen=True, slots=True)
+class Change:
+    """
+    One reported model change.
+
+    For UPDATED, entity is the model whose fields changed. For ADDED and
+    REMOVED, entity is the child that joined or left one of owner's
+    collections, and fields names that collection (e.g. {'quests'}).
+    """
+    entity: object
+    fields: frozenset
+    kind: str = UPDATED
+    owner: object = None
+
+
+class ChangeTracker:
+    """
+    Opt-in change events and dirty flags for the models.
+
+    Models are silent until watched: watch() (or watch_user() for a user
+    and everything they own) hands the model this tracker, after which
+    each mutator reports the entity and the fields it changed. Listeners
+    are called with a Change for every report, and every watched entity
+    keeps a set of dirty fields until mark_clean(), so persistence can
+    save only what changed and the GUI can refresh only what is stale.
+    """
+    def __init__(self):
+        self._listeners: list[Callable[[Change], None]] = []
+        # id(entity) -> (entity, owner); entity is kept so the id stays valid
+        self._watched: dict[int, tuple[object, object]] = {}
+        # id(owner) -> ids of the watched entities it owns, so unwatching cascades
+        self._children: dict[int, set[int]] = {}
+        # id(entity) -> (entity, dirty fields); dicts keep first-dirtied order
+        self._dirty: dict[int, tuple[object, set[str]]] = {}
+
+    # Listeners
+
+    def add_listener(self, listener: Callable[[Change], None]) -> None:
+        """
+        Registers a callback run for every change
+
+        Args:
+            listener (Callable[[Change], None]): Called with each Change
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Change], None]) -> None:
+        """
+        Unregisters a callback added with add_listener
+
+        Args:
+            listener (Callable[[Change], None]): Callback to remove
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    # Watching
+
+    def watch(self, entity, owner=None) -> None:
+        """
+        Starts reporting changes to a model
+
+        Args:
+            entity: Model to watch
+            owner (optional): Model that owns it, e.g. the campaign of a quest. Defaults to None.
+        """
+        previous = self._watched.get(id(entity))
+        if previous is not None and previous[1] is not None and previous[1] is not owner:
+            self._children.get(id(previous[1]), set()).discard(id(entity))
+        entity._tracker = self
+        self._watched[id(entity)] = (entity, owner)
+        if owner is not None:
+            self._children.setdefault(id(owner), set()).add(id(entity))
+
+    def unwatch(self, entity) -> None:
+        """
+        Stops reporting changes to a model and everything watched as owned
+        by it, and forgets their dirty fields
+
+        Args:
+            entity: Model to stop watching
+        """
+        watched = self._watched.pop(id(entity), None)
+        if watched is None:
+            return
+        if entity._tracker is self:
+            entity._tracker = None
+        self._dirty.pop(id(entity), None)
+
+        owner = watched[1]
+        siblings = self._children.get(id(owner))
+        if siblings is not None:
+            siblings.discard(id(entity))
+            if not siblings:
+                del self._children[id(owner)]
+        for child_id in self._children.pop(id(entity), ()):
+            child = self._watched.get(child_id)
+            if child is not None:
+                # Detach from the owner first so the child does not edit the set being iterated
+                self._watched[child_id] = (child[0], None)
+                self.unwatch(child[0])
+
+    def watch_user(self, user) -> None:
+        """
+        Watches a user with their settings, characters, inventories,
+        campaigns and loaded quests. Quests of lazily loaded campaigns are
+        watched by their campaign when they load.
+
+        Args:
+            user (User): User to watch
+        """
+        self.watch(user)
+        if user.user_settings is not None:
+            self.watch(user.user_settings, user)
+        for character in user.characters:
+            self.watch_character(character, user)
+        for campaign in user.campaigns:
+            self.watch_campaign(campaign, user)
+
+    def watch_character(self, character, owner=None) -> None:
+        """
+        Watches a character and its inventory
+
+        Args:
+            character (Character): Character to watch
+            owner (User, optional): User who owns the character. Defaults to None.
+        """
+        self.watch(character, owner)
+        self.watch(character.curr_inventory, character)
+
+    def watch_campaign(self, campaign, owner=None) -> None:
+        """
+        Watches a campaign and its loaded quests
+
+        Args:
+            campaign (Campaign): Campaign to watch
+            owner (User, optional): User who owns the campaign. Defaults to None.
+        """
+        self.watch(campaign, owner)
+        if campaign.is_loaded():
+            for quest in campaign.quests:
+                self.watch(quest, campaign)
+
+    def owner_of(self, entity):
+        """
+        Returns the owner a model was watched with
+
+        Args:
+            entity: Watched model
+
+        Returns:
+            The owner, or None if it has none or is not watched
+        """
+        watched = self._watched.get(id(entity))
+        return watched[1] if watched is not None else None
+
+    def is_watched(self, entity) -> bool:
+        return id(entity) in self._watched
+
+    # Reporting; called by the models
+
+    def record(self, entity, fields: Iterable[str]) -> None:
+        """
+        Reports that fields of a watched model changed. Called by the models.
+
+        Args:
+            entity: Model that changed
+            fields (Iterable[str]): Names of the changed fields
+        """
+        fields = frozenset(fields)
+        self._mark(entity, fields)
+        self._notify(Change(entity, fields, UPDATED, self.owner_of(entity)))
+
+    def added(self, entity, owner, collection: str) -> None:
+        """
+        Reports that a model joined one of its owner's collections and
+        starts watching it. Called by the models.
+
+        Args:
+            entity: Model that was added, e.g. a new quest
+            owner: Model it was added to, e.g. its campaign
+            collection (str): Name of the owner's collection, e.g. 'quests'
+        """
+        self.watch(entity, owner)
+        fields = frozenset((collection,))
+        self._mark(owner, fields)
+        self._mark(entity, ())
+        self._notify(Change(entity, fields, ADDED, owner))
+
+    def removed(self, entity, owner, collection: str) -> None:
+        """
+        Reports that a model left one of its owner's collections and stops
+        watching it. Called by the models.
+
+        Args:
+            entity: Model that was removed
+            owner: Model it was removed from
+            collection (str): Name of the owner's collection
+        """
+        self.unwatch(entity)
+        fields = frozenset((collection,))
+        self._mark(owner, fields)
+        self._notify(Change(entity, fields, REMOVED, owner))
+
+    def _mark(self, entity, fields: Iterable[str]) -> None:
+        dirty = self._dirty.get(id(entity))
+        if dirty is None:
+            self._dirty[id(entity)] = (entity, set(fields))
+        else:
+            dirty[1].update(fields)
+
+    def _notify(self, change: Change) -> None:
+        for listener in list(self._listeners):
+            listener(change)
+
+    # Dirty flags
+
+    def is_dirty(self, entity=None) -> bool:
+        """
+        Returns whether a model, or any watched model, has unsaved changes
+
+        Args:
+            entity (optional): Model to check. Defaults to None (any model).
+
+        Returns:
+            bool: True if there are changes since the last mark_clean
+        """
+        if entity is None:
+            return bool(self._dirty)
+        return id(entity) in self._dirty
+
+    def dirty_fields(self, entity) -> frozenset:
+        """
+        Returns the fields of a model changed since it was last marked clean.
+        A newly added model is dirty with no fields.
+
+        Args:
+            entity: Model to check
+
+        Returns:
+            frozenset: Changed field names
+        """
+        dirty = self._dirty.get(id(entity))
+        return frozenset(dirty[1]) if dirty is not None else frozenset()
+
+    def dirty_entities(self) -> list:
+        """
+        Returns every model with unsaved changes
+
+        Returns:
+            list: Dirty models in the order they first changed
+        """
+        return [entity for entity, _ in self._dirty.values()]
+
+    def mark_clean(self, entity=None) -> None:
+        """
+        Clears dirty flags, e.g. after saving
+
+        Args:
+            entity (optional): Model to clear. Defaults to None (every model).
+        """
+        if entity is None:
+            self._dirty.clear()
+        else:
+            self._dirty.pop(id(entity), None)
+
@@ -1,9 +1,45 @@
 from dataclasses import dataclass, field
-from .Inventory import Inventory
+from sys import intern
+from typing import TYPE_CHECKING, Optional
+from .inventory import Inventory
 
-@dataclass
+if TYPE_CHECKING:
+    from .changes import ChangeTracker
+
+@dataclass(slots=True)
 class Character:
     name: str
-    character_class: str
+    character_class: str  # one of a handful of classes, interned so characters share the string
     level: int = 0
-    curr_inventory: Inventory = field(default_factory=Inventory) # composition - character owns an inventory
\ No newline at end of file
+    curr_inventory: Inventory = field(default_factory=Inventory) # composition - character owns an inventory
+
+    # Storage row id, assigned when the character is first saved
+    db_id: Optional[int] = field(default=None, repr=False, compare=False)
+
+    # Change tracker reporting this character's changes, once it is watched
+    _tracker: Optional['ChangeTracker'] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.character_class = intern(self.character_class)
+
+    def update_character(self, *, name: Optional[str] = None, character_class: Optional[str] = None, level: Optional[int] = None) -> None:
+        """
+        Updates a character's info based on the given optional keyword arguments
+
+        Args:
+            name (Optional[str], optional): New name. Defaults to None.
+            character_class (Optional[str], optional): New class. Defaults to None.
+            level (Optional[int], optional): New level. Defaults to None.
+        """
+        changed = []
+        if name is not None and name != self.name:
+            self.name = name
+            changed.append('name')
+        if character_class is not None and character_class != self.character_class:
+            self.character_class = intern(character_class)
+            changed.append('character_class')
+        if level is not None and level != self.level:
+            self.level = level
+            changed.append('level')
+        if changed and self._tracker is not None:
+            self._tracker.record(self, changed)
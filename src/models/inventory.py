@@ -1,30 +1,205 @@
-from dataclasses import dataclass, field
-from typing import List
-from models import Item
+from typing import TYPE_CHECKING, Iterable, Optional
+from .item import Item
+
+if TYPE_CHECKING:
+    from .changes import ChangeTracker
+
+# Width of the damage bands indexed for range queries
+DAMAGE_BAND_SIZE = 10
+
 
-@dataclass
 class Inventory:
-    # association - Inventory references Items to be put into the list
-    items: List[Item] = field(default_factory=list)
+    """
+    Multiset of items: identical items are stored once as a stack with a
+    count. Items are immutable and hashable, so adding and removing are
+    O(1) keyed by the item itself, and rarity and damage band indexes plus
+    the damage/rarity aggregates are kept up to date on every change rather
+    than recomputed.
+    """
+    __slots__ = ('_counts', '_by_rarity', '_by_band', '_size', '_total_damage', '_rarity_counts', '_tracker')
 
-    def add_inventory(self, i: Item) -> None:
+    def __init__(self, items: Optional[Iterable[Item]] = None):
+        """
+        Args:
+            items (Iterable[Item], optional): Items to start with. Defaults to None.
+        """
+        # item -> count; the dict keeps first-added order and the first instance added
+        self._counts: dict[Item, int] = {}
+        # Secondary indexes: rarity / damage band -> items
+        self._by_rarity: dict[str, dict[Item, None]] = {}
+        self._by_band: dict[int, dict[Item, None]] = {}
+        # Aggregates
+        self._size = 0
+        self._total_damage = 0
+        self._rarity_counts: dict[str, int] = {}
+        # Change tracker reporting this inventory's changes, once it is watched
+        self._tracker: Optional['ChangeTracker'] = None
+
+        for i in items or []:
+            self.add_inventory(i)
+
+    def add_inventory(self, i: Item, count: int = 1) -> None:
         """
         Adds a given item, i, to the Inventory
 
         Args:
             i (Item): Item to add to inventory
+            count (int, optional): How many to add. Defaults to 1.
+
+        Raises:
+            ValueError: If count is not positive
         """
-        self.items.append(i)
-        
-    def remove_inventory(self, i: Item) -> None:
+        if count <= 0:
+            raise ValueError(f"Cannot add {count} of an item")
+        current = self._counts.get(i)
+        if current is None:
+            self._counts[i] = count
+            self._by_rarity.setdefault(i.rarity, {})[i] = None
+            self._by_band.setdefault(i.damage // DAMAGE_BAND_SIZE, {})[i] = None
+        else:
+            self._counts[i] = current + count
+
+        self._size += count
+        self._total_damage += i.damage * count
+        self._rarity_counts[i.rarity] = self._rarity_counts.get(i.rarity, 0) + count
+        if self._tracker is not None:
+            self._tracker.record(self, ('items',))
+
+    def remove_inventory(self, i: Item, count: int = 1) -> None:
         """
-        Removes a given item from the inventory
+        Removes a given item from the inventory. Removing more than are held
+        removes the whole stack rather than raising.
 
         Args:
             i (Item): Item to remove from
+            count (int, optional): How many to remove; capped at the number held. Defaults to 1.
+
+        Raises:
+            ValueError: If count is not positive or the item is not in the inventory
         """
-        self.items.remove(i)
-    
+        if count <= 0:
+            raise ValueError(f"Cannot remove {count} of an item")
+        current = self._counts.get(i)
+        if current is None:
+            raise ValueError(f"'{i.name}' is not in the inventory")
+
+        count = min(count, current)
+        if count == current:
+            del self._counts[i]
+            self._unindex(self._by_rarity, i.rarity, i)
+            self._unindex(self._by_band, i.damage // DAMAGE_BAND_SIZE, i)
+        else:
+            self._counts[i] = current - count
+
+        self._size -= count
+        self._total_damage -= i.damage * count
+        left = self._rarity_counts[i.rarity] - count
+        if left:
+            self._rarity_counts[i.rarity] = left
+        else:
+            del self._rarity_counts[i.rarity]
+        if self._tracker is not None:
+            self._tracker.record(self, ('items',))
+
+    @staticmethod
+    def _unindex(index: dict, bucket, i: Item) -> None:
+        members = index[bucket]
+        del members[i]
+        if not members:
+            del index[bucket]
+
     def update_inventory(self) -> None:
         pass
-    
\ No newline at end of file
+
+    # Queries
+
+    def stacks(self) -> list[tuple[Item, int]]:
+        """
+        Returns each distinct item with how many are held
+
+        Returns:
+            list[tuple[Item, int]]: (item, count) pairs in first-added order
+        """
+        return list(self._counts.items())
+
+    def count(self, i: Item) -> int:
+        """
+        Returns how many of an item are held
+
+        Args:
+            i (Item): Item to count
+
+        Returns:
+            int: Number held, 0 if none
+        """
+        return self._counts.get(i, 0)
+
+    def items_by_rarity(self, rarity: str) -> list[Item]:
+        """
+        Returns the distinct items of a rarity
+
+        Args:
+            rarity (str): Rarity to look up
+
+        Returns:
+            list[Item]: One entry per stack
+        """
+        return list(self._by_rarity.get(rarity, ()))
+
+    def items_in_damage_range(self, low: int, high: int) -> list[Item]:
+        """
+        Returns the distinct items with damage in [low, high], visiting only
+        the damage bands that overlap the range
+
+        Args:
+            low (int): Lowest damage (inclusive)
+            high (int): Highest damage (inclusive)
+
+        Returns:
+            list[Item]: One entry per stack, grouped by damage band
+        """
+        first, last = low // DAMAGE_BAND_SIZE, high // DAMAGE_BAND_SIZE
+        if last - first >= len(self._by_band):
+            # Wide range: cheaper to visit the bands that exist
+            bands = sorted(b for b in self._by_band if first <= b <= last)
+        else:
+            bands = range(first, last + 1)
+
+        found = []
+        for band in bands:
+            for i in self._by_band.get(band, ()):
+                if low <= i.damage <= high:
+                    found.append(i)
+        return found
+
+    def total_damage(self) -> int:
+        """
+        Returns the summed damage of every item held, counting stacks in full
+
+        Returns:
+            int: Total damage
+        """
+        return self._total_damage
+
+    def rarity_counts(self) -> dict[str, int]:
+        """
+        Returns how many items of each rarity are held
+
+        Returns:
+            dict[str, int]: Count per rarity
+        """
+        return dict(self._rarity_counts)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, i: Item) -> bool:
+        return i in self._counts
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Inventory):
+            return self._counts == other._counts
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Inventory(stacks={self.stacks()!r})"
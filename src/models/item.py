@@ -1,14 +1,21 @@
 from dataclasses import dataclass
+from sys import intern
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Item:
+    # Immutable item definition, shared through ItemCatalog; inventories and
+    # quests hold references to it rather than copies
     name: str
     rarity: str
     damage: int
     description: str 
+
+    def __post_init__(self):
+        # Rarity is one of a few fixed values; intern it even for items made outside the catalog
+        object.__setattr__(self, 'rarity', intern(self.rarity))
         
     def use_item(self) -> None:
         """
         Prints a statement saying the item was used.
         """
-        print(f'Used: {self.name}')
\ No newline at end of file
+        print(f'Used: {self.name}')
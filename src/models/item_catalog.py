@@ -0,0 +1,71 @@
+import sys
+from .item import Item
+
+
+class ItemCatalog:
+    """
+    Flyweight store of item definitions: each distinct item exists once,
+    and every inventory, reward list or loader that asks for it gets the
+    same immutable instance (with interned strings).
+    """
+    def __init__(self):
+        self._items: dict[Item, Item] = {}
+
+    def get(self, name: str, rarity: str, damage: int, description: str = "") -> Item:
+        """
+        Returns the shared definition for an item, creating it on first use
+
+        Args:
+            name (str): Item name
+            rarity (str): Item rarity
+            damage (int): Item damage
+            description (str, optional): Item description. Defaults to "".
+
+        Returns:
+            Item: Shared item definition
+        """
+        key = Item(name, rarity, damage, description)
+        item = self._items.get(key)
+        if item is None:
+            item = self.intern(key)
+        return item
+
+    def intern(self, item: Item) -> Item:
+        """
+        Returns the shared definition equal to an item, registering the item
+        (with its strings interned) if the catalog has no such definition yet
+
+        Args:
+            item (Item): Item to look up
+
+        Returns:
+            Item: Shared item definition
+        """
+        shared = self._items.get(item)
+        if shared is None:
+            intern = sys.intern
+            shared = Item(intern(item.name), intern(item.rarity), item.damage, intern(item.description))
+            self._items[shared] = shared
+        return shared
+
+    def find(self, name: str) -> list[Item]:
+        """
+        Returns every definition with the given name
+
+        Args:
+            name (str): Item name
+
+        Returns:
+            list[Item]: Matching definitions
+        """
+        return [i for i in self._items if i.name == name]
+
+    def __contains__(self, item: Item) -> bool:
+        return item in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+# Catalog shared by the GUI and the stores
+default_catalog = ItemCatalog()
@@ -0,0 +1,101 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .campaign import Campaign
+    from .user import User
+
+
+class PermissionIndex:
+    """
+    Reverse index from users to the campaigns they can view or edit.
+
+    Campaigns keep their own viewer/editor sets for O(1) checks; once a
+    campaign is added here it reports every grant and revoke, so listing
+    a user's campaigns is O(k) in the number of campaigns they can see
+    rather than a scan of every campaign. Users are keyed by username.
+    """
+    def __init__(self):
+        # username -> {id(campaign): campaign}; dicts keep grant order
+        self._viewable: dict[str, dict[int, 'Campaign']] = {}
+        self._editable: dict[str, dict[int, 'Campaign']] = {}
+
+    def add_campaign(self, campaign: 'Campaign') -> None:
+        """
+        Indexes a campaign's current members and tracks its future changes
+
+        Args:
+            campaign (Campaign): Campaign to index
+        """
+        campaign._acl_index = self
+        for username in campaign.viewer_ids():
+            self.on_grant(campaign, username, False)
+        for username in campaign.editor_ids():
+            self.on_grant(campaign, username, True)
+
+    def remove_campaign(self, campaign: 'Campaign') -> None:
+        """
+        Drops a campaign from the index, e.g. when it is deleted
+
+        Args:
+            campaign (Campaign): Campaign to drop
+        """
+        for username in campaign.viewer_ids():
+            self.on_revoke(campaign, username, False)
+        for username in campaign.editor_ids():
+            self.on_revoke(campaign, username, True)
+        if campaign._acl_index is self:
+            campaign._acl_index = None
+
+    def on_grant(self, campaign: 'Campaign', username: str, edit: bool) -> None:
+        """
+        Records that a user was granted view or edit access. Called by Campaign.
+
+        Args:
+            campaign (Campaign): Campaign the access is for
+            username (str): User granted access
+            edit (bool): True for edit access, False for view access
+        """
+        index = self._editable if edit else self._viewable
+        index.setdefault(username, {})[id(campaign)] = campaign
+
+    def on_revoke(self, campaign: 'Campaign', username: str, edit: bool) -> None:
+        """
+        Records that a user lost view or edit access. Called by Campaign.
+
+        Args:
+            campaign (Campaign): Campaign the access was for
+            username (str): User whose access was revoked
+            edit (bool): True for edit access, False for view access
+        """
+        index = self._editable if edit else self._viewable
+        campaigns = index.get(username)
+        if campaigns is not None:
+            campaigns.pop(id(campaign), None)
+            if not campaigns:
+                del index[username]
+
+    def visible_campaigns(self, user: 'User') -> list['Campaign']:
+        """
+        Returns every indexed campaign the user can view (editors can always view)
+
+        Args:
+            user (User): User to look up
+
+        Returns:
+            list[Campaign]: Viewable campaigns in the order access was granted
+        """
+        visible = dict(self._viewable.get(user.username, {}))
+        visible.update(self._editable.get(user.username, {}))
+        return list(visible.values())
+
+    def editable_campaigns(self, user: 'User') -> list['Campaign']:
+        """
+        Returns every indexed campaign the user can edit
+
+        Args:
+            user (User): User to look up
+
+        Returns:
+            list[Campaign]: Editable campaigns in the order access was granted
+        """
+        return list(self._editable.get(user.username, {}).values())
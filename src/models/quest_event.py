@@ -1,29 +1,154 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
-from core import GameTime
-from models import Realm, Character, Item
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence, Union
+from core import GameTime, GameDuration
+from .realm import Realm
+from .character import Character
+from .item import Item
 
+if TYPE_CHECKING:
+    from .changes import ChangeTracker
 
-@dataclass
+
+# Display value for a quest without an end time
+NO_END_TIME = "N/A"
+
+
+@dataclass(slots=True)
 class Quest_Event:
+    # time and end are the source of truth; start_time/end_time display
+    # strings are derived from them (and cached by GameTime)
     name: str
     c_realm: Realm
     time: GameTime
-    start_time: str
-    end_time: str = "N/A"
-    
-    partaking_users: List[Character] = field(default_factory=list)
-    reward_items: List[Item] = field(default_factory=list)
-    required_items: List[Item] = field(default_factory=list)
+    end: Optional[GameTime] = None
+
+    # Most quests have no participants or items, so these lists are only
+    # allocated once something is added; None stands for empty
+    _partaking_users: Optional[List[Character]] = field(default=None, init=False, repr=False)
+    _reward_items: Optional[List[Item]] = field(default=None, init=False, repr=False)
+    _required_items: Optional[List[Item]] = field(default=None, init=False, repr=False)
+
+    # Stable id within the campaign, assigned by Campaign when the quest is added
+    quest_id: Optional[int] = field(default=None, compare=False)
+
+    # Storage row id, assigned when the quest is first saved
+    db_id: Optional[int] = field(default=None, repr=False, compare=False)
+
+    # Change tracker reporting this quest's changes, once it is watched
+    _tracker: Optional['ChangeTracker'] = field(default=None, init=False, repr=False, compare=False)
         
+    @property
+    def partaking_users(self) -> Sequence[Character]:
+        return self._partaking_users or ()
+
+    @partaking_users.setter
+    def partaking_users(self, characters: Iterable[Character]) -> None:
+        self._partaking_users = list(characters) or None
+        if self._tracker is not None:
+            self._tracker.record(self, ('partaking_users',))
+
+    @property
+    def reward_items(self) -> Sequence[Item]:
+        return self._reward_items or ()
+
+    @reward_items.setter
+    def reward_items(self, items: Iterable[Item]) -> None:
+        self._reward_items = list(items) or None
+        if self._tracker is not None:
+            self._tracker.record(self, ('reward_items',))
+
+    @property
+    def required_items(self) -> Sequence[Item]:
+        return self._required_items or ()
+
+    @required_items.setter
+    def required_items(self, items: Iterable[Item]) -> None:
+        self._required_items = list(items) or None
+        if self._tracker is not None:
+            self._tracker.record(self, ('required_items',))
+
+    def add_participant(self, character: Character) -> None:
+        """
+        Adds a character to the quest's participants
+
+        Args:
+            character (Character): Character taking part
+        """
+        if self._partaking_users is None:
+            self._partaking_users = []
+        self._partaking_users.append(character)
+        if self._tracker is not None:
+            self._tracker.record(self, ('partaking_users',))
+
+    def add_reward_item(self, item: Item) -> None:
+        """
+        Adds an item to the quest's rewards
+
+        Args:
+            item (Item): Item granted on completion
+        """
+        if self._reward_items is None:
+            self._reward_items = []
+        self._reward_items.append(item)
+        if self._tracker is not None:
+            self._tracker.record(self, ('reward_items',))
+
+    def add_required_item(self, item: Item) -> None:
+        """
+        Adds an item the quest requires
+
+        Args:
+            item (Item): Item needed to take part
+        """
+        if self._required_items is None:
+            self._required_items = []
+        self._required_items.append(item)
+        if self._tracker is not None:
+            self._tracker.record(self, ('required_items',))
+
+    @property
+    def start_time(self) -> str:
+        return self.time.get_fulltime()
+
+    @property
+    def end_time(self) -> str:
+        return self.end.get_fulltime() if self.end is not None else NO_END_TIME
+
+    @end_time.setter
+    def end_time(self, text: str) -> None:
+        # Legacy string assignment, parsed once into structured time
+        self.end = None if text == NO_END_TIME else GameTime.from_fulltime(text)
+
+    @property
+    def start_ticks(self) -> int:
+        return self.time.ticks
+
+    @property
+    def end_ticks(self) -> Optional[int]:
+        return self.end.ticks if self.end is not None else None
+
+    def get_duration(self) -> Optional[GameDuration]:
+        """
+        Returns how long the quest lasts
+
+        Returns:
+            Optional[GameDuration]: Duration of the quest, or None if it has no end time
+        """
+        if self.end is None:
+            return None
+        return self.end - self.time
+
     def set_realm(self, realm: Realm) -> None:
         """
-        Sets the realm for the Quest_Event
+        Sets the realm for the Quest_Event. Quests in a campaign should be
+        moved through Campaign.update_quest so the realm index stays current.
 
         Args:
             realm (Realm): Given Realm object where the Quest_Event will take place
         """
         self.c_realm = realm
+        if self._tracker is not None:
+            self._tracker.record(self, ('c_realm',))
     
     def set_name(self, n_name: str) -> None:
         """
@@ -33,24 +158,36 @@ class Quest_Event:
             n_name (str): Name to change Quest_Event's name to
         """
         self.name = n_name
+        if self._tracker is not None:
+            self._tracker.record(self, ('name',))
         
-    def set_starttime(self, new_start: str) -> None:
+    def set_starttime(self, new_start: Union[GameTime, str]) -> None:
         """
-        Sets a new start time for the Quest_Event
+        Sets a new start time for the Quest_Event. Quests owned by a Campaign
+        should be moved through Campaign.update_quest so its timeline stays sorted.
 
         Args:
-            new_start (str): New start time to update to.
+            new_start (Union[GameTime, str]): New start time, or a legacy "Day D, HH:MM:SS" string
         """
-        self.start_time = new_start
+        if isinstance(new_start, str):
+            new_start = GameTime.from_fulltime(new_start)
+        self.time = new_start
+        if self._tracker is not None:
+            self._tracker.record(self, ('time',))
     
-    def set_endtime(self, new_end: str) -> None:
+    def set_endtime(self, new_end: Union[GameTime, str, None]) -> None:
         """
         Sets a new end time for the Quest_Event
 
         Args:
-            new_end (str): New end time to update to.
+            new_end (Union[GameTime, str, None]): New end time, a legacy string ("N/A" for none), or None
         """
-        self.end_time = new_end
+        if isinstance(new_end, str):
+            self.end_time = new_end
+        else:
+            self.end = new_end
+        if self._tracker is not None:
+            self._tracker.record(self, ('end',))
     
     def grant_item(self, character: Character, item: Item) -> None:
         """
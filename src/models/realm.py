@@ -1,16 +1,58 @@
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
+from core import GameTime
+from core.GameTime import SECONDS_PER_MINUTE
 
 if TYPE_CHECKING:
     from models import User
+    from .changes import ChangeTracker
 
-@dataclass
+# Most local times a realm remembers before evicting the least recently used
+LOCAL_TIME_CACHE_SIZE = 4096
+
+
+@dataclass(slots=True)
 class Realm:
     name: str
     map_id: int
-    time_rule: int
+    # Offset from the World Clock in minutes; read and set through the
+    # time_rule property, since the local-time memo depends on it
+    _time_rule: int
     selected_user: 'User'
     desc: str = "N/A"
+
+    # Local-time memo keyed by world tick, least recently used first; only
+    # valid for the current time_rule
+    _local_cache: OrderedDict = field(default_factory=OrderedDict, init=False, repr=False, compare=False)
+    cache_hits: int = field(default=0, init=False, repr=False, compare=False)
+    cache_misses: int = field(default=0, init=False, repr=False, compare=False)
+
+    # Change tracker reporting this realm's changes, once it is watched
+    _tracker: Optional['ChangeTracker'] = field(default=None, init=False, repr=False, compare=False)
+
+    def __init__(self, name: str, map_id: int, time_rule: int, selected_user: 'User', desc: str = "N/A"):
+        # Written out so the offset is passed as time_rule rather than _time_rule
+        self.name = name
+        self.map_id = map_id
+        self._time_rule = time_rule
+        self.selected_user = selected_user
+        self.desc = desc
+        self._local_cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._tracker = None
+
+    @property
+    def time_rule(self) -> int:
+        return self._time_rule
+
+    @time_rule.setter
+    def time_rule(self, minutes: int) -> None:
+        # A plain write, e.g. storage restoring a saved realm, still drops the stale memo
+        if minutes != self._time_rule:
+            self._local_cache.clear()
+        self._time_rule = minutes
         
     def set_desc(self, text: str) -> None:
         """
@@ -20,6 +62,8 @@ class Realm:
             text (str): New realm description
         """
         self.desc = text
+        if self._tracker is not None:
+            self._tracker.record(self, ('desc',))
     
     def change_name(self, text: str) -> None:
         """
@@ -29,12 +73,84 @@ class Realm:
             text (str): New name for realm
         """
         self.name = text
+        if self._tracker is not None:
+            self._tracker.record(self, ('name',))
         
     def change_time_rule(self, time: int) -> None:
         """
-        Changes the time rule of a realm
+        Changes the time rule of a realm. Memoized local times were
+        computed with the old offset, so they are dropped.
 
         Args:
             time (int): New time rule for realm
         """
-        self.time_rule = time
\ No newline at end of file
+        if time != self._time_rule:
+            self._local_cache.clear()
+        self._time_rule = time
+        if self._tracker is not None:
+            self._tracker.record(self, ('time_rule',))
+
+    def local_time(self, world_time: GameTime) -> GameTime:
+        """
+        Converts a World Clock time to this realm's local time, memoized by world tick.
+        Times before Day 0 are clamped to Day 0, 00:00:00.
+
+        Args:
+            world_time (GameTime): Time in World Clock
+
+        Returns:
+            GameTime: Local time in the realm
+        """
+        ticks = world_time.ticks
+        local = self.cached_local_time(ticks)
+        if local is None:
+            local_ticks = ticks + self._time_rule * SECONDS_PER_MINUTE
+            local = GameTime.from_ticks(local_ticks if local_ticks > 0 else 0)
+            self.remember_local_time(ticks, local)
+        return local
+
+    def cached_local_time(self, ticks: int) -> Optional[GameTime]:
+        """
+        Looks up a memoized local time, counting the hit or miss
+
+        Args:
+            ticks (int): World Clock tick
+
+        Returns:
+            Optional[GameTime]: The local time, or None if it has to be computed
+        """
+        local = self._local_cache.get(ticks)
+        if local is None:
+            self.cache_misses += 1
+        else:
+            self.cache_hits += 1
+            self._local_cache.move_to_end(ticks)
+        return local
+
+    def remember_local_time(self, ticks: int, local: GameTime) -> None:
+        """
+        Memoizes a local time computed outside local_time(), e.g. by a batch conversion
+
+        Args:
+            ticks (int): World Clock tick
+            local (GameTime): Local time for that tick under the current time_rule
+        """
+        cache = self._local_cache
+        if ticks in cache:
+            cache.move_to_end(ticks)
+        elif len(cache) >= LOCAL_TIME_CACHE_SIZE:
+            cache.popitem(last=False)
+        cache[ticks] = local
+
+    def get_cache_stats(self) -> dict:
+        """
+        Returns the local-time cache counters
+
+        Returns:
+            dict: hits, misses and current size of the cache
+        """
+        return {
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'size': len(self._local_cache)
+        }
@@ -0,0 +1,275 @@
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Iterator, Optional
+from .realm import Realm
+
+if TYPE_CHECKING:
+    from .campaign import Campaign
+    from .quest_event import Quest_Event
+    from .user import User
+
+
+class RealmRegistry(Mapping):
+    """
+    The one shared Realm instance per realm, indexed by short key (e.g.
+    "Central"), map_id and display name, plus a reverse index from each
+    realm to the quests and campaigns that use it.
+
+    Behaves as a read-only dict of key -> Realm, so code that iterates or
+    indexes the old realms dict keeps working. Campaigns added with
+    add_campaign() report quest and realm changes, which keeps the reverse
+    index current without walking campaigns. Quests of a campaign that
+    are not loaded yet are counted per realm from the counts given to
+    Campaign.set_quest_loader(), until they load.
+    """
+    def __init__(self, realms: Optional[dict[str, Realm]] = None):
+        """
+        Args:
+            realms (dict[str, Realm], optional): Initial realms by key. Defaults to None.
+        """
+        self._by_key: dict[str, Realm] = {}
+        self._by_id: dict[int, Realm] = {}
+        self._by_name: dict[str, Realm] = {}
+        self._key_by_id: dict[int, str] = {}
+
+        # map_id -> {id(obj): obj}; dicts keep insertion order
+        self._quests: dict[int, dict[int, 'Quest_Event']] = {}
+        self._campaigns: dict[int, dict[int, 'Campaign']] = {}
+        # id(quest) -> campaign holding it, for permission filtering
+        self._quest_campaigns: dict[int, 'Campaign'] = {}
+        # map_id -> {id(campaign): (campaign, count)} for quests not loaded yet
+        self._pending: dict[int, dict[int, tuple['Campaign', int]]] = {}
+
+        for key, realm in (realms or {}).items():
+            self.register(key, realm)
+
+    # Mapping interface over the short keys
+
+    def __getitem__(self, key: str) -> Realm:
+        return self._by_key[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._by_key)
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    # Registry
+
+    def register(self, key: str, realm: Realm) -> Realm:
+        """
+        Adds a realm under a short key. A realm whose map_id is already
+        registered is not duplicated; the registered instance is returned.
+
+        Args:
+            key (str): Short key for the realm, e.g. "Central"
+            realm (Realm): Realm to register
+
+        Returns:
+            Realm: The shared instance for the realm's map_id
+        """
+        existing = self._by_id.get(realm.map_id)
+        if existing is not None:
+            return existing
+        self._by_key[key] = realm
+        self._by_id[realm.map_id] = realm
+        self._by_name[realm.name] = realm
+        self._key_by_id[realm.map_id] = key
+        return realm
+
+    def by_id(self, map_id: int) -> Optional[Realm]:
+        """
+        Looks up a realm by map_id
+
+        Args:
+            map_id (int): Realm's map id
+
+        Returns:
+            Optional[Realm]: The realm, or None if it is not registered
+        """
+        return self._by_id.get(map_id)
+
+    def by_name(self, name: str) -> Optional[Realm]:
+        """
+        Looks up a realm by display name
+
+        Args:
+            name (str): Realm's display name, e.g. "Eastern Highlands"
+
+        Returns:
+            Optional[Realm]: The realm, or None if it is not registered
+        """
+        return self._by_name.get(name)
+
+    def key_of(self, realm: Optional[Realm], default: Optional[str] = None) -> Optional[str]:
+        """
+        Returns the short key a realm is registered under
+
+        Args:
+            realm (Optional[Realm]): Realm to look up
+            default (Optional[str], optional): Returned if the realm is not registered. Defaults to None.
+
+        Returns:
+            Optional[str]: The realm's key, or default
+        """
+        if realm is None:
+            return default
+        return self._key_by_id.get(realm.map_id, default)
+
+    def rename(self, realm: Realm, name: str) -> None:
+        """
+        Renames a realm, keeping the name index in step
+
+        Args:
+            realm (Realm): Registered realm
+            name (str): New display name
+        """
+        self._by_name.pop(realm.name, None)
+        realm.change_name(name)
+        self._by_name[name] = realm
+
+    # Reverse index
+
+    def quests_in(self, realm: Realm, viewer: Optional['User'] = None) -> list['Quest_Event']:
+        """
+        Returns every loaded quest that takes place in a realm. With a
+        viewer, quests whose campaign is not known are left out.
+
+        Args:
+            realm (Realm): Realm to look up
+            viewer (Optional[User], optional): Only return quests of campaigns this user can view. Defaults to None.
+
+        Returns:
+            list[Quest_Event]: Quests in the order they were indexed
+        """
+        quests = self._quests.get(realm.map_id, {})
+        if viewer is None:
+            return list(quests.values())
+        campaigns = self._quest_campaigns
+        return [q for key, q in quests.items()
+                if key in campaigns and campaigns[key].can_view(viewer)]
+
+    def quest_count_in(self, realm: Realm, viewer: Optional['User'] = None) -> int:
+        """
+        Counts the quests that take place in a realm, loaded or not, without
+        loading any. With a viewer, quests whose campaign is not known are
+        left out.
+
+        Args:
+            realm (Realm): Realm to look up
+            viewer (Optional[User], optional): Only count quests of campaigns this user can view. Defaults to None.
+
+        Returns:
+            int: Number of quests in the realm
+        """
+        pending = self._pending.get(realm.map_id, {}).values()
+        if viewer is None:
+            return len(self._quests.get(realm.map_id, {})) + sum(count for _, count in pending)
+        return (len(self.quests_in(realm, viewer))
+                + sum(count for campaign, count in pending if campaign.can_view(viewer)))
+
+    def campaigns_in(self, realm: Realm, viewer: Optional['User'] = None) -> list['Campaign']:
+        """
+        Returns every indexed campaign whose home realm is a realm
+
+        Args:
+            realm (Realm): Realm to look up
+            viewer (Optional[User], optional): Only return campaigns this user can view. Defaults to None.
+
+        Returns:
+            list[Campaign]: Campaigns in the order they were indexed
+        """
+        campaigns = self._campaigns.get(realm.map_id, {}).values()
+        if viewer is None:
+            return list(campaigns)
+        return [c for c in campaigns if c.can_view(viewer)]
+
+    def add_campaign(self, campaign: 'Campaign') -> None:
+        """
+        Indexes a campaign and its loaded quests, and tracks their future
+        realm changes. Quests of a lazily loaded campaign are counted per
+        realm until they load, then indexed.
+
+        Args:
+            campaign (Campaign): Campaign to index
+        """
+        campaign._realm_index = self
+        self.on_campaign_realm(campaign, None, campaign.c_realm)
+        if campaign.is_loaded():
+            for quest in campaign.quests:
+                self.on_quest_realm(quest, None, quest.c_realm, campaign)
+        else:
+            for map_id, count in (campaign.quest_realm_counts() or {}).items():
+                self._pending.setdefault(map_id, {})[id(campaign)] = (campaign, count)
+
+    def remove_campaign(self, campaign: 'Campaign') -> None:
+        """
+        Drops a campaign and its quests from the index
+
+        Args:
+            campaign (Campaign): Campaign to drop
+        """
+        self.on_campaign_realm(campaign, campaign.c_realm, None)
+        if campaign.is_loaded():
+            for quest in campaign.quests:
+                self.on_quest_realm(quest, quest.c_realm, None)
+        else:
+            self._drop_pending(campaign)
+        if campaign._realm_index is self:
+            campaign._realm_index = None
+
+    def on_quests_loaded(self, campaign: 'Campaign') -> None:
+        """
+        Drops a campaign's per-realm quest counts once its quests are
+        indexed one by one. Called by Campaign.
+
+        Args:
+            campaign (Campaign): Campaign whose quests loaded
+        """
+        self._drop_pending(campaign)
+
+    def _drop_pending(self, campaign: 'Campaign') -> None:
+        for map_id in campaign.quest_realm_counts() or {}:
+            members = self._pending.get(map_id)
+            if members is not None:
+                members.pop(id(campaign), None)
+                if not members:
+                    del self._pending[map_id]
+
+    def on_campaign_realm(self, campaign: 'Campaign', old: Optional[Realm], new: Optional[Realm]) -> None:
+        """
+        Moves a campaign between realms in the index. Called by Campaign.
+
+        Args:
+            campaign (Campaign): Campaign that moved
+            old (Optional[Realm]): Previous realm, or None if it is being added
+            new (Optional[Realm]): New realm, or None if it is being removed
+        """
+        self._move(self._campaigns, campaign, old, new)
+
+    def on_quest_realm(self, quest: 'Quest_Event', old: Optional[Realm], new: Optional[Realm],
+                       campaign: Optional['Campaign'] = None) -> None:
+        """
+        Moves a quest between realms in the index. Called by Campaign.
+
+        Args:
+            quest (Quest_Event): Quest that moved
+            old (Optional[Realm]): Previous realm, or None if it is being added
+            new (Optional[Realm]): New realm, or None if it is being removed
+            campaign (Optional[Campaign], optional): Campaign holding the quest. Defaults to None.
+        """
+        self._move(self._quests, quest, old, new)
+        if new is None:
+            self._quest_campaigns.pop(id(quest), None)
+        elif campaign is not None:
+            self._quest_campaigns[id(quest)] = campaign
+
+    @staticmethod
+    def _move(index: dict, obj, old: Optional[Realm], new: Optional[Realm]) -> None:
+        if old is not None:
+            members = index.get(old.map_id)
+            if members is not None:
+                members.pop(id(obj), None)
+                if not members:
+                    del index[old.map_id]
+        if new is not None:
+            index.setdefault(new.map_id, {})[id(obj)] = obj
@@ -2,13 +2,16 @@ from typing import TYPE_CHECKING, Optional
 from core import GameTime
 
 if TYPE_CHECKING:
-    from .User_Settings import User_Settings
-    from .Character import Character
-    from .Realm import Realm
-    from .Quest_Event import Quest_Event
+    from .user_settings import User_Settings
+    from .character import Character
+    from .realm import Realm
+    from .quest_event import Quest_Event
+    from .changes import ChangeTracker
 
 
 class User:
+    __slots__ = ('username', 'number_of_campaigns', 'user_settings', 'campaigns', 'characters', '_tracker')
+
     def __init__(self, 
                  username: str,
                  number_of_campaigns: int,
@@ -22,6 +25,8 @@ class User:
         self.user_settings = user_settings
         self.campaigns = campaigns if campaigns is not None else []
         self.characters = characters if characters is not None else []
+        # Change tracker reporting this user's changes, once they are watched
+        self._tracker: Optional['ChangeTracker'] = None
 
     def create_camp(self, c_name: str,
                     activity: bool,
@@ -31,7 +36,7 @@ class User:
                     quests: list['Quest_Event'],
                     # should be list of users and same for edit_users
                     permitted_users: list['User'],
-                    edit_users: list['User']) -> None:
+                    edit_users: list['User']) -> 'Campaign':
         """
         Creates a new campaign for the user
 
@@ -44,14 +49,21 @@ class User:
             quests (list[&#39;Quest_Event&#39;]): List of Quest_Events for Campaign
             permitted_users (list[&#39;User&#39;]): List of permitted users for Campaign
             edit_users (list[&#39;User&#39;]): List of users with edit permissions for Campaign
+
+        Returns:
+            Campaign: The campaign we created
         """
 
-        from .Campaign import Campaign  # avoids circular import at module level
+        from .campaign import Campaign  # avoids circular import at module level
 
         new_camp = Campaign(c_name, activity, time, realm,
                             events_display, quests, permitted_users, edit_users)
 
         self.campaigns.append(new_camp)
+        if self._tracker is not None:
+            self._tracker.watch_campaign(new_camp, self)
+            self._tracker.added(new_camp, self, 'campaigns')
+        return new_camp
 
     def update_camp(self, c_num: int, name: str, change_act_status: bool) -> None:
         """ 
@@ -86,4 +98,39 @@ class User:
         if c_num < 0 or c_num >= len(self.campaigns):
             raise IndexError("Quest index out of range")
 
-        self.campaigns.pop(c_num)
+        camp = self.campaigns.pop(c_num)
+        if self._tracker is not None:
+            self._tracker.removed(camp, self, 'campaigns')
+
+    def add_character(self, character: 'Character') -> None:
+        """
+        Adds a character to the user's roster
+
+        Args:
+            character (Character): New character
+        """
+        self.characters.append(character)
+        if self._tracker is not None:
+            self._tracker.watch_character(character, self)
+            self._tracker.added(character, self, 'characters')
+
+    def remove_character(self, char_idx: int) -> 'Character':
+        """
+        Removes a character from the user's roster
+
+        Args:
+            char_idx (int): Position of the character
+
+        Raises:
+            IndexError: If there is no character at that position
+
+        Returns:
+            Character: The removed character
+        """
+        if char_idx < 0 or char_idx >= len(self.characters):
+            raise IndexError("Character index out of range")
+
+        character = self.characters.pop(char_idx)
+        if self._tracker is not None:
+            self._tracker.removed(character, self, 'characters')
+        return character
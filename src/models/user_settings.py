@@ -1,12 +1,19 @@
-from dataclasses import dataclass
-from .Realm import Realm
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+from .realm import Realm
 
-@dataclass
+if TYPE_CHECKING:
+    from .changes import ChangeTracker
+
+@dataclass(slots=True)
 class User_Settings:
     time_display: str = '12hr'
     switch_theme: bool = False
     current_realm: Realm = None
 
+    # Change tracker reporting these settings' changes, once they are watched
+    _tracker: Optional['ChangeTracker'] = field(default=None, init=False, repr=False, compare=False)
+
     def set_display(self, s:str) -> None:
         """
         Setter method for new time display setting
@@ -15,6 +22,8 @@ class User_Settings:
             s (str): New time display setting
         """
         self.time_display = s
+        if self._tracker is not None:
+            self._tracker.record(self, ('time_display',))
 
     def set_theme(self) -> None:
         """
@@ -0,0 +1,56 @@
+import os
+import sys
+
+from .sqlite_store import SQLiteStore
+from .journal_store import JournalStore
+from .binary_format import dumps, loads, dump_file, load_file
+
+
+def open_store(path: str):
+    """
+    Opens the store type matching a path: a directory (or a path ending in
+    ".journal") is a JournalStore, anything else an SQLite database.
+
+    Args:
+        path (str): Database file or journal directory
+
+    Returns:
+        SQLiteStore | JournalStore: The opened store
+    """
+    if path.endswith(".journal") or os.path.isdir(path):
+        return JournalStore(path)
+    return SQLiteStore(path)
+
+
+# Environment variable overriding where GuildQuest keeps its data
+DATA_PATH_ENV = "GUILDQUEST_DATA"
+
+
+def default_data_path() -> str:
+    """
+    Returns where GuildQuest keeps its data unless told otherwise: the
+    GUILDQUEST_DATA environment variable if set, otherwise guildquest.db in
+    the per-user data directory (%APPDATA% on Windows, ~/Library/Application
+    Support on macOS, $XDG_DATA_HOME or ~/.local/share elsewhere). The
+    directory is created if missing.
+
+    Returns:
+        str: Database file or journal directory path
+    """
+    path = os.environ.get(DATA_PATH_ENV)
+    if path:
+        return path
+
+    home = os.path.expanduser("~")
+    if sys.platform == "win32":
+        base = os.environ.get("APPDATA") or os.path.join(home, "AppData", "Roaming")
+    elif sys.platform == "darwin":
+        base = os.path.join(home, "Library", "Application Support")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.join(home, ".local", "share")
+    data_dir = os.path.join(base, "guildquest")
+    os.makedirs(data_dir, exist_ok=True)
+    return os.path.join(data_dir, "guildquest.db")
+
+
+__all__ = ['SQLiteStore', 'JournalStore', 'open_store', 'default_data_path', 'dumps', 'loads', 'dump_file', 'load_file']
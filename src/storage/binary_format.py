@@ -0,0 +1,400 @@
+"""
+Versioned binary format for the User/Campaign/Quest graph, built on struct.
+
+Layout (little-endian, no padding):
+
+    header      magic "GQBF", version u16, root user count u32
+    strings     count u32, then (length u32, UTF-8 bytes) per string
+    realms      count u32, then one _REALM record per realm
+    items       count u32, then one _ITEM record per item
+    characters  count u32, then _CHARACTER + (item ref, count) pairs per character
+    users       count u32, then _USER + campaign refs + character refs per user
+    campaigns   count u32, then _CAMPAIGN + member refs + quests per campaign
+
+Every string is written once in the string table and every realm, item,
+character, user and campaign once in its own table; records refer to them
+by index, so shared objects and reference cycles (Realm.selected_user,
+campaign member lists) round-trip as shared objects. Storage ids
+(db_id) of campaigns, characters and quests are kept, so a store can use
+the format for its snapshots. Decoding walks a
+memoryview of the input, so a memory-mapped file is never copied whole.
+"""
+
+import mmap
+import struct
+from array import array
+from struct import Struct
+from typing import Optional
+from core import GameTime, CampaignClock
+from models import Campaign, Character, Item, Quest_Event, Realm, User, User_Settings, default_catalog
+
+
+MAGIC = b'GQBF'
+FORMAT_VERSION = 1
+
+# Reference to "no object" (None) in any index field
+NO_REF = 0xFFFFFFFF
+# Quest id or storage id field of an object that has no id yet (None); real ids count up from 1
+NO_ID = -(1 << 63)
+
+# What a corrupt buffer can raise while decoding: short reads, table
+# indices out of range, and bytes that are not UTF-8
+_DECODE_ERRORS = (struct.error, IndexError, KeyError, UnicodeDecodeError, OverflowError)
+
+_HEADER = Struct('<4sHI')
+_U32 = Struct('<I')
+# map_id, key, name, time_rule, desc, selected_user
+_REALM = Struct('<qIIqII')
+# name, rarity, damage, description
+_ITEM = Struct('<IIqI')
+# db_id, name, character_class, level, inventory stack count
+_CHARACTER = Struct('<qIIqI')
+# username, time_display, switch_theme, current_realm, campaign count, character count
+_USER = Struct('<IIBIII')
+# db_id, title, activity, start ticks, realm, events_display, has clock, clock ticks, clock rate,
+# permitted count, edit count, quest count
+_CAMPAIGN = Struct('<qIBqIIBqdIII')
+# db_id, quest id, name, realm, start ticks, end ticks, has end, partaking count, reward count, required count
+_QUEST = Struct('<qqIIqqBIII')
+
+
+class _Encoder:
+    """
+    Internal helper that assigns table indices to every reachable object,
+    then writes the tables in dependency order
+    """
+    def __init__(self):
+        self.strings: dict[str, int] = {}
+        # id(obj) -> index, plus the objects in index order, per table
+        self.realm_ids: dict[int, int] = {}
+        self.realms: list[Realm] = []
+        self.item_ids: dict[int, int] = {}
+        self.items: list[Item] = []
+        self.character_ids: dict[int, int] = {}
+        self.characters: list[Character] = []
+        self.user_ids: dict[int, int] = {}
+        self.users: list[User] = []
+        self.campaign_ids: dict[int, int] = {}
+        self.campaigns: list[Campaign] = []
+        self.realm_keys: dict[int, str] = {}
+
+    def string(self, text: Optional[str]) -> int:
+        if text is None:
+            return NO_REF
+        idx = self.strings.get(text)
+        if idx is None:
+            idx = self.strings[text] = len(self.strings)
+        return idx
+
+    def _add(self, obj, ids: dict, objs: list) -> bool:
+        if obj is None or id(obj) in ids:
+            return False
+        ids[id(obj)] = len(objs)
+        objs.append(obj)
+        return True
+
+    def collect(self, users: list[User], realms: dict[str, Realm]) -> None:
+        """
+        Walks the graph from the root users and keyed realms
+        """
+        for key, realm in realms.items():
+            self.realm_keys[id(realm)] = key
+            self._add(realm, self.realm_ids, self.realms)
+
+        pending = list(users)
+        for user in users:
+            self._add(user, self.user_ids, self.users)
+        for realm in self.realms:
+            if self._add(realm.selected_user, self.user_ids, self.users):
+                pending.append(realm.selected_user)
+
+        while pending:
+            user = pending.pop()
+            self.realm(user.user_settings.current_realm, pending)
+            for character in user.characters:
+                self.character(character)
+            for campaign in user.campaigns:
+                if not self._add(campaign, self.campaign_ids, self.campaigns):
+                    continue
+                self.realm(campaign.c_realm, pending)
+                for member in campaign.permitted_users + campaign.edit_users:
+                    if self._add(member, self.user_ids, self.users):
+                        pending.append(member)
+                for quest in campaign.quests:
+                    self.realm(quest.c_realm, pending)
+                    for character in quest.partaking_users:
+                        self.character(character)
+                    for item in quest.reward_items:
+                        self._add(item, self.item_ids, self.items)
+                    for item in quest.required_items:
+                        self._add(item, self.item_ids, self.items)
+
+    def realm(self, realm: Optional[Realm], pending: list) -> None:
+        if self._add(realm, self.realm_ids, self.realms):
+            if self._add(realm.selected_user, self.user_ids, self.users):
+                pending.append(realm.selected_user)
+
+    def character(self, character: Character) -> None:
+        if self._add(character, self.character_ids, self.characters):
+            for item, _ in character.curr_inventory.stacks():
+                self._add(item, self.item_ids, self.items)
+
+    def refs(self, ids: dict, objs: list) -> bytes:
+        return array('I', [ids[id(o)] for o in objs]).tobytes() if objs else b''
+
+    def write(self, root_count: int) -> bytes:
+        """
+        Writes every table; the string table is filled in as records are
+        written, so it is assembled last and placed first
+        """
+        string = self.string
+        user_ids = self.user_ids
+        realm_ids = self.realm_ids
+        item_ids = self.item_ids
+        character_ids = self.character_ids
+
+        def ref(ids: dict, obj) -> int:
+            return NO_REF if obj is None else ids[id(obj)]
+
+        body = []
+        out = body.append
+
+        out(_U32.pack(len(self.realms)))
+        for r in self.realms:
+            out(_REALM.pack(r.map_id, string(self.realm_keys.get(id(r))), string(r.name), r.time_rule,
+                            string(r.desc), ref(user_ids, r.selected_user)))
+
+        out(_U32.pack(len(self.items)))
+        for i in self.items:
+            out(_ITEM.pack(string(i.name), string(i.rarity), i.damage, string(i.description)))
+
+        out(_U32.pack(len(self.characters)))
+        for c in self.characters:
+            stacks = c.curr_inventory.stacks()
+            out(_CHARACTER.pack(NO_ID if c.db_id is None else c.db_id,
+                                string(c.name), string(c.character_class), c.level, len(stacks)))
+            if stacks:
+                out(array('I', [n for item, count in stacks for n in (item_ids[id(item)], count)]).tobytes())
+
+        out(_U32.pack(len(self.users)))
+        for u in self.users:
+            s = u.user_settings
+            out(_USER.pack(string(u.username), string(s.time_display), bool(s.switch_theme),
+                           ref(realm_ids, s.current_realm), len(u.campaigns), len(u.characters)))
+            out(self.refs(self.campaign_ids, u.campaigns))
+            out(self.refs(character_ids, u.characters))
+
+        pack_quest = _QUEST.pack
+        out(_U32.pack(len(self.campaigns)))
+        for c in self.campaigns:
+            clock = c.clock
+            quests = c.quests
+            out(_CAMPAIGN.pack(NO_ID if c.db_id is None else c.db_id, string(c.title), bool(c.activity), c.time.ticks, ref(realm_ids, c.c_realm),
+                               string(c.events_display), clock is not None,
+                               clock.get_ticks() if clock is not None else 0,
+                               clock.rate if clock is not None else 0.0,
+                               len(c.permitted_users), len(c.edit_users), len(quests)))
+            out(self.refs(user_ids, c.permitted_users))
+            out(self.refs(user_ids, c.edit_users))
+            for q in quests:
+                end = q.end
+                partaking, reward, required = q.partaking_users, q.reward_items, q.required_items
+                out(pack_quest(NO_ID if q.db_id is None else q.db_id, NO_ID if q.quest_id is None else q.quest_id,
+                               string(q.name), ref(realm_ids, q.c_realm), q.time.ticks,
+                               end.ticks if end is not None else 0, end is not None,
+                               len(partaking), len(reward), len(required)))
+                if partaking or reward or required:
+                    out(self.refs(character_ids, partaking))
+                    out(self.refs(item_ids, reward))
+                    out(self.refs(item_ids, required))
+
+        head = [_HEADER.pack(MAGIC, FORMAT_VERSION, root_count), _U32.pack(len(self.strings))]
+        for text in self.strings:
+            data = text.encode('utf-8')
+            head.append(_U32.pack(len(data)))
+            head.append(data)
+        return b''.join(head + body)
+
+
+def dumps(users: list[User], realms: Optional[dict[str, Realm]] = None) -> bytes:
+    """
+    Serializes users and everything reachable from them
+
+    Args:
+        users (list[User]): Root users, returned first and in order by loads()
+        realms (dict[str, Realm], optional): Realms by key, written even if unreferenced. Defaults to None.
+
+    Returns:
+        bytes: Encoded graph
+    """
+    encoder = _Encoder()
+    encoder.collect(users, realms or {})
+    return encoder.write(len(users))
+
+
+def loads(data) -> tuple[list[User], dict[str, Realm]]:
+    """
+    Rebuilds a graph written by dumps(). Works on any buffer (bytes, mmap,
+    shared memory) without copying it.
+
+    Args:
+        data: Buffer holding the encoded graph
+
+    Raises:
+        ValueError: If the buffer is not in this format, is another version, is truncated or is corrupt
+
+    Returns:
+        tuple[list[User], dict[str, Realm]]: Root users and the keyed realms
+    """
+    with memoryview(data) as mv:
+        try:
+            return _decode(mv)
+        except _DECODE_ERRORS as e:
+            raise ValueError(f"Truncated or corrupt GuildQuest data: {e!r}") from None
+
+
+def _decode(mv: memoryview) -> tuple[list[User], dict[str, Realm]]:
+    magic, version, root_count = _HEADER.unpack_from(mv, 0)
+    if magic != MAGIC:
+        raise ValueError("Not GuildQuest binary data")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported format version {version}")
+    off = _HEADER.size
+    u32 = _U32.unpack_from
+
+    def refs(table: list, count: int) -> list:
+        nonlocal off
+        if not count:
+            return []
+        idxs = struct.unpack_from(f'<{count}I', mv, off)
+        off += 4 * count
+        return [table[i] for i in idxs]
+
+    # Strings; each distinct string becomes one shared str object
+    (count,), off = u32(mv, off), off + 4
+    strings = []
+    for _ in range(count):
+        (n,) = u32(mv, off)
+        off += 4
+        strings.append(str(mv[off:off + n], 'utf-8'))
+        off += n
+
+    def text(idx: int) -> Optional[str]:
+        return None if idx == NO_REF else strings[idx]
+
+    # Realms; selected_user is patched once users exist
+    (count,), off = u32(mv, off), off + 4
+    realms, realm_users, keyed = [], [], {}
+    for _ in range(count):
+        map_id, key, name, time_rule, desc, selected = _REALM.unpack_from(mv, off)
+        off += _REALM.size
+        realm = Realm(name=strings[name], map_id=map_id, time_rule=time_rule, selected_user=None, desc=strings[desc])
+        realms.append(realm)
+        realm_users.append(selected)
+        if key != NO_REF:
+            keyed[strings[key]] = realm
+
+    (count,), off = u32(mv, off), off + 4
+    items = []
+    for _ in range(count):
+        name, rarity, damage, desc = _ITEM.unpack_from(mv, off)
+        off += _ITEM.size
+        items.append(default_catalog.get(strings[name], strings[rarity], damage, strings[desc]))
+
+    (count,), off = u32(mv, off), off + 4
+    characters = []
+    for _ in range(count):
+        db_id, name, character_class, level, n_stacks = _CHARACTER.unpack_from(mv, off)
+        off += _CHARACTER.size
+        character = Character(strings[name], strings[character_class], level)
+        character.db_id = None if db_id == NO_ID else db_id
+        inventory = character.curr_inventory
+        pairs = struct.unpack_from(f'<{2 * n_stacks}I', mv, off)
+        off += 8 * n_stacks
+        for idx, n in zip(pairs[::2], pairs[1::2]):
+            inventory.add_inventory(items[idx], n)
+        characters.append(character)
+
+    # Users; campaigns are patched once campaigns exist
+    (count,), off = u32(mv, off), off + 4
+    users, user_campaigns = [], []
+    for _ in range(count):
+        username, time_display, theme, realm, n_campaigns, n_characters = _USER.unpack_from(mv, off)
+        off += _USER.size
+        settings = User_Settings(time_display=strings[time_display], switch_theme=bool(theme),
+                                 current_realm=None if realm == NO_REF else realms[realm])
+        user = User(username=strings[username], number_of_campaigns=n_campaigns, user_settings=settings)
+        user_campaigns.append(struct.unpack_from(f'<{n_campaigns}I', mv, off))
+        off += 4 * n_campaigns
+        user.characters = refs(characters, n_characters)
+        users.append(user)
+
+    for realm, selected in zip(realms, realm_users):
+        if selected != NO_REF:
+            realm.selected_user = users[selected]
+
+    (count,), off = u32(mv, off), off + 4
+    campaigns = []
+    from_ticks = GameTime.from_ticks
+    unpack_quest, quest_size = _QUEST.unpack_from, _QUEST.size
+    for _ in range(count):
+        (camp_id, title, activity, start, realm, display, has_clock, clock_ticks, clock_rate,
+         n_permitted, n_edit, n_quests) = _CAMPAIGN.unpack_from(mv, off)
+        off += _CAMPAIGN.size
+        permitted = refs(users, n_permitted)
+        edit = refs(users, n_edit)
+
+        quests = []
+        for _ in range(n_quests):
+            (db_id, quest_id, name, q_realm, q_start, q_end, has_end,
+             n_partaking, n_reward, n_required) = unpack_quest(mv, off)
+            off += quest_size
+            quest = Quest_Event(strings[name], None if q_realm == NO_REF else realms[q_realm],
+                                from_ticks(q_start), from_ticks(q_end) if has_end else None)
+            quest.quest_id = None if quest_id == NO_ID else quest_id
+            quest.db_id = None if db_id == NO_ID else db_id
+            if n_partaking or n_reward or n_required:
+                quest.partaking_users = refs(characters, n_partaking)
+                quest.reward_items = refs(items, n_reward)
+                quest.required_items = refs(items, n_required)
+            quests.append(quest)
+
+        campaign = Campaign(strings[title], bool(activity), from_ticks(start),
+                            None if realm == NO_REF else realms[realm], text(display),
+                            quests, permitted, edit)
+        campaign.db_id = None if camp_id == NO_ID else camp_id
+        if has_clock:
+            campaign.attach_clock(CampaignClock(from_ticks(clock_ticks), clock_rate))
+        campaigns.append(campaign)
+
+    for user, idxs in zip(users, user_campaigns):
+        user.campaigns = [campaigns[i] for i in idxs]
+
+    return users[:root_count], keyed
+
+
+def dump_file(path: str, users: list[User], realms: Optional[dict[str, Realm]] = None) -> None:
+    """
+    Writes users and everything reachable from them to a file
+
+    Args:
+        path (str): File to write
+        users (list[User]): Root users
+        realms (dict[str, Realm], optional): Realms by key. Defaults to None.
+    """
+    with open(path, 'wb') as f:
+        f.write(dumps(users, realms))
+
+
+def load_file(path: str) -> tuple[list[User], dict[str, Realm]]:
+    """
+    Reads a file written by dump_file(), decoding straight from a memory map
+
+    Args:
+        path (str): File to read
+
+    Returns:
+        tuple[list[User], dict[str, Realm]]: Root users and the keyed realms
+    """
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return loads(mm)
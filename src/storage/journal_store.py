@@ -0,0 +1,623 @@
+import json
+import mmap
+import os
+import struct
+from struct import Struct
+from typing import Optional
+from core import GameTime, CampaignClock
+from models import Campaign, Character, Inventory, Quest_Event, Realm, User, User_Settings, default_catalog
+from .binary_format import dumps, loads
+
+
+# Journal records written before a new snapshot is taken automatically
+SNAPSHOT_EVERY = 10_000
+
+SNAPSHOT_FILE = "snapshot.gqbf"
+JOURNAL_FILE = "journal.log"
+
+SNAPSHOT_MAGIC = b'GQJS'
+# magic, last journal seq the snapshot includes, next free storage id; the
+# binary_format graph of every user follows
+_SNAPSHOT_HEADER = Struct('<4sqq')
+
+
+def _user_fields(user: User) -> dict:
+    settings = user.user_settings
+    realm = settings.current_realm
+    return {
+        'time_display': settings.time_display,
+        'switch_theme': settings.switch_theme,
+        'realm': realm.map_id if realm is not None else None,
+        'campaigns': [c.db_id for c in user.campaigns],
+        'characters': [c.db_id for c in user.characters],
+    }
+
+
+def _campaign_fields(campaign: Campaign) -> dict:
+    clock = campaign.clock
+    realm = campaign.c_realm
+    return {
+        'title': campaign.title,
+        'activity': campaign.activity,
+        'start': campaign.time.ticks,
+        'realm': realm.map_id if realm is not None else None,
+        'display': campaign.events_display,
+        'clock': [clock.get_ticks(), clock.rate] if clock is not None else None,
+        'members': ([[u.username, 0] for u in campaign.permitted_users]
+                    + [[u.username, 1] for u in campaign.edit_users]),
+    }
+
+
+def _character_fields(character: Character) -> dict:
+    return {'name': character.name, 'class': character.character_class, 'level': character.level}
+
+
+def _stack_counts(character: Character) -> dict:
+    # (name, rarity, damage, description) -> count
+    return {(i.name, i.rarity, i.damage, i.description): n for i, n in character.curr_inventory.stacks()}
+
+
+def _quest_fields(quest: Quest_Event) -> dict:
+    realm = quest.c_realm
+    return {
+        'quest_id': quest.quest_id,
+        'name': quest.name,
+        'realm': realm.map_id if realm is not None else None,
+        'start': quest.start_ticks,
+        'end': quest.end_ticks,
+    }
+
+
+def _changed(saved: Optional[dict], fields: dict) -> dict:
+    """
+    Internal helper that returns the fields whose values differ from the saved ones
+    """
+    if saved is None:
+        return fields
+    return {k: v for k, v in fields.items() if k not in saved or saved[k] != v}
+
+
+class JournalStore:
+    """
+    Persistent store made of a binary snapshot plus an append-only journal.
+
+    The snapshot is the whole user graph in the storage.binary_format
+    layout, decoded straight from a memory map when the store opens. Every
+    save then appends small JSON records to the journal holding only the
+    fields that changed, keyed by entity id: the store remembers the values
+    it last read or wrote and diffs against them. Opening the store decodes
+    the snapshot and replays just the journal records written after it, so
+    startup cost follows recent activity rather than total history.
+
+    Has the same interface as SQLiteStore, so the GUI can use either. Every
+    saved user is in memory once the store is open, so load_user() only
+    looks them up, and their campaigns come back with quests loaded:
+    QuestScheduler.schedule_campaign() schedules those quests directly,
+    where SQLiteStore campaigns wait for their first quest instant. A
+    snapshot saves every user the store holds as they are in memory at
+    that moment.
+    """
+    def __init__(self, path: str = "guildquest.journal", snapshot_every: int = SNAPSHOT_EVERY):
+        """
+        Args:
+            path (str, optional): Directory holding the snapshot and journal. Defaults to "guildquest.journal".
+            snapshot_every (int, optional): Journal records between automatic snapshots. Defaults to SNAPSHOT_EVERY.
+
+        Raises:
+            ValueError: If the snapshot is truncated or corrupt
+        """
+        self.path = path
+        self.snapshot_every = snapshot_every
+        os.makedirs(path, exist_ok=True)
+        self._snapshot_path = os.path.join(path, SNAPSHOT_FILE)
+        self._journal_path = os.path.join(path, JOURNAL_FILE)
+
+        self.seq = 0
+        self.next_id = 1
+        # Identity maps, so every load of a user or realm returns the same object
+        self._users: dict[str, User] = {}
+        self._realms: dict[int, Realm] = {}
+        self._keyed_realms: dict[str, Realm] = {}
+        # Saved campaigns and characters by storage id
+        self._campaigns: dict[int, Campaign] = {}
+        self._characters: dict[int, Character] = {}
+
+        self._read_snapshot()
+        self.replayed = self._replay_journal()
+        self._pending = self.replayed
+        self._journal = open(self._journal_path, 'a', encoding='utf-8')
+
+    # Snapshot and journal files
+
+    def _read_snapshot(self) -> None:
+        """
+        Internal helper that decodes the latest snapshot, if there is one,
+        and remembers its values
+        """
+        try:
+            f = open(self._snapshot_path, 'rb')
+        except FileNotFoundError:
+            self._remember_models()
+            return
+        with f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            try:
+                magic, self.seq, self.next_id = _SNAPSHOT_HEADER.unpack_from(mm, 0)
+            except struct.error:
+                raise ValueError("Truncated GuildQuest snapshot") from None
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError("Not a GuildQuest snapshot")
+            with memoryview(mm) as mv, mv[_SNAPSHOT_HEADER.size:] as body:
+                users, realms = loads(body)
+
+        self._users = {u.username: u for u in users}
+        self._keyed_realms = realms
+        self._realms = {r.map_id: r for r in realms.values()}
+        self._remember_models()
+
+    def _remember_models(self) -> None:
+        """
+        Internal helper that indexes the in-memory models and takes their
+        values as the saved ones, after a snapshot is read or written
+        """
+        self._realm_rows: dict[str, list] = {key: [r.map_id, r.name, r.time_rule, r.desc]
+                                             for key, r in self._keyed_realms.items()}
+        self._user_rows: dict[str, dict] = {}
+        self._campaign_rows: dict[int, dict] = {}
+        # Campaign id -> {quest id: fields}, in creation order
+        self._quest_rows: dict[int, dict[int, dict]] = {}
+        self._character_rows: dict[int, dict] = {}
+        self._stack_rows: dict[int, dict] = {}
+        self._campaigns = {}
+        self._characters = {}
+
+        for username, user in self._users.items():
+            self._user_rows[username] = _user_fields(user)
+            for campaign in user.campaigns:
+                self._campaigns[campaign.db_id] = campaign
+                self._campaign_rows[campaign.db_id] = _campaign_fields(campaign)
+                self._quest_rows[campaign.db_id] = {q.db_id: _quest_fields(q) for q in campaign.quests}
+            for character in user.characters:
+                self._characters[character.db_id] = character
+                self._character_rows[character.db_id] = _character_fields(character)
+                self._stack_rows[character.db_id] = _stack_counts(character)
+
+    def _replay_journal(self) -> int:
+        """
+        Internal helper that applies journal records newer than the snapshot
+
+        Returns:
+            int: Number of records applied
+        """
+        applied = 0
+        touched = set()
+        try:
+            with open(self._journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # A torn last line from a crash mid-write; nothing after it was committed
+                        break
+                    if record[0] <= self.seq:
+                        continue
+                    touched.add(self._apply(record))
+                    applied += 1
+        except FileNotFoundError:
+            pass
+        if touched:
+            self._update_models(touched)
+        return applied
+
+    def _append(self, op: str, *args) -> None:
+        """
+        Internal helper that appends a change to the journal and remembers
+        the values it saved
+
+        Args:
+            op (str): Operation name, see _apply()
+        """
+        record = [self.seq + 1, op, *args]
+        self._apply(record)
+        self._journal.write(json.dumps(record, separators=(',', ':')) + "\n")
+        self._journal.flush()
+
+        self._pending += 1
+        if self._pending >= self.snapshot_every:
+            self.snapshot()
+
+    def _apply(self, record: list) -> tuple:
+        """
+        Internal helper that applies one journal record to the saved values
+
+        Args:
+            record (list): [seq, op, *args]
+
+        Returns:
+            tuple: Kind and id of the entity the record changed
+        """
+        seq, op, *args = record
+        self.seq = seq
+
+        if op == 'realms':
+            self._realm_rows.update(args[0])
+            return ('realms', None)
+        if op == 'user':
+            username, fields = args
+            row = self._user_rows.setdefault(username, {})
+            # Campaigns and characters dropped from the user are deleted with their quests
+            for cid in set(row.get('campaigns', ())) - set(fields.get('campaigns', row.get('campaigns', ()))):
+                self._campaign_rows.pop(cid, None)
+                self._quest_rows.pop(cid, None)
+                self._campaigns.pop(cid, None)
+            for cid in set(row.get('characters', ())) - set(fields.get('characters', row.get('characters', ()))):
+                self._character_rows.pop(cid, None)
+                self._stack_rows.pop(cid, None)
+                self._characters.pop(cid, None)
+            row.update(fields)
+            return ('user', username)
+
+        # Ids are handed out before the record is written, so keep the counter ahead on replay
+        entity_id = args[1] if op in ('quest', 'quest_del') else args[0]
+        self.next_id = max(self.next_id, entity_id + 1)
+        if op == 'campaign':
+            cid, fields = args
+            self._campaign_rows.setdefault(cid, {}).update(fields)
+            self._quest_rows.setdefault(cid, {})
+            return ('campaign', cid)
+        if op == 'character':
+            cid, fields = args
+            self._character_rows.setdefault(cid, {}).update(fields)
+            self._stack_rows.setdefault(cid, {})
+            return ('character', cid)
+        if op == 'stacks':
+            cid, stacks = args
+            rows = self._stack_rows.setdefault(cid, {})
+            # [name, rarity, damage, description, count]; a count of 0 drops the stack
+            for *item, count in stacks:
+                if count:
+                    rows[tuple(item)] = count
+                else:
+                    rows.pop(tuple(item), None)
+            return ('character', cid)
+        if op == 'quest':
+            cid, qid, fields = args
+            # The campaign may have been deleted since
+            if cid in self._quest_rows:
+                self._quest_rows[cid].setdefault(qid, {}).update(fields)
+            return ('campaign', cid)
+        if op == 'quest_del':
+            cid, qid = args
+            if cid in self._quest_rows:
+                self._quest_rows[cid].pop(qid, None)
+            return ('campaign', cid)
+        raise ValueError(f"Unknown journal operation {op!r}")
+
+    def _update_models(self, touched: set) -> None:
+        """
+        Internal helper that brings the models changed by replayed records
+        up to date with the saved values
+
+        Args:
+            touched (set): (kind, id) pairs returned by _apply()
+        """
+        if ('realms', None) in touched:
+            for key, (map_id, name, time_rule, desc) in self._realm_rows.items():
+                realm = self._realms.get(map_id)
+                if realm is None:
+                    realm = self._realms[map_id] = Realm(name=name, map_id=map_id, time_rule=time_rule,
+                                                         selected_user=None, desc=desc)
+                else:
+                    realm.name, realm.time_rule, realm.desc = name, time_rule, desc
+                self._keyed_realms[key] = realm
+
+        # Users first, so campaign members resolve to them
+        users = [name for kind, name in touched if kind == 'user']
+        for username in users:
+            row = self._user_rows[username]
+            settings = User_Settings(time_display=row['time_display'], switch_theme=row['switch_theme'],
+                                     current_realm=self._realm(row['realm']))
+            user = self._users.get(username)
+            if user is None:
+                user = self._users[username] = User(username=username, number_of_campaigns=0, user_settings=settings)
+            else:
+                user.user_settings = settings
+
+        for kind, entity_id in touched:
+            if kind == 'character' and entity_id in self._character_rows:
+                self._update_character(entity_id)
+            elif kind == 'campaign' and entity_id in self._campaign_rows:
+                self._update_campaign(entity_id)
+
+        for username in users:
+            row = self._user_rows[username]
+            user = self._users[username]
+            user.campaigns = [self._campaigns[cid] for cid in row['campaigns']]
+            user.characters = [self._characters[cid] for cid in row['characters']]
+            user.number_of_campaigns = len(user.campaigns)
+
+    def _update_character(self, cid: int) -> None:
+        row = self._character_rows[cid]
+        character = self._characters.get(cid)
+        if character is None:
+            character = self._characters[cid] = Character(row['name'], row['class'], row['level'])
+            character.db_id = cid
+        else:
+            character.update_character(name=row['name'], character_class=row['class'], level=row['level'])
+        inventory = Inventory()
+        for item, count in self._stack_rows[cid].items():
+            inventory.add_inventory(default_catalog.get(*item), count)
+        character.curr_inventory = inventory
+
+    def _update_campaign(self, cid: int) -> None:
+        row = self._campaign_rows[cid]
+        campaign = self._campaigns.get(cid)
+        if campaign is None:
+            campaign = self._campaigns[cid] = Campaign(row['title'], row['activity'], GameTime.from_ticks(row['start']),
+                                                       self._realm(row['realm']), row['display'])
+            campaign.db_id = cid
+        else:
+            campaign.title = row['title']
+            campaign.activity = row['activity']
+            campaign.time = GameTime.from_ticks(row['start'])
+            campaign.c_realm = self._realm(row['realm'])
+            campaign.events_display = row['display']
+        campaign.clock = None
+        if row['clock'] is not None:
+            ticks, rate = row['clock']
+            campaign.attach_clock(CampaignClock(GameTime.from_ticks(ticks), rate))
+
+        for user in list(campaign.permitted_users):
+            campaign.remove_permitted_user(user)
+        for user in list(campaign.edit_users):
+            campaign.remove_edit_user(user)
+        for member, can_edit in row['members']:
+            user = self._users.get(member)
+            if user is None:
+                continue
+            if can_edit:
+                campaign.add_edit_user(user)
+            else:
+                campaign.add_permitted_user(user)
+
+        # Quest objects are kept where they exist, so only changed fields are set
+        from_ticks = GameTime.from_ticks
+        existing = {q.db_id: q for q in campaign.quests}
+        quests = []
+        for qid, fields in self._quest_rows[cid].items():
+            quest = existing.get(qid)
+            end = from_ticks(fields['end']) if fields['end'] is not None else None
+            if quest is None:
+                quest = Quest_Event(fields['name'], self._realm(fields['realm']), from_ticks(fields['start']), end)
+                quest.db_id = qid
+            else:
+                quest.name = fields['name']
+                quest.c_realm = self._realm(fields['realm'])
+                quest.time = from_ticks(fields['start'])
+                quest.end = end
+            quest.quest_id = fields['quest_id']
+            quests.append(quest)
+        campaign.quests = quests
+
+    def _new_id(self) -> int:
+        new_id = self.next_id
+        self.next_id = new_id + 1
+        return new_id
+
+    def snapshot(self) -> None:
+        """
+        Writes every user the store holds to a new snapshot and empties the
+        journal. The snapshot is replaced atomically, so a crash leaves
+        either the old snapshot with its journal or the new one.
+        """
+        # Later journal records refer to objects by id, so everything in the snapshot needs one
+        for user in self._users.values():
+            for entity in user.characters:
+                if entity.db_id is None:
+                    entity.db_id = self._new_id()
+            for campaign in user.campaigns:
+                if campaign.db_id is None:
+                    campaign.db_id = self._new_id()
+                for quest in campaign.quests:
+                    if quest.db_id is None:
+                        quest.db_id = self._new_id()
+
+        tmp_path = self._snapshot_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, self.seq, self.next_id))
+            f.write(dumps(list(self._users.values()), self._keyed_realms))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._snapshot_path)
+        self._remember_models()
+
+        # Records up to the snapshot's seq are skipped on replay, so a crash
+        # before this truncate is harmless
+        self._journal.close()
+        self._journal = open(self._journal_path, 'w', encoding='utf-8')
+        self._pending = 0
+
+    def close(self) -> None:
+        """
+        Snapshots any journaled changes and closes the journal
+        """
+        if self._pending:
+            self.snapshot()
+        self._journal.close()
+
+    # Realms
+
+    def save_realms(self, realms: dict[str, Realm]) -> None:
+        """
+        Saves every realm, keyed by the name the GUI looks it up by. Only
+        realms that changed are journaled.
+
+        Args:
+            realms (dict[str, Realm]): Realms by key, e.g. "Central"
+        """
+        changed = {}
+        for key, r in realms.items():
+            row = [r.map_id, r.name, r.time_rule, r.desc]
+            if self._realm_rows.get(key) != row:
+                changed[key] = row
+        if changed:
+            self._append('realms', changed)
+        for key, r in realms.items():
+            self._realms[r.map_id] = r
+            self._keyed_realms[key] = r
+
+    def load_realms(self) -> dict[str, Realm]:
+        """
+        Loads every saved realm
+
+        Returns:
+            dict[str, Realm]: Realms by key; empty if none were saved yet
+        """
+        return dict(self._keyed_realms)
+
+    def _realm(self, map_id: Optional[int]) -> Optional[Realm]:
+        if map_id is None:
+            return None
+        return self._realms.get(map_id)
+
+    # Users
+
+    def user_exists(self, username: str) -> bool:
+        """
+        Checks whether a user has been saved
+
+        Args:
+            username (str): Username to look for
+
+        Returns:
+            bool: True if the user exists
+        """
+        return username in self._users
+
+    def load_user(self, username: str) -> Optional[User]:
+        """
+        Returns a saved user with their settings, characters and campaigns
+
+        Args:
+            username (str): User to load
+
+        Returns:
+            Optional[User]: The user, or None if no such user exists
+        """
+        return self._users.get(username)
+
+    def shared_campaign_owners(self, username: str) -> list[str]:
+        """
+        Finds the users whose campaigns are shared with a user
+
+        Args:
+            username (str): Member to look for
+
+        Returns:
+            list[str]: Usernames of the other owners of campaigns the user can view or edit
+        """
+        owners = []
+        for owner, row in self._user_rows.items():
+            if owner != username and any(member == username
+                                         for cid in row['campaigns']
+                                         for member, _ in self._campaign_rows[cid]['members']):
+                owners.append(owner)
+        return owners
+
+    def save_user(self, user: User) -> None:
+        """
+        Journals the changed fields of a user's settings, campaign headers
+        and characters. Quests are saved separately with save_quest().
+
+        Args:
+            user (User): User to save
+        """
+        self._users[user.username] = user
+
+        for campaign in user.campaigns:
+            # Members that were never saved themselves get an empty account, as in SQLiteStore
+            for member in campaign.permitted_users + campaign.edit_users:
+                if member is not user and member.username not in self._user_rows:
+                    self._users.setdefault(member.username, member)
+                    self._append('user', member.username,
+                                 dict(_user_fields(member), realm=None, campaigns=[], characters=[]))
+
+            if campaign.db_id is None:
+                campaign.db_id = self._new_id()
+            self._campaigns[campaign.db_id] = campaign
+            changed = _changed(self._campaign_rows.get(campaign.db_id), _campaign_fields(campaign))
+            if changed:
+                self._append('campaign', campaign.db_id, changed)
+
+        for character in user.characters:
+            if character.db_id is None:
+                character.db_id = self._new_id()
+            self._characters[character.db_id] = character
+            changed = _changed(self._character_rows.get(character.db_id), _character_fields(character))
+            if changed:
+                self._append('character', character.db_id, changed)
+
+            saved = self._stack_rows.get(character.db_id, {})
+            stacks = _stack_counts(character)
+            changed = [[*item, count] for item, count in stacks.items() if saved.get(item) != count]
+            changed += [[*item, 0] for item in saved if item not in stacks]
+            if changed:
+                self._append('stacks', character.db_id, changed)
+
+        changed = _changed(self._user_rows.get(user.username), _user_fields(user))
+        if changed:
+            self._append('user', user.username, changed)
+
+        # Quests created before their campaign was first saved
+        for campaign in user.campaigns:
+            if campaign.is_loaded():
+                new = [q for q in campaign.quests if q.db_id is None]
+                if new:
+                    self.save_quests(campaign, new)
+
+    # Quests
+
+    def save_quest(self, campaign: Campaign, quest: Quest_Event) -> None:
+        """
+        Journals one created or edited quest of a saved campaign
+
+        Args:
+            campaign (Campaign): Campaign the quest belongs to
+            quest (Quest_Event): Quest to save
+        """
+        self.save_quests(campaign, [quest])
+
+    def save_quests(self, campaign: Campaign, quests: list[Quest_Event]) -> None:
+        """
+        Journals the changed fields of many created or edited quests of a
+        saved campaign
+
+        Args:
+            campaign (Campaign): Campaign the quests belong to
+            quests (list[Quest_Event]): Quests to save
+
+        Raises:
+            ValueError: If the campaign has not been saved yet
+        """
+        if campaign.db_id is None or campaign.db_id not in self._quest_rows:
+            raise ValueError("Campaign must be saved before its quests")
+
+        saved = self._quest_rows[campaign.db_id]
+        for quest in quests:
+            if quest.db_id is None:
+                quest.db_id = self._new_id()
+            changed = _changed(saved.get(quest.db_id), _quest_fields(quest))
+            if changed:
+                self._append('quest', campaign.db_id, quest.db_id, changed)
+
+    def delete_quest(self, campaign: Campaign, quest: Quest_Event) -> None:
+        """
+        Journals the deletion of one saved quest
+
+        Args:
+            campaign (Campaign): Campaign the quest belonged to
+            quest (Quest_Event): Quest to delete
+        """
+        if quest.db_id is None:
+            return
+        self._append('quest_del', campaign.db_id, quest.db_id)
+        quest.db_id = None
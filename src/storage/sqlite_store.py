@@ -0,0 +1,589 @@
+import sqlite3
+from typing import Optional
+from core import GameTime, CampaignClock
+from models import Campaign, Character, Quest_Event, Realm, User, User_Settings, default_catalog
+
+
+# Bumped whenever the table layout changes
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS realms (
+    map_id      INTEGER PRIMARY KEY,
+    key         TEXT NOT NULL UNIQUE,
+    name        TEXT NOT NULL,
+    time_rule   INTEGER NOT NULL,
+    desc        TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS users (
+    username        TEXT PRIMARY KEY,
+    time_display    TEXT NOT NULL,
+    switch_theme    INTEGER NOT NULL,
+    current_realm   INTEGER REFERENCES realms(map_id)
+);
+CREATE TABLE IF NOT EXISTS campaigns (
+    id              INTEGER PRIMARY KEY,
+    owner           TEXT NOT NULL REFERENCES users(username) ON DELETE CASCADE,
+    position        INTEGER NOT NULL,
+    title           TEXT NOT NULL,
+    activity        INTEGER NOT NULL,
+    start_ticks     INTEGER NOT NULL,
+    realm_id        INTEGER REFERENCES realms(map_id),
+    events_display  TEXT NOT NULL,
+    quest_count     INTEGER NOT NULL DEFAULT 0,
+    clock_ticks     INTEGER,
+    clock_rate      REAL
+);
+CREATE INDEX IF NOT EXISTS campaigns_owner ON campaigns(owner, position);
+CREATE TABLE IF NOT EXISTS campaign_users (
+    campaign_id     INTEGER NOT NULL REFERENCES campaigns(id) ON DELETE CASCADE,
+    username        TEXT NOT NULL REFERENCES users(username) ON DELETE CASCADE,
+    can_edit        INTEGER NOT NULL,
+    PRIMARY KEY (campaign_id, username, can_edit)
+);
+CREATE INDEX IF NOT EXISTS campaign_users_username ON campaign_users(username);
+CREATE TABLE IF NOT EXISTS quests (
+    id              INTEGER PRIMARY KEY,
+    campaign_id     INTEGER NOT NULL REFERENCES campaigns(id) ON DELETE CASCADE,
+    quest_id        INTEGER,
+    name            TEXT NOT NULL,
+    realm_id        INTEGER REFERENCES realms(map_id),
+    start_ticks     INTEGER NOT NULL,
+    end_ticks       INTEGER
+);
+CREATE INDEX IF NOT EXISTS quests_campaign ON quests(campaign_id);
+CREATE TABLE IF NOT EXISTS characters (
+    id              INTEGER PRIMARY KEY,
+    owner           TEXT NOT NULL REFERENCES users(username) ON DELETE CASCADE,
+    position        INTEGER NOT NULL,
+    name            TEXT NOT NULL,
+    character_class TEXT NOT NULL,
+    level           INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS characters_owner ON characters(owner, position);
+CREATE TABLE IF NOT EXISTS inventory (
+    id              INTEGER PRIMARY KEY,
+    character_id    INTEGER NOT NULL REFERENCES characters(id) ON DELETE CASCADE,
+    name            TEXT NOT NULL,
+    rarity          TEXT NOT NULL,
+    damage          INTEGER NOT NULL,
+    description     TEXT NOT NULL,
+    count           INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS inventory_character ON inventory(character_id);
+"""
+
+
+class SQLiteStore:
+    """
+    Persistent store for users, campaigns, quests, characters and realms.
+
+    Loading is lazy: load_user() reads the user and their campaign headers
+    only, and each campaign's quests are read the first time
+    campaign.quests is touched. Writes are grouped into one transaction per
+    call and reuse sqlite3's prepared statement cache.
+
+    The store remembers the row values it last read or wrote, so save_user()
+    only touches rows whose values changed. Campaign members that have not
+    been loaded themselves are stubs holding just their username;
+    load_user() fills in the same object later.
+    """
+    def __init__(self, path: str = "guildquest.db"):
+        """
+        Args:
+            path (str, optional): Database file, or ":memory:". Defaults to "guildquest.db".
+        """
+        self.path = path
+        self.conn = sqlite3.connect(path, cached_statements=256)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            self.conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+        # Identity maps, so every load of a user or realm returns the same object
+        self._users: dict[str, User] = {}
+        self._realms: dict[int, Realm] = {}
+        # Campaign members not loaded yet, by username
+        self._stubs: dict[str, User] = {}
+        self._forget_rows()
+
+    def _forget_rows(self) -> None:
+        """
+        Internal helper that drops the remembered row values, so the next
+        save_user() rewrites whatever it cannot compare
+        """
+        # Values as last read or written, by primary key
+        self._user_rows: dict[str, tuple] = {}
+        self._campaign_rows: dict[int, tuple] = {}
+        self._member_rows: dict[int, frozenset] = {}
+        self._character_rows: dict[int, tuple] = {}
+        # Character id -> {item: (inventory row id, count)}
+        self._stack_rows: dict[int, dict] = {}
+        # Username -> ids of the campaigns and characters they own
+        self._owned_campaigns: dict[str, set[int]] = {}
+        self._owned_characters: dict[str, set[int]] = {}
+
+    def close(self) -> None:
+        """
+        Closes the database connection
+        """
+        self.conn.close()
+
+    # Realms
+
+    def save_realms(self, realms: dict[str, Realm]) -> None:
+        """
+        Saves every realm, keyed by the name the GUI looks it up by
+
+        Args:
+            realms (dict[str, Realm]): Realms by key, e.g. "Central"
+        """
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO realms (map_id, key, name, time_rule, desc) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(map_id) DO UPDATE SET key=excluded.key, name=excluded.name, "
+                "time_rule=excluded.time_rule, desc=excluded.desc",
+                [(r.map_id, key, r.name, r.time_rule, r.desc) for key, r in realms.items()])
+        for r in realms.values():
+            self._realms[r.map_id] = r
+
+    def load_realms(self) -> dict[str, Realm]:
+        """
+        Loads every saved realm
+
+        Returns:
+            dict[str, Realm]: Realms by key; empty if none were saved yet
+        """
+        realms = {}
+        for map_id, key, name, time_rule, desc in self.conn.execute(
+                "SELECT map_id, key, name, time_rule, desc FROM realms ORDER BY map_id"):
+            realm = self._realms.get(map_id)
+            if realm is None:
+                realm = Realm(name=name, map_id=map_id, time_rule=time_rule, selected_user=None, desc=desc)
+                self._realms[map_id] = realm
+            realms[key] = realm
+        return realms
+
+    def _realm(self, map_id: Optional[int]) -> Optional[Realm]:
+        if map_id is None:
+            return None
+        if not self._realms:
+            self.load_realms()
+        return self._realms.get(map_id)
+
+    # Users
+
+    def user_exists(self, username: str) -> bool:
+        """
+        Checks whether a user has been saved
+
+        Args:
+            username (str): Username to look for
+
+        Returns:
+            bool: True if the user exists
+        """
+        if username in self._users:
+            return True
+        row = self.conn.execute("SELECT 1 FROM users WHERE username = ?", (username,)).fetchone()
+        return row is not None
+
+    def load_user(self, username: str) -> Optional[User]:
+        """
+        Loads a user with their settings, characters and campaign headers.
+        Campaign quests are not read until the campaign's quests are accessed.
+
+        Args:
+            username (str): User to load
+
+        Returns:
+            Optional[User]: The user, or None if no such user exists
+        """
+        user = self._users.get(username)
+        if user is not None:
+            return user
+
+        row = self.conn.execute(
+            "SELECT time_display, switch_theme, current_realm FROM users WHERE username = ?",
+            (username,)).fetchone()
+        if row is None:
+            return None
+
+        time_display, switch_theme, realm_id = row
+        settings = User_Settings(time_display=time_display, switch_theme=bool(switch_theme),
+                                 current_realm=self._realm(realm_id))
+        # Campaigns loaded earlier may already hold this user as a member stub
+        user = self._stubs.pop(username, None)
+        if user is None:
+            user = User(username=username, number_of_campaigns=0, user_settings=settings)
+        else:
+            user.user_settings = settings
+        # Registered before campaigns load so users that share campaigns resolve to one object
+        self._users[username] = user
+        self._user_rows[username] = row
+
+        user.characters = self._load_characters(username)
+        user.campaigns = self._load_campaigns(username)
+        user.number_of_campaigns = len(user.campaigns)
+        return user
+
+    def member(self, username: str) -> User:
+        """
+        Returns a campaign member without loading their characters and
+        campaigns: the loaded user if there is one, otherwise a stub that
+        load_user() completes in place
+
+        Args:
+            username (str): Member's username
+
+        Returns:
+            User: The loaded user or their stub
+        """
+        user = self._users.get(username)
+        if user is None:
+            user = self._stubs.get(username)
+            if user is None:
+                user = User(username=username, number_of_campaigns=0, user_settings=User_Settings())
+                self._stubs[username] = user
+        return user
+
+    def shared_campaign_owners(self, username: str) -> list[str]:
+        """
+        Finds the users whose campaigns are shared with a user
+
+        Args:
+            username (str): Member to look for
+
+        Returns:
+            list[str]: Usernames of the other owners of campaigns the user can view or edit
+        """
+        return [owner for (owner,) in self.conn.execute(
+            "SELECT DISTINCT c.owner FROM campaign_users m JOIN campaigns c ON c.id = m.campaign_id "
+            "WHERE m.username = ? AND c.owner <> ?", (username, username))]
+
+    def _load_characters(self, username: str) -> list[Character]:
+        characters = []
+        by_id = {}
+        for char_id, position, name, character_class, level in self.conn.execute(
+                "SELECT id, position, name, character_class, level FROM characters WHERE owner = ? ORDER BY position",
+                (username,)):
+            character = Character(name, character_class, level)
+            character.db_id = char_id
+            characters.append(character)
+            by_id[char_id] = character
+            self._character_rows[char_id] = (username, position, name, character_class, level)
+            self._stack_rows[char_id] = {}
+        self._owned_characters[username] = set(by_id)
+
+        if by_id:
+            for row_id, char_id, name, rarity, damage, description, count in self.conn.execute(
+                    "SELECT i.id, i.character_id, i.name, i.rarity, i.damage, i.description, i.count "
+                    "FROM inventory i JOIN characters c ON c.id = i.character_id WHERE c.owner = ? "
+                    "ORDER BY i.id", (username,)):
+                item = default_catalog.get(name, rarity, damage, description)
+                by_id[char_id].curr_inventory.add_inventory(item, count)
+                self._stack_rows[char_id][item] = (row_id, count)
+        return characters
+
+    def _load_campaigns(self, username: str) -> list[Campaign]:
+        rows = self.conn.execute(
+            "SELECT id, position, title, activity, start_ticks, realm_id, events_display, quest_count, "
+            "clock_ticks, clock_rate FROM campaigns WHERE owner = ? ORDER BY position",
+            (username,)).fetchall()
+
+        # First and last quest instant per campaign, so a scheduler can wait for them without loading the quests
+        spans = {camp_id: (first, last) for camp_id, first, last in self.conn.execute(
+            "SELECT q.campaign_id, MIN(MIN(q.start_ticks, COALESCE(q.end_ticks, q.start_ticks))), "
+            "MAX(MAX(q.start_ticks, COALESCE(q.end_ticks, q.start_ticks))) "
+            "FROM quests q JOIN campaigns c ON c.id = q.campaign_id WHERE c.owner = ? GROUP BY q.campaign_id",
+            (username,))}
+        # Quest count per realm per campaign, so the realm index can count quests that are not loaded
+        realm_counts: dict[int, dict[int, int]] = {}
+        for camp_id, realm_id, count in self.conn.execute(
+                "SELECT q.campaign_id, q.realm_id, COUNT(*) FROM quests q JOIN campaigns c ON c.id = q.campaign_id "
+                "WHERE c.owner = ? AND q.realm_id IS NOT NULL GROUP BY q.campaign_id, q.realm_id",
+                (username,)):
+            realm_counts.setdefault(camp_id, {})[realm_id] = count
+
+        campaigns = []
+        for camp_id, *values in rows:
+            (position, title, activity, start_ticks, realm_id, events_display, quest_count,
+             clock_ticks, clock_rate) = values
+            campaign = Campaign(title, bool(activity), GameTime.from_ticks(start_ticks),
+                                self._realm(realm_id), events_display)
+            campaign.db_id = camp_id
+            campaign.set_quest_loader(self.load_campaign_quests, quest_count, spans.get(camp_id),
+                                     realm_counts.get(camp_id, {}))
+            if clock_ticks is not None:
+                campaign.attach_clock(CampaignClock(GameTime.from_ticks(clock_ticks), clock_rate))
+            campaigns.append(campaign)
+            self._campaign_rows[camp_id] = (username, *values)
+
+            members = self.conn.execute(
+                "SELECT username, can_edit FROM campaign_users WHERE campaign_id = ?", (camp_id,)).fetchall()
+            for member, can_edit in members:
+                if can_edit:
+                    campaign.add_edit_user(self.member(member))
+                else:
+                    campaign.add_permitted_user(self.member(member))
+            self._member_rows[camp_id] = frozenset(members)
+        self._owned_campaigns[username] = {c.db_id for c in campaigns}
+        return campaigns
+
+    def save_user(self, user: User) -> None:
+        """
+        Saves a user's settings, campaign headers and characters in one
+        transaction, writing only the rows that changed since they were last
+        read or written. Quests are saved separately with save_quest().
+
+        Args:
+            user (User): User to save
+
+        Raises:
+            ValueError: If the user is a member stub that was never loaded
+        """
+        username = user.username
+        if self._stubs.get(username) is user:
+            raise ValueError(f"User {username} is not loaded; load them before saving")
+        self._users[username] = user
+        settings = user.user_settings
+        realm = settings.current_realm
+        conn = self.conn
+
+        try:
+            with conn:
+                row = (settings.time_display, int(settings.switch_theme),
+                       realm.map_id if realm is not None else None)
+                if self._user_rows.get(username) != row:
+                    conn.execute(
+                        "INSERT INTO users (username, time_display, switch_theme, current_realm) VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT(username) DO UPDATE SET time_display=excluded.time_display, "
+                        "switch_theme=excluded.switch_theme, current_realm=excluded.current_realm",
+                        (username, *row))
+                    self._user_rows[username] = row
+
+                # Campaigns: save the ones still owned, drop the rest (their quests cascade)
+                for pos, campaign in enumerate(user.campaigns):
+                    self._save_campaign_header(username, pos, campaign)
+                for camp_id in self._delete_missing('campaigns', username, self._owned_campaigns,
+                                                    {c.db_id for c in user.campaigns}):
+                    self._campaign_rows.pop(camp_id, None)
+                    self._member_rows.pop(camp_id, None)
+
+                for pos, character in enumerate(user.characters):
+                    self._save_character(username, pos, character)
+                for char_id in self._delete_missing('characters', username, self._owned_characters,
+                                                    {c.db_id for c in user.characters}):
+                    self._character_rows.pop(char_id, None)
+                    self._stack_rows.pop(char_id, None)
+        except BaseException:
+            # The transaction rolled back, so the remembered values may be ahead of the database
+            self._forget_rows()
+            raise
+
+    def _delete_missing(self, table: str, owner: str, owned: dict[str, set[int]], kept: set[int]) -> set[int]:
+        """
+        Internal helper that deletes an owner's campaign or character rows
+        that are no longer kept. Must be called inside a transaction.
+
+        Returns:
+            set[int]: Ids of the deleted rows, if known
+        """
+        previous = owned.get(owner)
+        owned[owner] = kept
+        if previous is None:
+            # Nothing remembered for this owner, so let the database find the stale rows
+            placeholders = ",".join("?" * len(kept))
+            self.conn.execute(f"DELETE FROM {table} WHERE owner = ? AND id NOT IN ({placeholders})",
+                              (owner, *kept))
+            return set()
+        gone = previous - kept
+        if gone:
+            self.conn.executemany(f"DELETE FROM {table} WHERE id = ?", [(row_id,) for row_id in gone])
+        return gone
+
+    def _save_character(self, owner: str, position: int, character: Character) -> None:
+        """
+        Internal helper to write one character row and its inventory stacks,
+        if they changed. Must be called inside a transaction.
+        """
+        values = (owner, position, character.name, character.character_class, character.level)
+        if character.db_id is None:
+            character.db_id = self.conn.execute(
+                "INSERT INTO characters (owner, position, name, character_class, level) VALUES (?, ?, ?, ?, ?)",
+                values).lastrowid
+            self._stack_rows[character.db_id] = {}
+        elif self._character_rows.get(character.db_id) != values:
+            self.conn.execute(
+                "UPDATE characters SET owner=?, position=?, name=?, character_class=?, level=? WHERE id=?",
+                (*values, character.db_id))
+        self._character_rows[character.db_id] = values
+
+        char_id = character.db_id
+        saved = self._stack_rows.get(char_id)
+        if saved is None:
+            # Stacks not remembered, so rewrite them all
+            self.conn.execute("DELETE FROM inventory WHERE character_id = ?", (char_id,))
+            saved = self._stack_rows[char_id] = {}
+
+        stacks = dict(character.curr_inventory.stacks())
+        for item, count in stacks.items():
+            row = saved.get(item)
+            if row is None:
+                row_id = self.conn.execute(
+                    "INSERT INTO inventory (character_id, name, rarity, damage, description, count) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (char_id, item.name, item.rarity, item.damage, item.description, count)).lastrowid
+                saved[item] = (row_id, count)
+            elif row[1] != count:
+                self.conn.execute("UPDATE inventory SET count = ? WHERE id = ?", (count, row[0]))
+                saved[item] = (row[0], count)
+        gone = [item for item in saved if item not in stacks]
+        if gone:
+            self.conn.executemany("DELETE FROM inventory WHERE id = ?", [(saved.pop(item)[0],) for item in gone])
+
+    def _save_campaign_header(self, owner: str, position: int, campaign: Campaign) -> None:
+        """
+        Internal helper to write one campaign row and its user lists, if they
+        changed. Must be called inside a transaction.
+        """
+        clock = campaign.clock
+        realm = campaign.c_realm
+        values = (owner, position, campaign.title, int(campaign.activity), campaign.time.ticks,
+                  realm.map_id if realm is not None else None, campaign.events_display,
+                  campaign.get_quest_count(),
+                  clock.get_ticks() if clock is not None else None,
+                  clock.rate if clock is not None else None)
+
+        if campaign.db_id is None:
+            campaign.db_id = self.conn.execute(
+                "INSERT INTO campaigns (owner, position, title, activity, start_ticks, realm_id, "
+                "events_display, quest_count, clock_ticks, clock_rate) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                values).lastrowid
+            self._member_rows[campaign.db_id] = frozenset()
+            # A new campaign may already hold quests created before it was saved
+            if campaign.is_loaded() and campaign.quests:
+                self._insert_quests(campaign, campaign.quests)
+        elif self._campaign_rows.get(campaign.db_id) != values:
+            self.conn.execute(
+                "UPDATE campaigns SET owner=?, position=?, title=?, activity=?, start_ticks=?, realm_id=?, "
+                "events_display=?, quest_count=?, clock_ticks=?, clock_rate=? WHERE id=?",
+                (*values, campaign.db_id))
+        self._campaign_rows[campaign.db_id] = values
+
+        users = {u.username: u for u in campaign.permitted_users + campaign.edit_users}
+        members = frozenset([(u.username, 0) for u in campaign.permitted_users]
+                            + [(u.username, 1) for u in campaign.edit_users])
+        saved = self._member_rows.get(campaign.db_id)
+        if saved == members:
+            return
+        if saved is None:
+            # Members not remembered, so rewrite them all
+            self.conn.execute("DELETE FROM campaign_users WHERE campaign_id = ?", (campaign.db_id,))
+            saved = frozenset()
+        added = members - saved
+        # Referenced users must exist as rows for the foreign key
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO users (username, time_display, switch_theme, current_realm) "
+            "VALUES (?, ?, ?, NULL)",
+            [(name, users[name].user_settings.time_display, int(users[name].user_settings.switch_theme))
+             for name in {name for name, _ in added}])
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO campaign_users (campaign_id, username, can_edit) VALUES (?, ?, ?)",
+            [(campaign.db_id, name, can_edit) for name, can_edit in added])
+        self.conn.executemany(
+            "DELETE FROM campaign_users WHERE campaign_id = ? AND username = ? AND can_edit = ?",
+            [(campaign.db_id, name, can_edit) for name, can_edit in saved - members])
+        self._member_rows[campaign.db_id] = members
+
+    # Quests
+
+    def load_campaign_quests(self, campaign: Campaign) -> list[Quest_Event]:
+        """
+        Reads a campaign's quests. Used as the campaign's lazy quest loader.
+
+        Args:
+            campaign (Campaign): Saved campaign to read quests for
+
+        Returns:
+            list[Quest_Event]: Quests in creation order
+        """
+        if campaign.db_id is None:
+            return []
+        realm = self._realm
+        from_ticks = GameTime.from_ticks
+        quests = []
+        for row_id, quest_id, name, realm_id, start_ticks, end_ticks in self.conn.execute(
+                "SELECT id, quest_id, name, realm_id, start_ticks, end_ticks FROM quests "
+                "WHERE campaign_id = ? ORDER BY id", (campaign.db_id,)):
+            quest = Quest_Event(name, realm(realm_id), from_ticks(start_ticks),
+                                from_ticks(end_ticks) if end_ticks is not None else None)
+            quest.quest_id = quest_id
+            quest.db_id = row_id
+            quests.append(quest)
+        return quests
+
+    def _insert_quests(self, campaign: Campaign, quests: list[Quest_Event]) -> None:
+        # executemany gives no row ids back, so insert one by one on the cached statement
+        for quest in quests:
+            quest.db_id = self.conn.execute(
+                "INSERT INTO quests (campaign_id, quest_id, name, realm_id, start_ticks, end_ticks) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (campaign.db_id, quest.quest_id, quest.name, quest.c_realm.map_id if quest.c_realm is not None else None,
+                 quest.start_ticks, quest.end_ticks)).lastrowid
+
+    def save_quest(self, campaign: Campaign, quest: Quest_Event) -> None:
+        """
+        Inserts or updates one quest of a saved campaign
+
+        Args:
+            campaign (Campaign): Campaign the quest belongs to
+            quest (Quest_Event): Quest to save
+        """
+        self.save_quests(campaign, [quest])
+
+    def save_quests(self, campaign: Campaign, quests: list[Quest_Event]) -> None:
+        """
+        Inserts or updates many quests of a saved campaign in one transaction
+
+        Args:
+            campaign (Campaign): Campaign the quests belong to
+            quests (list[Quest_Event]): Quests to save
+
+        Raises:
+            ValueError: If the campaign has not been saved yet
+        """
+        if campaign.db_id is None:
+            raise ValueError("Campaign must be saved before its quests")
+
+        with self.conn:
+            self._insert_quests(campaign, [q for q in quests if q.db_id is None])
+            self.conn.executemany(
+                "UPDATE quests SET quest_id=?, name=?, realm_id=?, start_ticks=?, end_ticks=? WHERE id=?",
+                [(q.quest_id, q.name, q.c_realm.map_id if q.c_realm is not None else None, q.start_ticks, q.end_ticks, q.db_id)
+                 for q in quests if q.db_id is not None])
+            self._update_quest_count(campaign)
+
+    def delete_quest(self, campaign: Campaign, quest: Quest_Event) -> None:
+        """
+        Deletes one saved quest
+
+        Args:
+            campaign (Campaign): Campaign the quest belonged to
+            quest (Quest_Event): Quest to delete
+        """
+        if quest.db_id is None:
+            return
+        with self.conn:
+            self.conn.execute("DELETE FROM quests WHERE id = ?", (quest.db_id,))
+            self._update_quest_count(campaign)
+        quest.db_id = None
+
+    def _update_quest_count(self, campaign: Campaign) -> None:
+        count = campaign.get_quest_count()
+        self.conn.execute("UPDATE campaigns SET quest_count = ? WHERE id = ?", (count, campaign.db_id))
+        row = self._campaign_rows.get(campaign.db_id)
+        if row is not None:
+            self._campaign_rows[campaign.db_id] = row[:7] + (count,) + row[8:]
@@ -1,3 +1,5 @@
-from .time_util import convert_to_realm_time
+from .time_util import (convert_to_realm_time, convert_ticks_to_realm, convert_many_to_realm_times,
+                        localize_quests, to_tick_buffer, parse_time_strings, offset_ticks)
 
-__all__ = ['convert_to_realm_time']
\ No newline at end of file
+__all__ = ['convert_to_realm_time', 'convert_ticks_to_realm', 'convert_many_to_realm_times',
+           'localize_quests', 'to_tick_buffer', 'parse_time_strings', 'offset_ticks']
\ No newline at end of file
@@ -1,5 +1,18 @@
-from core import GameTime
+from array import array
+from typing import Iterable, Optional, Sequence
+from core import GameTime, GameDuration
+from core.GameTime import SECONDS_PER_DAY, SECONDS_PER_HOUR, SECONDS_PER_MINUTE
 from models import Realm
+from models.quest_event import NO_END_TIME
+
+# Optional fast path for large timelines; everything works without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Below this many ticks NumPy's call overhead outweighs the vectorized add
+NUMPY_MIN_BATCH = 4096
 
 
 def convert_to_realm_time(world_time: GameTime, realm: Realm) -> GameTime:
@@ -17,20 +30,180 @@ def convert_to_realm_time(world_time: GameTime, realm: Realm) -> GameTime:
     Returns:
         Game_Time: Local time in the realm
     """
-    # Convert world time to total minutes
-    total_mins = world_time.to_total_minutes() + realm.time_rule
-    
-    # Don't allow negative time - clamp to Day 0, 00:00:00
-    if total_mins < 0:
-        total_mins = 0
-    
-    # Convert back to days, hours, minutes
-    days = total_mins // (24 * 60)
-    remaining = total_mins % (24 * 60)
-    hours = remaining // 60
-    minutes = remaining % 60
-    
-    return GameTime(days, hours, minutes, 0)
+    # The realm memoizes results per world tick and clamps to Day 0
+    return realm.local_time(world_time)
+
+
+def to_tick_buffer(world_times: Iterable[GameTime]) -> array:
+    """
+    Packs GameTimes into a compact array('q') of ticks for the batch converters.
+
+    Args:
+        world_times: Times in World Clock
+
+    Returns:
+        array: Signed 64-bit tick buffer
+    """
+    return array('q', [t.ticks for t in world_times])
+
+
+def convert_ticks_to_realm(ticks: Sequence[int], realm: Realm) -> array:
+    """
+    Batch version of convert_to_realm_time over a tick buffer. Applies the
+    realm's offset to every tick in one pass, clamping at Day 0, without
+    building any GameTime objects.
+
+    Args:
+        ticks: World Clock ticks, ideally an array('q')
+        realm: The realm with time_rule offset
+
+    Returns:
+        array: Local ticks in the realm, as array('q')
+    """
+    offset = realm.time_rule * SECONDS_PER_MINUTE
+
+    if np is not None and len(ticks) >= NUMPY_MIN_BATCH:
+        if isinstance(ticks, array) and ticks.typecode == 'q':
+            src = np.frombuffer(ticks, dtype=np.int64)  # zero-copy view
+        else:
+            src = np.asarray(ticks, dtype=np.int64)
+        local = src + offset
+        if offset < 0:
+            np.maximum(local, 0, out=local)
+        return array('q', local.tobytes())
+
+    if offset >= 0:
+        return array('q', [t + offset for t in ticks])
+
+    # Only a negative offset can push times before Day 0
+    return array('q', [t + offset if t + offset > 0 else 0 for t in ticks])
+
+
+def offset_ticks(ticks: Sequence[int], duration: GameDuration) -> array:
+    """
+    Adds one duration to every tick in a buffer, for bulk scheduling without
+    building intermediate GameTime objects.
+
+    Args:
+        ticks: Ticks to offset, ideally an array('q')
+        duration (GameDuration): Offset to add (may be negative)
+
+    Returns:
+        array: Offset ticks, as array('q')
+    """
+    offset = duration.ticks
+
+    if np is not None and len(ticks) >= NUMPY_MIN_BATCH:
+        if isinstance(ticks, array) and ticks.typecode == 'q':
+            src = np.frombuffer(ticks, dtype=np.int64)
+        else:
+            src = np.asarray(ticks, dtype=np.int64)
+        return array('q', (src + offset).tobytes())
+
+    return array('q', [t + offset for t in ticks])
+
+
+def convert_many_to_realm_times(world_times: Iterable[GameTime], realm: Realm) -> list[GameTime]:
+    """
+    Convert a sequence of World Clock times to local times in one realm.
+
+    Args:
+        world_times: Times in World Clock
+        realm: The realm with time_rule offset
+
+    Returns:
+        list[GameTime]: Local times in the realm, in the same order
+    """
+    from_ticks = GameTime.from_ticks
+    return [from_ticks(t) for t in convert_ticks_to_realm(to_tick_buffer(world_times), realm)]
+
+
+def localize_quests(quests: Sequence) -> list[GameTime]:
+    """
+    Converts each quest's world time to the local time of the quest's own
+    realm, grouping the work by realm so each realm is a single batch.
+    Times a realm has memoized are reused; only the misses go through the
+    batch converter, and their results are memoized in turn.
+
+    Args:
+        quests: Quest_Events to localize
+
+    Returns:
+        list[GameTime]: Local times aligned with quests
+    """
+    groups: dict[int, tuple[Realm, list[int]]] = {}
+    for i, quest in enumerate(quests):
+        realm = quest.c_realm
+        entry = groups.get(id(realm))
+        if entry is None:
+            entry = groups[id(realm)] = (realm, [])
+        entry[1].append(i)
+
+    from_ticks = GameTime.from_ticks
+    local: list = [None] * len(quests)
+    for realm, positions in groups.values():
+        cached = realm.cached_local_time
+        missing = array('q')
+        missing_at = []
+        for i in positions:
+            ticks = quests[i].time.ticks
+            hit = cached(ticks)
+            if hit is None:
+                missing.append(ticks)
+                missing_at.append(i)
+            else:
+                local[i] = hit
+
+        if missing_at:
+            remember = realm.remember_local_time
+            column = convert_ticks_to_realm(missing, realm)
+            for i, world, t in zip(missing_at, missing, column):
+                local[i] = from_ticks(t)
+                remember(world, local[i])
+    return local
+
+
+def parse_time_strings(texts: Iterable[str]) -> list[Optional[GameTime]]:
+    """
+    Bulk parser for legacy "Day D, HH:MM:SS" strings (and "N/A" for no time).
+    Each distinct string is parsed once; repeated values share one interned
+    GameTime, which is safe because GameTime is immutable.
+
+    Args:
+        texts: Legacy time strings
+
+    Raises:
+        ValueError: If a string is neither "N/A" nor a valid time
+
+    Returns:
+        list[Optional[GameTime]]: Parsed times, None where the string was "N/A"
+    """
+    interned: dict[str, Optional[GameTime]] = {NO_END_TIME: None, "": None}
+    from_ticks = GameTime.from_ticks
+    result = []
+
+    for text in texts:
+        try:
+            result.append(interned[text])
+            continue
+        except KeyError:
+            pass
+
+        # Fast path for the exact format GameTime produces
+        day, sep, clock = text.partition(", ")
+        if sep and day.startswith("Day ") and len(clock) == 8 and clock[2] == ":" and clock[5] == ":":
+            try:
+                parsed = from_ticks(int(day[4:]) * SECONDS_PER_DAY + int(clock[0:2]) * SECONDS_PER_HOUR
+                                    + int(clock[3:5]) * SECONDS_PER_MINUTE + int(clock[6:8]))
+            except ValueError:
+                parsed = GameTime.from_fulltime(text)
+        else:
+            parsed = GameTime.from_fulltime(text)
+
+        interned[text] = parsed
+        result.append(parsed)
+
+    return result
 
 
 def format_time_range(start_time: GameTime, end_time: GameTime = None) -> str:
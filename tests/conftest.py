@@ -0,0 +1,34 @@
+import os
+import sys
+
+import pytest
+
+# The packages live under src/ and are imported as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from core import GameTime
+from models import Realm, User, User_Settings, Character, default_catalog
+
+
+@pytest.fixture
+def realms():
+    return {
+        "Central": Realm(name="Central", map_id=1, time_rule=0, selected_user=None, desc="Middle of the map"),
+        "East": Realm(name="East", map_id=2, time_rule=90, selected_user=None, desc="Ninety minutes ahead"),
+    }
+
+
+@pytest.fixture
+def user(realms):
+    """
+    A user with one character holding two stacks and one campaign with two quests
+    """
+    u = User("alice", 0, User_Settings(current_realm=realms["Central"]))
+    hero = Character("Hero", "Warrior", 3)
+    hero.curr_inventory.add_inventory(default_catalog.get("Sword", "Rare", 12, "Sharp"), 2)
+    hero.curr_inventory.add_inventory(default_catalog.get("Potion", "Common", 0), 5)
+    u.add_character(hero)
+    campaign = u.create_camp("Saga", True, GameTime(1), realms["Central"], "Day", [], [], [])
+    campaign.create_quest("Dawn Raid", GameTime(1, 6), realms["Central"])
+    campaign.create_quest("Long March", GameTime(2), realms["East"], end_time=GameTime(3, 12))
+    return u
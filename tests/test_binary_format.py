@@ -0,0 +1,64 @@
+import pytest
+
+from core import GameTime
+from storage import dumps, loads
+
+
+def test_round_trip_keeps_ids_and_values(user, realms):
+    campaign = user.campaigns[0]
+    campaign.db_id = 40
+    user.characters[0].db_id = 41
+    for n, quest in enumerate(campaign.quests, 42):
+        quest.db_id = n
+
+    users, loaded_realms = loads(dumps([user], realms))
+    (loaded,) = users
+    assert loaded_realms.keys() == realms.keys()
+    assert loaded.user_settings.current_realm is loaded_realms["Central"]
+
+    hero = loaded.characters[0]
+    assert (hero.name, hero.level, hero.db_id) == ("Hero", 3, 41)
+    assert hero.curr_inventory == user.characters[0].curr_inventory
+
+    loaded_campaign = loaded.campaigns[0]
+    assert loaded_campaign.db_id == 40
+    assert [(q.quest_id, q.db_id, q.name, q.time, q.end) for q in loaded_campaign.quests] == \
+        [(q.quest_id, q.db_id, q.name, q.time, q.end) for q in campaign.quests]
+    assert list(loaded_campaign.quests)[1].c_realm is loaded_realms["East"]
+
+
+def test_missing_ids_stay_missing(user, realms):
+    quest = user.campaigns[0].create_quest("Loose", GameTime(5), realms["Central"])
+    quest.quest_id = None
+
+    (loaded,), _ = loads(dumps([user], realms))
+    loaded_campaign = loaded.campaigns[0]
+    assert loaded_campaign.db_id is None
+    assert loaded.characters[0].db_id is None
+    assert all(q.db_id is None for q in loaded_campaign.quests)
+    assert list(loaded_campaign.quests)[-1].name == "Loose"
+
+
+def test_shared_members_decode_to_one_object(user, realms):
+    from models import User, User_Settings
+    bob = User("bob", 0, User_Settings())
+    user.campaigns[0].add_edit_user(bob)
+
+    users, _ = loads(dumps([user, bob], realms))
+    assert users[0].campaigns[0].edit_users[0] is users[1]
+
+
+def test_truncated_input_raises_value_error(user, realms):
+    data = dumps([user], realms)
+    for end in range(len(data)):
+        with pytest.raises(ValueError):
+            loads(data[:end])
+
+
+def test_bad_magic_and_version_raise_value_error(user, realms):
+    data = bytearray(dumps([user], realms))
+    with pytest.raises(ValueError):
+        loads(b"XXXX" + bytes(data[4:]))
+    data[4] = 0xFF
+    with pytest.raises(ValueError):
+        loads(bytes(data))
@@ -0,0 +1,80 @@
+from core import GameTime
+from models import ChangeTracker, default_catalog
+from models.changes import ADDED, REMOVED, UPDATED
+
+
+def watched(user):
+    tracker = ChangeTracker()
+    changes = []
+    tracker.add_listener(changes.append)
+    tracker.watch_user(user)
+    return tracker, changes
+
+
+def test_models_are_silent_until_watched(user):
+    campaign = user.campaigns[0]
+    campaign.rename("Before")
+    tracker, changes = watched(user)
+    assert not tracker.is_dirty()
+    assert changes == []
+
+
+def test_update_marks_fields_and_notifies(user):
+    tracker, changes = watched(user)
+    campaign = user.campaigns[0]
+    campaign.rename("Epic")
+
+    assert tracker.dirty_fields(campaign) == {"title"}
+    assert tracker.dirty_entities() == [campaign]
+    assert changes[-1].kind == UPDATED
+    assert changes[-1].owner is user
+
+
+def test_added_and_removed_quests(user, realms):
+    tracker, changes = watched(user)
+    campaign = user.campaigns[0]
+    quest = campaign.create_quest("New", GameTime(4), realms["Central"])
+
+    assert changes[-1].kind == ADDED and changes[-1].entity is quest
+    assert tracker.owner_of(quest) is campaign
+    assert tracker.is_dirty(quest) and tracker.dirty_fields(quest) == frozenset()
+    assert tracker.dirty_fields(campaign) == {"quests"}
+
+    campaign.delete_quest(quest.quest_id)
+    assert changes[-1].kind == REMOVED
+    assert not tracker.is_watched(quest)
+    assert not tracker.is_dirty(quest)
+
+
+def test_inventory_changes_are_owned_by_the_character(user):
+    tracker, changes = watched(user)
+    hero = user.characters[0]
+    hero.curr_inventory.add_inventory(default_catalog.get("Potion", "Common", 0))
+
+    assert tracker.dirty_fields(hero.curr_inventory) == {"items"}
+    assert changes[-1].owner is hero
+
+
+def test_mark_clean_one_entity_or_all(user):
+    tracker, _ = watched(user)
+    campaign = user.campaigns[0]
+    hero = user.characters[0]
+    campaign.rename("Epic")
+    hero.update_character(level=9)
+
+    tracker.mark_clean(campaign)
+    assert tracker.dirty_entities() == [hero]
+    tracker.mark_clean()
+    assert not tracker.is_dirty()
+
+
+def test_unwatch_cascades_to_owned_models(user):
+    tracker, _ = watched(user)
+    campaign = user.campaigns[0]
+    quests = list(campaign.quests)
+    tracker.unwatch(user)
+
+    assert not tracker.is_watched(campaign)
+    assert not any(tracker.is_watched(q) for q in quests)
+    campaign.rename("Quiet")
+    assert not tracker.is_dirty()
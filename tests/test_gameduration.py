@@ -0,0 +1,37 @@
+import copy
+import pickle
+
+import pytest
+
+from core import GameDuration, GameTime
+
+
+def test_attributes_cannot_be_set():
+    d = GameDuration(hours=2)
+    with pytest.raises(AttributeError):
+        d._ticks = 5
+    with pytest.raises(AttributeError):
+        del d._ticks
+    assert d.ticks == 7200
+
+
+def test_copy_and_pickle_keep_the_tick_count():
+    d = GameDuration(1, 2, 3, 4)
+    for clone in (copy.copy(d), copy.deepcopy(d), pickle.loads(pickle.dumps(d))):
+        assert clone == d
+        assert hash(clone) == hash(d)
+
+
+def test_arithmetic_with_game_time():
+    start = GameTime(1, 23)
+    d = GameDuration(hours=2, minutes=30)
+    assert start + d == GameTime(2, 1, 30)
+    assert (start + d) - start == d
+    assert start - d == GameTime(1, 20, 30)
+    assert -d * 2 == GameDuration(hours=-5)
+
+
+def test_total_minutes_truncates_toward_zero():
+    assert GameDuration(seconds=-61).total_minutes() == -1
+    assert GameDuration(seconds=119).total_minutes() == 1
+    assert GameDuration(seconds=-61).get_fulltime() == "-0d 00:01:01"
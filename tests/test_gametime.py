@@ -0,0 +1,35 @@
+import copy
+import pickle
+
+import pytest
+
+from core import GameTime
+
+
+def test_attributes_cannot_be_set():
+    t = GameTime(1, 2, 3, 4)
+    with pytest.raises(AttributeError):
+        t._ticks = 0
+    with pytest.raises(AttributeError):
+        del t._ticks
+    assert t.get_fulltime() == "Day 1, 02:03:04"
+
+
+def test_copy_and_pickle_keep_the_tick_count():
+    t = GameTime(3, 4, 5, 6)
+    for clone in (copy.copy(t), copy.deepcopy(t), pickle.loads(pickle.dumps(t))):
+        assert clone == t
+        assert clone.ticks == t.ticks
+        assert hash(clone) == hash(t)
+
+
+def test_from_fulltime_round_trips():
+    t = GameTime(12, 23, 59, 1)
+    assert GameTime.from_fulltime(t.get_fulltime()) == t
+
+
+def test_total_minutes_rounds_toward_minus_infinity():
+    assert GameTime.from_ticks(-1).to_total_minutes() == -1
+    assert GameTime.from_ticks(-60).to_total_minutes() == -1
+    assert GameTime.from_ticks(-61).to_total_minutes() == -2
+    assert GameTime(0, 1, 30).to_total_minutes() == 90
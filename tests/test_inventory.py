@@ -0,0 +1,63 @@
+import pytest
+
+from models import Inventory, default_catalog
+
+SWORD = default_catalog.get("Sword", "Rare", 12, "Sharp")
+AXE = default_catalog.get("Axe", "Rare", 18)
+POTION = default_catalog.get("Potion", "Common", 0)
+BOW = default_catalog.get("Bow", "Epic", 35)
+
+
+def make_inventory():
+    inv = Inventory()
+    inv.add_inventory(SWORD, 2)
+    inv.add_inventory(AXE)
+    inv.add_inventory(POTION, 5)
+    inv.add_inventory(BOW)
+    return inv
+
+
+def test_stacks_and_counts():
+    inv = make_inventory()
+    assert inv.stacks() == [(SWORD, 2), (AXE, 1), (POTION, 5), (BOW, 1)]
+    assert inv.count(POTION) == 5
+    assert len(inv) == 9
+    assert SWORD in inv
+
+
+def test_rarity_and_damage_indexes():
+    inv = make_inventory()
+    assert inv.items_by_rarity("Rare") == [SWORD, AXE]
+    assert inv.items_by_rarity("Legendary") == []
+    # Bands are DAMAGE_BAND_SIZE wide; the ends of the range are inclusive
+    assert inv.items_in_damage_range(12, 18) == [SWORD, AXE]
+    assert inv.items_in_damage_range(13, 40) == [AXE, BOW]
+    assert inv.items_in_damage_range(0, 0) == [POTION]
+
+
+def test_aggregates_follow_adds_and_removes():
+    inv = make_inventory()
+    assert inv.total_damage() == 2 * 12 + 18 + 35
+    assert inv.rarity_counts() == {"Rare": 3, "Common": 5, "Epic": 1}
+
+    inv.remove_inventory(SWORD)
+    inv.remove_inventory(BOW)
+    inv.remove_inventory(POTION, 99)  # capped at the number held
+    assert inv.total_damage() == 12 + 18
+    assert inv.rarity_counts() == {"Rare": 2}
+    assert len(inv) == 2
+    assert inv.items_by_rarity("Epic") == []
+    assert inv.items_in_damage_range(0, 100) == [SWORD, AXE]
+
+
+def test_non_positive_counts():
+    inv = make_inventory()
+    with pytest.raises(ValueError):
+        inv.add_inventory(SWORD, 0)
+    with pytest.raises(ValueError):
+        inv.add_inventory(SWORD, -1)
+    with pytest.raises(ValueError):
+        inv.remove_inventory(SWORD, 0)
+    with pytest.raises(ValueError):
+        inv.remove_inventory(default_catalog.get("Shield", "Common", 1))
+    assert inv.count(SWORD) == 2
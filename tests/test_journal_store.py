@@ -0,0 +1,124 @@
+import os
+
+from core import GameTime
+from storage import JournalStore
+from storage.journal_store import JOURNAL_FILE, SNAPSHOT_FILE
+from models import default_catalog
+
+
+def journal_size(path):
+    return os.path.getsize(os.path.join(path, JOURNAL_FILE))
+
+
+def save(store, user, realms):
+    store.save_realms(realms)
+    store.save_user(user)
+
+
+def test_replay_without_snapshot(tmp_path, user, realms):
+    path = str(tmp_path / "gq.journal")
+    store = JournalStore(path)
+    save(store, user, realms)
+    # Simulates a crash: the journal is flushed but never snapshotted
+    store._journal.close()
+    assert not os.path.exists(os.path.join(path, SNAPSHOT_FILE))
+
+    reopened = JournalStore(path)
+    assert reopened.replayed > 0
+    loaded = reopened.load_user("alice")
+    assert loaded.characters[0].curr_inventory == user.characters[0].curr_inventory
+    assert [q.name for q in loaded.campaigns[0].quests] == ["Dawn Raid", "Long March"]
+    assert list(loaded.campaigns[0].quests)[1].end == GameTime(3, 12)
+    assert reopened.load_realms()["East"].time_rule == 90
+    reopened.close()
+
+
+def test_snapshot_reload_replays_nothing(tmp_path, user, realms):
+    path = str(tmp_path / "gq.journal")
+    store = JournalStore(path)
+    save(store, user, realms)
+    store.close()
+    assert journal_size(path) == 0
+
+    reopened = JournalStore(path)
+    assert reopened.replayed == 0
+    loaded = reopened.load_user("alice")
+    assert loaded.campaigns[0].title == "Saga"
+    assert loaded.characters[0].db_id == user.characters[0].db_id
+    reopened.close()
+
+
+def test_unchanged_save_appends_nothing(tmp_path, user, realms):
+    path = str(tmp_path / "gq.journal")
+    store = JournalStore(path)
+    save(store, user, realms)
+    store._journal.flush()
+    size = journal_size(path)
+
+    save(store, user, realms)
+    store._journal.flush()
+    assert journal_size(path) == size
+    store.close()
+
+
+def test_later_changes_replay_over_the_snapshot(tmp_path, user, realms):
+    path = str(tmp_path / "gq.journal")
+    store = JournalStore(path)
+    save(store, user, realms)
+    store.snapshot()
+
+    campaign = user.campaigns[0]
+    campaign.rename("Saga II")
+    hero = user.characters[0]
+    hero.curr_inventory.remove_inventory(default_catalog.get("Potion", "Common", 0), 5)
+    store.save_user(user)
+    quest = campaign.create_quest("Epilogue", GameTime(9), realms["Central"])
+    store.save_quest(campaign, quest)
+    store.delete_quest(campaign, campaign.delete_quest(1))
+    store._journal.close()
+
+    reopened = JournalStore(path)
+    assert reopened.replayed > 0
+    loaded = reopened.load_user("alice")
+    assert loaded.campaigns[0].title == "Saga II"
+    assert [q.name for q in loaded.campaigns[0].quests] == ["Long March", "Epilogue"]
+    assert loaded.characters[0].curr_inventory.stacks() == [(default_catalog.get("Sword", "Rare", 12, "Sharp"), 2)]
+    reopened.close()
+
+
+def test_deleted_campaign_stays_deleted(tmp_path, user, realms):
+    path = str(tmp_path / "gq.journal")
+    store = JournalStore(path)
+    save(store, user, realms)
+    user.delete_camp(0)
+    store.save_user(user)
+    store.close()
+
+    reopened = JournalStore(path)
+    assert reopened.load_user("alice").campaigns == []
+    reopened.close()
+
+
+def test_loaded_quests_go_on_the_scheduler_heap(tmp_path, user, realms):
+    from core import QuestScheduler
+    path = str(tmp_path / "gq.journal")
+    store = JournalStore(path)
+    save(store, user, realms)
+    store.close()
+
+    reopened = JournalStore(path)
+    campaign = reopened.load_user("alice").campaigns[0]
+    assert campaign.is_loaded()
+
+    scheduler = QuestScheduler()
+    scheduler.schedule_campaign(campaign)
+    heap_quests = {id(entry[3]) for entry in scheduler._heap if entry[3] is not None}
+    assert heap_quests == {id(q) for q in campaign.quests}
+    assert len(scheduler) == 3  # two starts and one end
+    assert scheduler.next_event_time() == GameTime(1, 6)
+
+    fired = []
+    scheduler.add_listener(lambda kind, quest, c, when: fired.append((kind, quest.name)))
+    scheduler.run_until(GameTime(4).ticks)
+    assert fired == [("start", "Dawn Raid"), ("start", "Long March"), ("end", "Long March")]
+    reopened.close()
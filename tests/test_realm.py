@@ -0,0 +1,58 @@
+from dataclasses import fields
+
+from core import GameTime
+from models import Realm
+from models.realm import LOCAL_TIME_CACHE_SIZE
+
+
+def make_realm(time_rule=90):
+    return Realm(name="East", map_id=2, time_rule=time_rule, selected_user=None)
+
+
+def test_time_rule_is_a_dataclass_field():
+    realm = make_realm()
+    assert "_time_rule" in {f.name for f in fields(realm)}
+    assert "_time_rule=90" in repr(realm)
+    assert realm != make_realm(30)
+
+
+def test_changing_the_time_rule_drops_the_memo():
+    realm = make_realm()
+    assert realm.local_time(GameTime(1)) == GameTime(1, 1, 30)
+
+    realm.change_time_rule(-30)
+    assert realm.get_cache_stats()["size"] == 0
+    assert realm.local_time(GameTime(1)) == GameTime(0, 23, 30)
+
+    realm.time_rule = 0
+    assert realm.local_time(GameTime(1)) == GameTime(1)
+
+
+def test_memo_evicts_the_least_recently_used_time():
+    realm = make_realm()
+    for tick in range(LOCAL_TIME_CACHE_SIZE):
+        realm.local_time(GameTime.from_ticks(tick))
+    # Touch the oldest entry, then overflow by one
+    realm.local_time(GameTime.from_ticks(0))
+    realm.local_time(GameTime.from_ticks(LOCAL_TIME_CACHE_SIZE))
+
+    assert realm.cached_local_time(0) is not None
+    assert realm.cached_local_time(1) is None
+    assert realm.get_cache_stats()["size"] == LOCAL_TIME_CACHE_SIZE
+
+
+def test_quests_without_a_known_campaign_are_hidden_from_viewers(user, realms):
+    from models import RealmRegistry, User, User_Settings
+    registry = RealmRegistry(realms)
+    campaign = user.campaigns[0]
+    bob = User("bob", 0, User_Settings())
+    campaign.add_permitted_user(bob)
+    registry.add_campaign(campaign)
+    stray = next(iter(campaign.quests))
+    registry.on_quest_realm(stray, stray.c_realm, None)
+    registry.on_quest_realm(stray, None, stray.c_realm)
+
+    assert stray in registry.quests_in(realms["Central"])
+    assert registry.quests_in(realms["Central"], bob) == []
+    assert registry.quest_count_in(realms["Central"], bob) == 0
+    assert registry.quest_count_in(realms["East"], bob) == 1
@@ -0,0 +1,151 @@
+from core import GameTime, QuestScheduler
+from models import Quest_Event, Realm
+
+REALM = Realm(name="Central", map_id=1, time_rule=0, selected_user=None)
+
+
+def make_scheduler(*quests):
+    scheduler = QuestScheduler()
+    fired = []
+    scheduler.add_listener(lambda kind, quest, campaign, when: fired.append((kind, quest.name, when.ticks)))
+    for quest in quests:
+        scheduler.schedule_quest(quest)
+    return scheduler, fired
+
+
+def test_instants_fire_in_time_order():
+    a = Quest_Event("a", REALM, GameTime(0, 2), GameTime(0, 5))
+    b = Quest_Event("b", REALM, GameTime(0, 1))
+    scheduler, fired = make_scheduler(a, b)
+
+    assert scheduler.run_until(GameTime(0, 3).ticks) == 2
+    assert fired == [("start", "b", GameTime(0, 1).ticks), ("start", "a", GameTime(0, 2).ticks)]
+    assert scheduler.next_event_time() == GameTime(0, 5)
+
+
+def test_rewind_rearms_instants_that_already_fired():
+    a = Quest_Event("a", REALM, GameTime(0, 2), GameTime(0, 5))
+    scheduler, fired = make_scheduler(a)
+
+    scheduler.run_until(GameTime(1).ticks)
+    assert [kind for kind, _, _ in fired] == ["start", "end"]
+    assert len(scheduler) == 0
+
+    assert scheduler.run_until(GameTime(0, 1).ticks) == 0
+    assert len(scheduler) == 2
+    fired.clear()
+    assert scheduler.run_until(GameTime(1).ticks) == 2
+    assert [kind for kind, _, _ in fired] == ["start", "end"]
+
+
+def test_rewind_arms_instants_skipped_when_scheduled():
+    scheduler, fired = make_scheduler()
+    scheduler.run_until(GameTime(2).ticks)
+    # Already behind the clock, so nothing is pending yet
+    scheduler.schedule_quest(Quest_Event("late", REALM, GameTime(1)))
+    assert len(scheduler) == 0
+
+    scheduler.run_until(0)
+    scheduler.run_until(GameTime(2).ticks)
+    assert fired == [("start", "late", GameTime(1).ticks)]
+
+
+def test_unscheduled_quests_stay_cancelled_after_rewind():
+    a = Quest_Event("a", REALM, GameTime(0, 2))
+    scheduler, fired = make_scheduler(a)
+    scheduler.run_until(GameTime(1).ticks)
+    scheduler.unschedule_quest(a)
+
+    scheduler.run_until(0)
+    scheduler.run_until(GameTime(1).ticks)
+    assert fired == [("start", "a", GameTime(0, 2).ticks)]
+
+
+def test_quest_starting_now_fires_on_the_next_run():
+    scheduler, fired = make_scheduler()
+    scheduler.run_until(GameTime(1).ticks)
+    scheduler.schedule_quest(Quest_Event("now", REALM, GameTime(1)))
+    assert len(scheduler) == 1
+
+    assert scheduler.run_until(GameTime(1).ticks) == 1
+    assert fired == [("start", "now", GameTime(1).ticks)]
+    assert scheduler.run_until(GameTime(2).ticks) == 0
+
+
+def make_deferred_campaign(*quests):
+    """
+    A campaign whose quests load on first access, like one read from SQLiteStore
+    """
+    from models import Campaign
+    campaign = Campaign("Deferred", True, GameTime(0), REALM, "Day")
+    loads = []
+
+    def loader(c):
+        loads.append(c)
+        return list(quests)
+    instants = [t.ticks for q in quests for t in (q.time, q.end) if t is not None]
+    campaign.set_quest_loader(loader, len(quests), (min(instants), max(instants)))
+    return campaign, loads
+
+
+def test_deferred_campaign_loads_when_the_clock_reaches_it():
+    a = Quest_Event("a", REALM, GameTime(1), GameTime(2))
+    campaign, loads = make_deferred_campaign(a)
+    scheduler, fired = make_scheduler()
+    scheduler.schedule_campaign(campaign)
+
+    assert not campaign.is_loaded()
+    assert scheduler.next_event_time() == GameTime(1)
+    scheduler.run_until(GameTime(0, 12).ticks)
+    assert loads == []
+
+    assert scheduler.run_until(GameTime(3).ticks) == 2
+    assert len(loads) == 1
+    assert fired == [("start", "a", GameTime(1).ticks), ("end", "a", GameTime(2).ticks)]
+
+
+def test_deferred_campaign_opened_early_is_scheduled_quest_by_quest():
+    a = Quest_Event("a", REALM, GameTime(1))
+    campaign, _ = make_deferred_campaign(a)
+    scheduler, fired = make_scheduler()
+    scheduler.schedule_campaign(campaign)
+
+    list(campaign.quests)
+    assert len(scheduler) == 1
+    scheduler.run_until(GameTime(2).ticks)
+    assert fired == [("start", "a", GameTime(1).ticks)]
+
+
+def test_deferred_campaign_straddling_the_clock_loads_at_once():
+    a = Quest_Event("a", REALM, GameTime(1), GameTime(3))
+    campaign, loads = make_deferred_campaign(a)
+    scheduler, fired = make_scheduler()
+    scheduler.run_until(GameTime(2).ticks)
+    scheduler.schedule_campaign(campaign)
+
+    assert len(loads) == 1
+    scheduler.run_until(GameTime(4).ticks)
+    assert fired == [("end", "a", GameTime(3).ticks)]
+
+
+def test_finished_deferred_campaign_waits_for_a_rewind():
+    a = Quest_Event("a", REALM, GameTime(1))
+    campaign, loads = make_deferred_campaign(a)
+    scheduler, fired = make_scheduler()
+    scheduler.run_until(GameTime(2).ticks)
+    scheduler.schedule_campaign(campaign)
+    assert loads == [] and len(scheduler) == 0
+
+    scheduler.run_until(0)
+    scheduler.run_until(GameTime(2).ticks)
+    assert fired == [("start", "a", GameTime(1).ticks)]
+
+
+def test_unscheduling_a_deferred_campaign_keeps_it_unloaded():
+    campaign, loads = make_deferred_campaign(Quest_Event("a", REALM, GameTime(1)))
+    scheduler, fired = make_scheduler()
+    scheduler.schedule_campaign(campaign)
+    scheduler.unschedule_campaign(campaign)
+
+    scheduler.run_until(GameTime(2).ticks)
+    assert loads == [] and fired == []
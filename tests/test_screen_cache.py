@@ -0,0 +1,70 @@
+from gui.screen_cache import ScreenCache
+
+
+class FakeScreen:
+    """
+    Stands in for a BaseScreen; the cache only ever calls destroy()
+    """
+    def __init__(self, name, stale=False):
+        self.name = name
+        self.stale = stale
+        self.destroyed = False
+
+    def destroy(self):
+        self.destroyed = True
+
+
+def test_hits_and_misses():
+    cache = ScreenCache(2)
+    assert cache.get("menu") is None
+    menu = FakeScreen("menu")
+    cache.put("menu", menu)
+    assert cache.get("menu") is menu
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_least_recently_shown_screen_is_evicted():
+    cache = ScreenCache(2)
+    menu, campaign, character = FakeScreen("menu"), FakeScreen("campaign"), FakeScreen("character")
+    cache.put("menu", menu)
+    cache.put("campaign", campaign)
+    cache.get("menu")
+    cache.put("character", character)
+
+    assert "campaign" not in cache and campaign.destroyed
+    assert cache.get_stats()["screens"] == ["menu", "character"]
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_replacing_a_screen_destroys_the_old_one():
+    cache = ScreenCache(2)
+    old, new = FakeScreen("menu"), FakeScreen("menu")
+    cache.put("menu", old)
+    cache.put("menu", new)
+    assert old.destroyed and not new.destroyed
+    assert cache["menu"] is new
+
+
+def test_invalidate_where_keeps_the_screen_in_view():
+    cache = ScreenCache(4)
+    screens = {name: FakeScreen(name, stale=True) for name in ("menu", "campaign", "character")}
+    screens["character"].stale = False
+    for name, screen in screens.items():
+        cache.put(name, screen)
+
+    dropped = cache.invalidate_where(lambda s: s.stale, keep="campaign")
+    assert dropped == ["menu"]
+    assert screens["menu"].destroyed
+    assert not screens["campaign"].destroyed
+    assert cache.get_stats()["screens"] == ["campaign", "character"]
+
+
+def test_clear_keeps_named_screens():
+    cache = ScreenCache(4)
+    login, menu = FakeScreen("login"), FakeScreen("menu")
+    cache.put("login", login)
+    cache.put("menu", menu)
+    cache.clear(keep=("login",))
+    assert "login" in cache and "menu" not in cache
+    assert menu.destroyed and not login.destroyed
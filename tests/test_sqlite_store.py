@@ -0,0 +1,135 @@
+import pytest
+
+from core import GameTime
+from storage import SQLiteStore
+
+
+def saved_store(path, user, realms):
+    store = SQLiteStore(path)
+    store.save_realms(realms)
+    store.save_user(user)
+    store.save_quests(user.campaigns[0], list(user.campaigns[0].quests))
+    return store
+
+
+def writes(store, action):
+    """
+    Runs an action and returns the INSERT, UPDATE and DELETE statements it issued
+    """
+    issued = []
+    store.conn.set_trace_callback(issued.append)
+    try:
+        action()
+    finally:
+        store.conn.set_trace_callback(None)
+    return [s for s in issued if s.split(None, 1)[0].upper() in ("INSERT", "UPDATE", "DELETE")]
+
+
+def test_round_trip(tmp_path, user, realms):
+    path = str(tmp_path / "gq.db")
+    saved_store(path, user, realms).close()
+
+    store = SQLiteStore(path)
+    loaded = store.load_user("alice")
+    assert loaded.user_settings.current_realm.name == "Central"
+    hero = loaded.characters[0]
+    assert (hero.name, hero.character_class, hero.level) == ("Hero", "Warrior", 3)
+    assert hero.curr_inventory == user.characters[0].curr_inventory
+
+    campaign = loaded.campaigns[0]
+    assert not campaign.is_loaded()
+    assert campaign.get_quest_count() == 2
+    assert [(q.quest_id, q.name, q.time, q.end) for q in campaign.quests] == \
+        [(q.quest_id, q.name, q.time, q.end) for q in user.campaigns[0].quests]
+    assert store.load_user("alice") is loaded
+    store.close()
+
+
+def test_unchanged_save_writes_nothing(user, realms):
+    store = saved_store(":memory:", user, realms)
+    assert writes(store, lambda: store.save_user(user)) == []
+
+
+def test_save_writes_only_changed_rows(user, realms):
+    store = saved_store(":memory:", user, realms)
+    user.campaigns[0].rename("Saga II")
+    from models import default_catalog
+    user.characters[0].curr_inventory.add_inventory(default_catalog.get("Potion", "Common", 0))
+
+    issued = writes(store, lambda: store.save_user(user))
+    assert len(issued) == 2
+    assert issued[0].startswith("UPDATE campaigns")
+    assert issued[1].startswith("UPDATE inventory")
+
+
+def test_members_are_stubs_until_loaded(tmp_path, user, realms):
+    from models import User, User_Settings
+    path = str(tmp_path / "gq.db")
+    bob = User("bob", 0, User_Settings())
+    user.campaigns[0].add_permitted_user(bob)
+    store = saved_store(path, user, realms)
+    store.save_user(bob)
+    store.close()
+
+    store = SQLiteStore(path)
+    alice = store.load_user("alice")
+    stub = alice.campaigns[0].permitted_users[0]
+    with pytest.raises(ValueError):
+        store.save_user(stub)
+    assert store.shared_campaign_owners("bob") == ["alice"]
+    assert store.load_user("bob") is stub
+    store.close()
+
+
+def test_loaded_campaigns_schedule_without_loading_quests(tmp_path, user, realms):
+    from core import QuestScheduler
+    path = str(tmp_path / "gq.db")
+    saved_store(path, user, realms).close()
+
+    store = SQLiteStore(path)
+    campaign = store.load_user("alice").campaigns[0]
+    assert campaign.quest_span() == (GameTime(1, 6).ticks, GameTime(3, 12).ticks)
+
+    scheduler = QuestScheduler()
+    fired = []
+    scheduler.add_listener(lambda kind, quest, c, when: fired.append((kind, quest.name)))
+    scheduler.schedule_campaign(campaign)
+    assert not campaign.is_loaded()
+
+    scheduler.run_until(GameTime(4).ticks)
+    assert campaign.is_loaded()
+    assert fired == [("start", "Dawn Raid"), ("start", "Long March"), ("end", "Long March")]
+    store.close()
+
+
+def test_registry_counts_quests_before_they_load(tmp_path, user, realms):
+    from models import RealmRegistry, User, User_Settings
+    path = str(tmp_path / "gq.db")
+    bob = User("bob", 0, User_Settings())
+    user.campaigns[0].add_permitted_user(bob)
+    store = saved_store(path, user, realms)
+    store.save_user(bob)
+    store.close()
+
+    store = SQLiteStore(path)
+    bob = store.load_user("bob")
+    alice = store.load_user("alice")
+    registry = RealmRegistry(store.load_realms())
+    campaign = alice.campaigns[0]
+    registry.add_campaign(campaign)
+    central, east = registry["Central"], registry["East"]
+
+    assert registry.quest_count_in(central, bob) == 1
+    assert registry.quest_count_in(east, bob) == 1
+    assert registry.quests_in(east, bob) == []
+    assert registry.quest_count_in(east, alice) == 0
+    assert not campaign.is_loaded()
+
+    campaign.quests
+    assert registry.quest_count_in(east, bob) == 1
+    assert [q.name for q in registry.quests_in(east, bob)] == ["Long March"]
+
+    campaign.delete_camp()
+    assert registry.quest_count_in(central) == 0
+    assert registry.quest_count_in(east) == 0
+    store.close()
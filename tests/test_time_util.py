@@ -0,0 +1,32 @@
+from core import GameTime
+from models import Quest_Event, Realm
+from utils import convert_to_realm_time, localize_quests
+
+
+def make_realms():
+    return (Realm(name="Central", map_id=1, time_rule=0, selected_user=None),
+            Realm(name="East", map_id=2, time_rule=90, selected_user=None),
+            Realm(name="West", map_id=3, time_rule=-600, selected_user=None))
+
+
+def test_localize_quests_matches_single_conversions():
+    central, east, west = make_realms()
+    quests = [Quest_Event(f"q{i}", realm, GameTime(0, i * 3))
+              for i, realm in enumerate((central, east, west, east, west, central))]
+
+    local = localize_quests(quests)
+    fresh = make_realms()
+    by_id = {r.map_id: r for r in fresh}
+    assert local == [convert_to_realm_time(q.time, by_id[q.c_realm.map_id]) for q in quests]
+    # Clamped at Day 0, like the single conversion
+    assert local[2] == GameTime(0)
+
+
+def test_localize_quests_memoizes_into_the_realm():
+    _, east, _ = make_realms()
+    quests = [Quest_Event("a", east, GameTime(1)), Quest_Event("b", east, GameTime(2))]
+    localize_quests(quests)
+
+    misses = east.cache_misses
+    assert convert_to_realm_time(GameTime(2), east) == GameTime(2, 1, 30)
+    assert east.cache_misses == misses